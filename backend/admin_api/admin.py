@@ -1,3 +1,10 @@
 from django.contrib import admin
+from .models import ModerationLog
 
-# Register your models here.
+
+@admin.register(ModerationLog)
+class ModerationLogAdmin(admin.ModelAdmin):
+    list_display = ('article', 'action', 'previous_status', 'new_status', 'moderator', 'created_at')
+    list_filter = ('action', 'new_status', 'created_at')
+    raw_id_fields = ('article', 'moderator')
+    ordering = ('-created_at',)
@@ -1,3 +1,26 @@
 from django.db import models
 
-# Create your models here.
+from articles.models import Article
+from users.models import User
+
+
+class ModerationLog(models.Model):
+    """One row per article changed by a moderation action."""
+    article = models.ForeignKey(
+        Article, on_delete=models.SET_NULL, null=True, related_name='moderation_log')
+    moderator = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, related_name='moderation_actions')
+    action = models.CharField(max_length=20)
+    previous_status = models.CharField(max_length=20)
+    new_status = models.CharField(max_length=20)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'moderation_log'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['article', '-created_at'], name='moderation_log_article_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.action} on {self.article_id}: {self.previous_status} -> {self.new_status}'
@@ -0,0 +1,150 @@
+from django.db import transaction
+from django.db.models import Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from articles.models import Article, RelatedArticle
+from core.async_views import invalidate_cached_reads
+from users.models import AuthorStats
+from .models import ModerationLog
+
+# Action name -> status it moves articles to.
+MODERATION_ACTIONS = {
+    'approve': 'published',
+    'reject': 'rejected',
+}
+# Articles locked and updated per transaction.
+CHUNK_SIZE = 500
+# Up to this many changed articles, related-article lists are updated in
+# place; larger runs leave new neighbors to rebuild_related_articles.
+RELATED_SYNC_LIMIT = 100
+FILTER_FIELDS = {'status', 'author', 'category', 'tag', 'created_after', 'created_before'}
+
+
+def filtered_articles(filters):
+    """
+    Articles matching a filter expression such as
+    ``{"status": "pending", "author": 3, "created_before": "2026-01-01T00:00:00Z"}``.
+    Raises ValueError for unknown keys or unparsable values.
+    """
+    if not isinstance(filters, dict) or not filters:
+        raise ValueError('filter must be a non-empty object')
+    unknown = set(filters) - FILTER_FIELDS
+    if unknown:
+        raise ValueError(f'Unknown filter fields: {", ".join(sorted(unknown))}')
+
+    queryset = Article.objects.all()
+    if 'status' in filters:
+        queryset = queryset.filter(status=filters['status'])
+    if 'author' in filters:
+        queryset = queryset.filter(author_id=int(filters['author']))
+    for name, relation in (('category', 'categories'), ('tag', 'tags')):
+        value = str(filters.get(name, ''))
+        if value:
+            lookup = 'id' if value.isdigit() else 'slug'
+            queryset = queryset.filter(**{f'{relation}__{lookup}': value})
+    for name, lookup in (('created_after', 'gte'), ('created_before', 'lt')):
+        if name in filters:
+            moment = parse_datetime(str(filters[name]))
+            if moment is None:
+                raise ValueError(f'{name} must be an ISO 8601 datetime')
+            queryset = queryset.filter(**{f'created_at__{lookup}': moment})
+    return queryset.distinct()
+
+
+def _id_chunks(article_ids, filters, chunk_size):
+    if article_ids is not None:
+        for start in range(0, len(article_ids), chunk_size):
+            yield article_ids[start:start + chunk_size]
+        return
+    # Keyset pagination, so every chunk is an index range however far along we are.
+    queryset = filtered_articles(filters).order_by('id').values_list('id', flat=True)
+    last_id = 0
+    while True:
+        chunk = list(queryset.filter(id__gt=last_id)[:chunk_size])
+        if not chunk:
+            return
+        yield chunk
+        last_id = chunk[-1]
+
+
+def _moderate_chunk(chunk, action, new_status, moderator, now):
+    """Apply ``action`` to one chunk in its own transaction; returns (results, changed rows)."""
+    with transaction.atomic():
+        rows = {
+            article_id: (status, author_id, publish_date)
+            for article_id, status, author_id, publish_date in Article.objects.select_for_update()
+            .filter(id__in=chunk).values_list('id', 'status', 'author_id', 'publish_date')
+        }
+        targets = {}
+        for article_id, (status, _author_id, publish_date) in rows.items():
+            target = new_status
+            if target == 'published' and publish_date and publish_date > now:
+                # Approving an article dated in the future schedules it.
+                target = 'scheduled'
+            if status != target:
+                targets[article_id] = target
+        changed = [(article_id, *rows[article_id][:2]) for article_id in chunk
+                   if article_id in targets]
+        for target in set(targets.values()):
+            updates = {'status': target, 'last_modified': now}
+            if target == 'published':
+                # Re-approving keeps the original publication date.
+                updates['publish_date'] = Coalesce('publish_date', Value(now))
+            Article.objects.filter(
+                id__in=[article_id for article_id, t in targets.items() if t == target]
+            ).update(**updates)
+        ModerationLog.objects.bulk_create([
+            ModerationLog(article_id=article_id, moderator=moderator, action=action,
+                          previous_status=status, new_status=targets[article_id])
+            for article_id, status, _author_id in changed
+        ])
+
+    results = []
+    for article_id in chunk:
+        if article_id not in rows:
+            results.append({'id': article_id, 'result': 'not_found'})
+            continue
+        status = rows[article_id][0]
+        results.append({
+            'id': article_id,
+            'result': 'changed' if article_id in targets else 'unchanged',
+            'previous_status': status,
+            'status': targets.get(article_id, status),
+        })
+    return results, changed
+
+
+def moderate_articles(action, moderator, article_ids=None, filters=None, chunk_size=None):
+    """
+    Move the given articles (a list of ids, or a filter expression) to the
+    status of ``action`` in chunked transactions, writing one ModerationLog
+    row per changed article. Author stats and cached listings are brought up
+    to date in bulk instead of through Article.save() per article; related
+    lists drop articles leaving 'published' and, for small runs, are fully
+    re-ranked. Returns one result per article, in id order.
+    """
+    new_status = MODERATION_ACTIONS[action]
+    chunk_size = chunk_size or CHUNK_SIZE
+    if article_ids is not None:
+        article_ids = sorted({int(article_id) for article_id in article_ids})
+    now = timezone.now()
+
+    results = []
+    changed_ids = []
+    for chunk in _id_chunks(article_ids, filters, chunk_size):
+        chunk_results, changed = _moderate_chunk(chunk, action, new_status, moderator, now)
+        results.extend(chunk_results)
+        if changed:
+            AuthorStats.refresh(*{author_id for _id, _status, author_id in changed})
+            changed_ids.extend(article_id for article_id, _status, _author_id in changed)
+            if new_status != 'published':
+                # Never point readers at articles that are no longer public.
+                RelatedArticle.objects.filter(related_id__in=[row[0] for row in changed]).delete()
+
+    if changed_ids:
+        if len(changed_ids) <= RELATED_SYNC_LIMIT:
+            RelatedArticle.update(*changed_ids)
+        invalidate_cached_reads('articles')
+    return results
@@ -0,0 +1,103 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.test import Client, TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from admin_api import moderation
+from admin_api.models import ModerationLog
+from articles.models import Article, RelatedArticle
+from users.models import User
+
+URL = '/api/admin/articles/bulk-action/'
+
+
+class BulkModerationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create(email='admin@example.com', name='Admin', role='admin')
+        cls.author = User.objects.create(email='author@example.com', name='Author')
+
+    def setUp(self):
+        self.auth = {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(self.admin).access_token}'}
+
+    def create_articles(self, count, **fields):
+        fields.setdefault('status', 'pending')
+        first = Article.objects.count()
+        Article.objects.bulk_create([
+            Article(title=f'Article {n}', slug=f'article-{n}', author=self.author,
+                    content='<p>Body</p>', **fields)
+            for n in range(first, first + count)
+        ])
+        return list(Article.objects.order_by('id').values_list('id', flat=True))
+
+    def post(self, data, client=None):
+        return (client or self.client).post(URL, data, content_type='application/json', **self.auth)
+
+    def test_changes_are_logged_per_article(self):
+        pending, published = self.create_articles(2)
+        Article.objects.filter(id=published).update(status='published')
+        future = timezone.now() + timedelta(days=1)
+        (scheduled,) = self.create_articles(1, publish_date=future)[2:]
+
+        with mock.patch.object(moderation, 'CHUNK_SIZE', 2):
+            response = self.post({'action': 'approve',
+                                  'article_ids': [pending, published, scheduled, 999]})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual((data['changed'], data['unchanged'], data['not_found']), (2, 1, 1))
+        self.assertEqual([result['result'] for result in data['results']],
+                         ['changed', 'unchanged', 'changed', 'not_found'])
+        logs = ModerationLog.objects.order_by('article_id').values_list(
+            'article_id', 'moderator', 'action', 'previous_status', 'new_status')
+        self.assertEqual(list(logs), [
+            (pending, self.admin.pk, 'approve', 'pending', 'published'),
+            (scheduled, self.admin.pk, 'approve', 'pending', 'scheduled'),
+        ])
+
+    def test_failed_chunk_keeps_earlier_chunks(self):
+        ids = self.create_articles(4)
+        bulk_create = ModerationLog.objects.bulk_create
+        calls = []
+
+        def fail_second_chunk(objs, *args, **kwargs):
+            calls.append(objs)
+            if len(calls) == 2:
+                raise RuntimeError('database went away')
+            return bulk_create(objs, *args, **kwargs)
+
+        client = Client(raise_request_exception=False)
+        with mock.patch.object(moderation, 'CHUNK_SIZE', 2), \
+                mock.patch.object(ModerationLog.objects, 'bulk_create', fail_second_chunk):
+            response = self.post({'action': 'reject', 'article_ids': ids}, client=client)
+
+        self.assertEqual(response.status_code, 500)
+        statuses = dict(Article.objects.values_list('id', 'status'))
+        self.assertEqual([statuses[article_id] for article_id in ids],
+                         ['rejected', 'rejected', 'pending', 'pending'])
+        self.assertEqual(sorted(ModerationLog.objects.values_list('article_id', flat=True)),
+                         ids[:2])
+
+    def test_filter_selects_articles(self):
+        ids = self.create_articles(3)
+        Article.objects.filter(id=ids[0]).update(status='draft')
+
+        response = self.post({'action': 'reject', 'filter': {'status': 'pending'}})
+
+        self.assertEqual([result['id'] for result in response.json()['results']], ids[1:])
+        self.assertEqual(Article.objects.filter(status='rejected').count(), 2)
+
+    def test_large_runs_skip_the_related_rerank(self):
+        ids = self.create_articles(moderation.RELATED_SYNC_LIMIT + 1)
+
+        with mock.patch.object(RelatedArticle, 'update') as update:
+            self.post({'action': 'approve', 'article_ids': ids[:2]})
+            update.assert_called_once_with(*ids[:2])
+            update.reset_mock()
+
+            response = self.post({'action': 'approve', 'article_ids': ids})
+
+        self.assertEqual(response.json()['changed'], moderation.RELATED_SYNC_LIMIT - 1)
+        update.assert_called_once_with(*ids[2:])
@@ -16,6 +16,9 @@ router.register(r'tags', views.AdminTagViewSet, basename='admin-tags')
 
 urlpatterns = [
     path('dashboard/', views.DashboardStatsView.as_view(), name='admin-dashboard'),
+    path('stats/daily/', views.StatsTimeSeriesView.as_view(), name='admin-stats-daily'),
+    path('articles/<int:article_id>/stats/daily/', views.ArticleStatsTimeSeriesView.as_view(),
+         name='admin-article-stats-daily'),
     path('articles/<int:article_id>/quick-action/', views.QuickArticleActionView.as_view(), name='quick-article-action'),
     path('articles/bulk-action/', views.BulkArticleActionView.as_view(), name='bulk-article-action'),
 
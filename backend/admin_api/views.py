@@ -2,12 +2,14 @@ from django.shortcuts import render
 from rest_framework import generics, permissions, status, viewsets
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from django.db.models import Count, Q, F
+from django.db.models import Count, Q, F, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.http import HttpResponse
 from datetime import timedelta
 import csv
-from articles.models import Article
+from articles.analytics import daily_series, period_unique_viewers
+from articles.models import Article, ArticleDailyStats
 from users.models import User
 from contact.models import Contact
 from categories.models import Category
@@ -19,6 +21,7 @@ from categories.serializers import CategorySerializer
 from tags.serializers import TagSerializer
 from core.permissions import IsAdminUser
 from core.utils import log_action
+from .moderation import MODERATION_ACTIONS, moderate_articles
 
 
 class DashboardStatsView(APIView):
@@ -80,8 +83,8 @@ class DashboardStatsView(APIView):
         
         # Top authors by article count
         top_authors = (
-            User.objects.filter(role='author')
-            .annotate(article_count=Count('articles', filter=Q(articles__status='published')))
+            User.objects.filter(role='author', stats__isnull=False)
+            .annotate(article_count=F('stats__published_count'))
             .order_by('-article_count')[:5]
         )
         
@@ -98,6 +101,11 @@ class DashboardStatsView(APIView):
             'comments_flagged': 0,  # Implement based on your comment system
             'users_registered': new_users_this_week,
         }
+        # Unique viewers are summed per article and day.
+        weekly_stats.update(ArticleDailyStats.objects.filter(
+            date__gte=timezone.localdate(week_start)
+        ).aggregate(views=Coalesce(Sum('views'), 0),
+                    unique_viewers=Coalesce(Sum('unique_viewers'), 0)))
         
         # User activity insights
         user_activity = (
@@ -129,6 +137,52 @@ class DashboardStatsView(APIView):
         })
 
 
+class StatsTimeSeriesView(APIView):
+    """
+    Site-wide daily views, reactions, bookmarks and comments from the rollups
+    (?days=, max 365). unique_viewers is summed per article, so a reader of
+    two articles counts twice.
+    """
+    permission_classes = [IsAdminUser]
+    max_days = 365
+
+    def get_days(self, request):
+        try:
+            days = int(request.query_params.get('days', 30))
+        except ValueError:
+            return None
+        return days if 1 <= days <= self.max_days else None
+
+    def get(self, request):
+        days = self.get_days(request)
+        if days is None:
+            return Response({'error': f'days must be between 1 and {self.max_days}'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response({'days': days, 'series': daily_series(ArticleDailyStats.objects.all(), days)})
+
+
+class ArticleStatsTimeSeriesView(StatsTimeSeriesView):
+    """Daily series for one article."""
+
+    def get(self, request, article_id):
+        days = self.get_days(request)
+        if days is None:
+            return Response({'error': f'days must be between 1 and {self.max_days}'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not Article.objects.filter(id=article_id).exists():
+            return Response({'error': 'Article not found'}, status=status.HTTP_404_NOT_FOUND)
+        rollups = ArticleDailyStats.objects.filter(article_id=article_id)
+        series = daily_series(rollups, days)
+        return Response({
+            'article_id': article_id,
+            'days': days,
+            # Distinct over the whole period (merged sketches), not the sum of days.
+            'unique_viewers': period_unique_viewers(
+                rollups.filter(date__gte=series[0]['date'])),
+            'series': series,
+        })
+
+
 class QuickArticleActionView(APIView):
     permission_classes = [IsAdminUser]
     
@@ -159,32 +213,47 @@ class QuickArticleActionView(APIView):
 
 
 class BulkArticleActionView(APIView):
+    """
+    Approve or reject many articles at once. Body: ``action`` plus either
+    ``article_ids`` (a list) or ``filter`` (see admin_api.moderation.filtered_articles).
+    Responds with counts and one result per article.
+    """
     permission_classes = [IsAdminUser]
-    
+
     def post(self, request):
-        article_ids = request.data.get('article_ids', [])
+        article_ids = request.data.get('article_ids')
+        filters = request.data.get('filter')
         action = request.data.get('action')
-        
-        if not article_ids or not action:
-            return Response({'error': 'Article IDs and action are required'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        articles = Article.objects.filter(id__in=article_ids)
-        
-        if action == 'approve':
-            articles.update(
-                status='published',
-                publish_date=timezone.now()
-            )
-            log_action('bulk_articles_approved', request.user, f'Count: {len(article_ids)}')
-            return Response({'message': f'{len(article_ids)} articles approved successfully'}, status=status.HTTP_200_OK)
-            
-        elif action == 'reject':
-            articles.update(status='rejected')
-            log_action('bulk_articles_rejected', request.user, f'Count: {len(article_ids)}')
-            return Response({'message': f'{len(article_ids)} articles rejected successfully'}, status=status.HTTP_200_OK)
-            
-        else:
+
+        if not (article_ids or filters) or not action:
+            return Response({'error': 'Article IDs or a filter, and an action, are required'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if action not in MODERATION_ACTIONS:
             return Response({'error': 'Invalid action'}, status=status.HTTP_400_BAD_REQUEST)
+        if article_ids is not None and not isinstance(article_ids, list):
+            return Response({'error': 'article_ids must be a list'},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            results = moderate_articles(
+                action, request.user,
+                article_ids=article_ids or None,
+                filters=None if article_ids else filters,
+            )
+        except (TypeError, ValueError) as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        counts = {'changed': 0, 'unchanged': 0, 'not_found': 0}
+        for result in results:
+            counts[result['result']] += 1
+        past_tense = 'approved' if action == 'approve' else 'rejected'
+        log_action(f'bulk_articles_{past_tense}', request.user,
+                   ', '.join(f'{name}: {count}' for name, count in counts.items()))
+        return Response({
+            'message': f'{counts["changed"]} articles {past_tense} successfully',
+            **counts,
+            'results': results,
+        }, status=status.HTTP_200_OK)
 
 
 class AdminUserViewSet(viewsets.ModelViewSet):
@@ -0,0 +1,207 @@
+import hashlib
+import hmac
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from core.hll import HyperLogLog
+from core.utils import log_action
+from users.models import AuthorStats
+from .models import Article, ArticleActivity, ArticleDailyStats, ArticleEvent, ArticleViewerSketch
+
+# Event kind -> ArticleDailyStats counter.
+EVENT_COUNTERS = {
+    'view': 'views',
+    'like': 'likes',
+    'dislike': 'dislikes',
+    'bookmark': 'bookmarks',
+    'comment': 'comments',
+}
+COUNTER_FIELDS = list(EVENT_COUNTERS.values())
+STAT_FIELDS = COUNTER_FIELDS + ['unique_viewers']
+
+
+def viewer_key(request):
+    """
+    Identify a reader for unique-viewer counts without storing their IP:
+    the user id when signed in, else a keyed hash of IP and user agent.
+    """
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'u{user.pk}'
+    raw = f"{request.META.get('REMOTE_ADDR', '')}|{request.META.get('HTTP_USER_AGENT', '')}"
+    return 'a' + hmac.new(settings.SECRET_KEY.encode(), raw.encode(), hashlib.sha256).hexdigest()[:31]
+
+
+def compact_batch(batch_size=10000):
+    """
+    Fold up to ``batch_size`` of the oldest buffered events into the daily
+    rollups, the hourly trending counters and the authors' view totals, and
+    delete them, in one transaction. Returns the number of events consumed.
+
+    Viewer keys go into HyperLogLog sketches: the day's sketch on the
+    rollup row and the article's lifetime sketch. Both are merged rather
+    than summed, so a reader counted in an earlier batch isn't counted again.
+    Run a single compactor at a time.
+    """
+    with transaction.atomic():
+        events = list(
+            ArticleEvent.objects.select_for_update(skip_locked=True).order_by('id')
+            .values_list('id', 'article_id', 'kind', 'viewer', 'created_at')[:batch_size]
+        )
+        if not events:
+            return 0
+
+        authors = dict(Article.objects.filter(
+            id__in={event[1] for event in events}).values_list('id', 'author_id'))
+        totals = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+        viewers = defaultdict(set)
+        hourly = defaultdict(lambda: {'views': 0, 'likes': 0})
+        author_views = defaultdict(int)
+        for _id, article_id, kind, viewer, created_at in events:
+            if article_id not in authors:
+                continue
+            key = (article_id, timezone.localdate(created_at))
+            totals[key][EVENT_COUNTERS[kind]] += 1
+            if kind in ('view', 'like'):
+                bucket = created_at.replace(minute=0, second=0, microsecond=0)
+                hourly[(article_id, bucket)][EVENT_COUNTERS[kind]] += 1
+            if kind == 'view':
+                author_views[authors[article_id]] += 1
+                if viewer:
+                    viewers[key].add(viewer)
+
+        rows = {
+            (row.article_id, row.date): row
+            for row in ArticleDailyStats.objects.select_for_update().filter(
+                article_id__in={article_id for article_id, _date in totals},
+                date__in={date for _article_id, date in totals},
+            )
+        }
+        changed, created = [], []
+        for (article_id, date), counts in totals.items():
+            row = rows.get((article_id, date))
+            if row is None:
+                row = ArticleDailyStats(article_id=article_id, date=date)
+                created.append(row)
+            else:
+                changed.append(row)
+            for field, count in counts.items():
+                setattr(row, field, getattr(row, field) + count)
+            if viewers[(article_id, date)]:
+                sketch = HyperLogLog.from_bytes(row.viewer_sketch).update(viewers[(article_id, date)])
+                row.viewer_sketch = sketch.to_bytes()
+                row.unique_viewers = sketch.count()
+        ArticleDailyStats.objects.bulk_create(created, batch_size=1000)
+        ArticleDailyStats.objects.bulk_update(
+            changed, STAT_FIELDS + ['viewer_sketch'], batch_size=1000)
+        merge_lifetime_viewers(viewers)
+        merge_hourly_activity(hourly)
+        # By id, not id range: a lower id may still be uncommitted elsewhere.
+        ArticleEvent.objects.filter(id__in=[event[0] for event in events]).delete()
+        # After the delete: AuthorStats.compute leaves buffered views out, so
+        # an author row created here by refresh() already includes these.
+        for author_id, views in author_views.items():
+            AuthorStats.add(author_id, total_views=views)
+    return len(events)
+
+
+def merge_lifetime_viewers(viewers):
+    """Add per-(article, day) viewer sets to the lifetime sketches and Article.unique_viewers."""
+    by_article = defaultdict(set)
+    for (article_id, _date), keys in viewers.items():
+        by_article[article_id].update(keys)
+    by_article = {article_id: keys for article_id, keys in by_article.items() if keys}
+    if not by_article:
+        return
+
+    sketches = {
+        row.article_id: row
+        for row in ArticleViewerSketch.objects.select_for_update().filter(
+            article_id__in=by_article.keys())
+    }
+    created, articles = [], []
+    for article_id, keys in by_article.items():
+        row = sketches.get(article_id)
+        if row is None:
+            row = ArticleViewerSketch(article_id=article_id)
+            created.append(row)
+        sketch = HyperLogLog.from_bytes(row.sketch).update(keys)
+        row.sketch = sketch.to_bytes()
+        articles.append(Article(id=article_id, unique_viewers=sketch.count()))
+    ArticleViewerSketch.objects.bulk_create(created, batch_size=1000)
+    ArticleViewerSketch.objects.bulk_update(
+        [row for row in sketches.values() if row.article_id in by_article], ['sketch'],
+        batch_size=1000)
+    Article.objects.bulk_update(articles, ['unique_viewers'], batch_size=1000)
+
+
+def merge_hourly_activity(hourly):
+    """Add per-(article, hour) view and like counts to the ArticleActivity buckets."""
+    if not hourly:
+        return
+    rows = {
+        (row.article_id, row.bucket): row
+        for row in ArticleActivity.objects.select_for_update().filter(
+            article_id__in={article_id for article_id, _bucket in hourly},
+            bucket__in={bucket for _article_id, bucket in hourly},
+        )
+    }
+    changed, created = [], []
+    for (article_id, bucket), counts in hourly.items():
+        row = rows.get((article_id, bucket))
+        if row is None:
+            row = ArticleActivity(article_id=article_id, bucket=bucket)
+            created.append(row)
+        else:
+            changed.append(row)
+        row.views += counts['views']
+        row.likes += counts['likes']
+    ArticleActivity.objects.bulk_create(created, batch_size=1000)
+    ArticleActivity.objects.bulk_update(changed, ['views', 'likes'], batch_size=1000)
+
+
+def period_unique_viewers(queryset):
+    """Distinct viewers across the rollup rows in ``queryset`` (e.g. one article's last 30 days)."""
+    sketch = HyperLogLog()
+    for data in queryset.exclude(viewer_sketch=b'').values_list('viewer_sketch', flat=True):
+        sketch.merge(HyperLogLog.from_bytes(bytes(data)))
+    return sketch.count()
+
+
+def compact_events(batch_size=10000):
+    """Compact until the buffer is empty; returns the number of events consumed."""
+    consumed = 0
+    while True:
+        count = compact_batch(batch_size)
+        consumed += count
+        if count < batch_size:
+            break
+    if consumed:
+        log_action('article_events_compacted', None, f'Events: {consumed}')
+    return consumed
+
+
+def daily_series(queryset, days):
+    """
+    Sum the rollups in ``queryset`` per day over the last ``days`` days,
+    oldest first, with zero rows for days without activity.
+    """
+    today = timezone.localdate()
+    start = today - timedelta(days=days - 1)
+    sums = {
+        row['date']: row
+        for row in queryset.filter(date__gte=start).order_by().values('date').annotate(
+            **{field: Sum(field) for field in STAT_FIELDS})
+    }
+    empty = dict.fromkeys(STAT_FIELDS, 0)
+    series = []
+    for offset in range(days):
+        date = start + timedelta(days=offset)
+        row = sums.get(date, empty)
+        series.append({'date': date.isoformat(), **{field: row[field] for field in STAT_FIELDS}})
+    return series
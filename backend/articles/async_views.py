@@ -0,0 +1,240 @@
+from collections import defaultdict
+
+from asgiref.sync import sync_to_async
+from django.db.models import Count
+
+from categories.models import Category
+from comments.async_views import serialize_comment_threads
+from core.async_views import (
+    AsyncReadView, drf_datetime, file_url, invalid_page_response, json_response,
+    paginate, user_payload)
+from .models import Article, ArticleLike
+from .serializers import ArticleListSerializer
+from .views import (
+    PAGE_PARTS, ArticleBySlugView, ArticleListCreateView, ArticlePageView, PopularArticlesView,
+    RecentArticlesView, page_author, page_parts, page_related_articles)
+
+
+async def _through_counts(through, column, ids):
+    """Number of articles linked to each category or tag id."""
+    counts = {}
+    rows = through.objects.filter(**{f'{column}__in': ids}).values(column).annotate(
+        total=Count('id'))
+    async for row in rows:
+        counts[row[column]] = row['total']
+    return counts
+
+
+async def _category_payloads(categories, depth=0):
+    """Mirror CategorySerializer, including nested children, keyed by category id."""
+    ids = [category.id for category in categories]
+    if not ids:
+        return {}
+    counts = await _through_counts(Article.categories.through, 'category_id', ids)
+
+    children = defaultdict(list)
+    # The depth cap only guards against a corrupted parent cycle.
+    if depth < 10:
+        child_categories = [child async for child in Category.objects.filter(parent_id__in=ids)]
+        child_payloads = await _category_payloads(child_categories, depth + 1)
+        for child in child_categories:
+            children[child.parent_id].append(child_payloads[child.id])
+
+    return {
+        category.id: {
+            'id': category.id,
+            'name': category.name,
+            'slug': category.slug,
+            'description': category.description,
+            'featured_image': category.featured_image,
+            'parent': category.parent_id,
+            'article_count': counts.get(category.id, 0),
+            'children': children.get(category.id) or None,
+        }
+        for category in categories
+    }
+
+
+async def _tag_payloads(tags):
+    """Mirror TagSerializer, keyed by tag id."""
+    ids = [tag.id for tag in tags]
+    if not ids:
+        return {}
+    counts = await _through_counts(Article.tags.through, 'tag_id', ids)
+    return {
+        tag.id: {
+            'id': tag.id,
+            'name': tag.name,
+            'slug': tag.slug,
+            'description': tag.description,
+            'article_count': counts.get(tag.id, 0),
+        }
+        for tag in tags
+    }
+
+
+async def serialize_articles(request, queryset, detail=False):
+    """
+    Mirror ArticleSerializer output (ArticleDetailSerializer with ``detail``)
+    for an anonymous reader, batching the per-article reaction and
+    per-category/tag counts into a few queries.
+    """
+    articles = [
+        article async for article in queryset.select_related('author')
+        .prefetch_related('categories', 'tags').aiterator(chunk_size=100)
+    ]
+    ids = [article.id for article in articles]
+
+    reactions = defaultdict(lambda: {True: 0, False: 0})
+    rows = ArticleLike.objects.filter(article_id__in=ids).values(
+        'article_id', 'is_like').annotate(total=Count('id'))
+    async for row in rows:
+        reactions[row['article_id']][row['is_like']] = row['total']
+
+    categories = {c.id: c for article in articles for c in article.categories.all()}
+    tags = {t.id: t for article in articles for t in article.tags.all()}
+    category_data = await _category_payloads(list(categories.values()))
+    tag_data = await _tag_payloads(list(tags.values()))
+
+    payloads = [{
+        'id': article.id,
+        'title': article.title,
+        'slug': article.slug,
+        'excerpt': article.excerpt,
+        'content': article.content,
+        'featured_image': file_url(request, article.featured_image),
+        'status': article.status,
+        'publish_date': drf_datetime(article.publish_date),
+        'last_modified': drf_datetime(article.last_modified),
+        'created_at': drf_datetime(article.created_at),
+        'author': article.author_id,
+        'author_detail': user_payload(request, article.author),
+        'categories_detail': [category_data[c.id] for c in article.categories.all()],
+        'tags_detail': [tag_data[t.id] for t in article.tags.all()],
+        'featured': article.featured,
+        'views': article.views,
+        'unique_viewers': article.unique_viewers,
+        'reading_time': article.reading_time,
+        'word_count': article.word_count,
+        'toc': article.toc,
+        'like_count': reactions[article.id][True],
+        'dislike_count': reactions[article.id][False],
+        'user_reaction': None,
+        'is_bookmarked': False,
+    } for article in articles]
+    if detail:
+        for payload, article in zip(payloads, articles):
+            payload['content_html'] = article.content_html
+    return payloads
+
+
+class AsyncArticleListView(AsyncReadView):
+    fallback_view = ArticleListCreateView
+    cache_timeout = 30
+    cache_namespace = 'articles'
+
+    async def get_queryset(self, view):
+        return view.get_queryset()
+
+    async def read(self, request, *args, **kwargs):
+        view = self.drf_view(request, *args, **kwargs)
+        queryset = view.filter_queryset(await self.get_queryset(view))
+        page, envelope = await paginate(request, queryset)
+        if page is None:
+            return invalid_page_response()
+        envelope['results'] = await serialize_articles(request, page)
+        return json_response(envelope)
+
+
+class AsyncPopularArticlesView(AsyncArticleListView):
+    fallback_view = PopularArticlesView
+
+    async def get_queryset(self, view):
+        # Checks whether a ranking exists, so it queries.
+        return await sync_to_async(view.get_queryset)()
+
+
+class AsyncRecentArticlesView(AsyncArticleListView):
+    fallback_view = RecentArticlesView
+
+
+class AsyncArticleBySlugView(AsyncReadView):
+    fallback_view = ArticleBySlugView
+
+    async def read(self, request, slug):
+        try:
+            article = await Article.objects.only('id', 'status').aget(slug=slug)
+        except Article.DoesNotExist:
+            return json_response(
+                {'error': 'Not found', 'details': 'No Article matches the given query.'},
+                status=404)
+        if article.status != 'published':
+            return json_response(
+                {'error': 'You do not have permission to view this article.'},
+                status=403)
+
+        data = (await serialize_articles(
+            request, Article.objects.filter(pk=article.pk), detail=True))[0]
+        data['comments'] = await serialize_comment_threads(
+            request, article.comments.filter(status='approved', parent=None).order_by('-created_at'))
+        return json_response(data)
+
+
+async def author_card_payload(request, author_id):
+    """Mirror AuthorListSerializer output, totals read from AuthorStats."""
+    author = await page_author(author_id).afirst()
+    if author is None:
+        return None
+    return {
+        'id': author.id,
+        'name': author.name,
+        'email': author.email,
+        'avatar': file_url(request, author.avatar),
+        'bio': author.bio,
+        'role': author.role,
+        'article_count': author.article_count,
+        'total_views': author.total_views,
+        'total_likes': author.total_likes,
+        'last_published_at': drf_datetime(author.last_published_at),
+    }
+
+
+class AsyncArticlePageView(AsyncReadView):
+    """
+    Article page bundle for anonymous readers: one article fetch, comment
+    trees loaded a level per query, the precomputed related list and the
+    author card, cached per URL (so per ?include= combination).
+    """
+    fallback_view = ArticlePageView
+    cache_timeout = 30
+    cache_namespace = 'articles'
+
+    async def read(self, request, slug):
+        parts = page_parts(request)
+        if parts is None:
+            return json_response({'error': f'include accepts: {", ".join(PAGE_PARTS)}'}, status=400)
+        try:
+            article = await Article.objects.only('id', 'status', 'author_id').aget(slug=slug)
+        except Article.DoesNotExist:
+            return json_response(
+                {'error': 'Not found', 'details': 'No Article matches the given query.'},
+                status=404)
+        if article.status != 'published':
+            return json_response(
+                {'error': 'You do not have permission to view this article.'},
+                status=403)
+
+        data = {'article': (await serialize_articles(
+            request, Article.objects.filter(pk=article.pk), detail=True))[0]}
+        if 'comments' in parts:
+            data['comments'] = await serialize_comment_threads(
+                request, article.comments.filter(status='approved', parent=None).order_by('-created_at'))
+        if 'related' in parts:
+            data['related'] = [
+                {field: payload[field] for field in ArticleListSerializer.Meta.fields}
+                for payload in await serialize_articles(
+                    request, page_related_articles(article.id).defer('content_html'))
+            ]
+        if 'author' in parts:
+            data['author'] = await author_card_payload(request, article.author_id)
+        return json_response(data)
@@ -0,0 +1,248 @@
+import hashlib
+import re
+from dataclasses import dataclass, field
+from html import escape
+from html.parser import HTMLParser
+from urllib.parse import urlsplit
+
+from django.utils.text import slugify
+from unidecode import unidecode
+
+WORDS_PER_MINUTE = 200
+EXCERPT_LENGTH = 300
+
+# Bump whenever the rendering rules below change; stored hashes then no
+# longer match and `manage.py render_articles` re-renders those rows.
+RENDER_VERSION = 1
+
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+# Tags whose boundaries separate words even without whitespace in the source.
+BLOCK_TAGS = HEADING_TAGS | {
+    'p', 'div', 'br', 'li', 'ul', 'ol', 'blockquote', 'pre', 'table', 'tr',
+    'td', 'th', 'section', 'article', 'header', 'footer', 'figure', 'figcaption', 'hr',
+}
+# Dropped together with everything inside them.
+SKIPPED_TAGS = {'script', 'style', 'template', 'iframe', 'object', 'embed', 'noscript', 'svg', 'math'}
+
+# Rendered output allowlist; any other tag is removed but its text is kept.
+ALLOWED_TAGS = HEADING_TAGS | {
+    'p', 'br', 'hr', 'div', 'span', 'strong', 'b', 'em', 'i', 'u', 's', 'del', 'ins',
+    'sub', 'sup', 'mark', 'small', 'blockquote', 'q', 'cite', 'code', 'pre', 'kbd',
+    'ul', 'ol', 'li', 'dl', 'dt', 'dd', 'a', 'img', 'figure', 'figcaption',
+    'table', 'thead', 'tbody', 'tfoot', 'tr', 'th', 'td', 'caption',
+}
+VOID_TAGS = {'br', 'hr', 'img'}
+ALLOWED_ATTRS = {
+    '*': {'class', 'title'},
+    'a': {'href', 'target'},
+    'img': {'src', 'alt', 'width', 'height'},
+    'ol': {'start'},
+    'td': {'colspan', 'rowspan'},
+    'th': {'colspan', 'rowspan', 'scope'},
+}
+URL_ATTRS = {'href', 'src'}
+SAFE_SCHEMES = {'', 'http', 'https', 'mailto'}
+DATA_IMAGE_RE = re.compile(r'^data:image/(png|jpe?g|gif|webp);base64,', re.IGNORECASE)
+
+WORD_RE = re.compile(r'\S+')
+
+
+@dataclass
+class ContentSummary:
+    word_count: int = 0
+    reading_time: int = 1
+    excerpt: str = ''
+    toc: list = field(default_factory=list)
+    html: str = ''
+
+
+def content_hash(content):
+    """Key of a rendering: the source HTML plus the rules it was rendered with."""
+    return hashlib.sha256(f'{RENDER_VERSION}:{content or ""}'.encode()).hexdigest()
+
+
+def _safe_url(tag, value):
+    value = value.strip()
+    if tag == 'img' and DATA_IMAGE_RE.match(value):
+        return value
+    try:
+        scheme = urlsplit(value).scheme.lower()
+    except ValueError:
+        return None
+    return value if scheme in SAFE_SCHEMES else None
+
+
+class _ContentParser(HTMLParser):
+    """
+    One pass over the article HTML: counts words, keeps only the first
+    EXCERPT_LENGTH characters of body text, records headings for the TOC,
+    and writes a sanitized copy with heading anchors and lazy-loaded images.
+    The full plain text is never built.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.word_count = 0
+        self.excerpt_parts = []
+        self.excerpt_length = 0
+        self.toc = []
+        self.anchors = set()
+        self.heading = None
+        self.skip_depth = 0
+        # Whether the last text seen ended mid-word, so a chunk continuing it
+        # (e.g. "foo<b>bar</b>") isn't counted as a second word.
+        self.in_word = False
+        self.out = []
+        self.open_tags = []
+
+    def handle_starttag(self, tag, attrs):
+        if self.skip_depth or tag in SKIPPED_TAGS:
+            if tag in SKIPPED_TAGS:
+                self.skip_depth += 1
+            return
+        if tag in BLOCK_TAGS:
+            self._break()
+        if tag in HEADING_TAGS:
+            if self.heading:
+                self._close_heading()
+            # The opening tag is written once the heading text, and so its
+            # anchor, is known.
+            self.heading = {'level': int(tag[1]), 'id': dict(attrs).get('id'),
+                            'parts': [], 'out_index': len(self.out), 'attrs': attrs}
+            self.out.append('')
+            self.open_tags.append(tag)
+        else:
+            self._emit_start(tag, attrs)
+
+    def handle_startendtag(self, tag, attrs):
+        if self.skip_depth or tag in SKIPPED_TAGS:
+            return
+        if tag in BLOCK_TAGS:
+            self._break()
+        if tag in VOID_TAGS:
+            self._emit_start(tag, attrs)
+        elif tag in ALLOWED_TAGS:
+            self._emit_start(tag, attrs)
+            self._emit_end(tag)
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if self.skip_depth:
+            return
+        if tag in BLOCK_TAGS:
+            self._break()
+        if tag in HEADING_TAGS and self.heading:
+            self._close_heading()
+        self._emit_end(tag)
+
+    def handle_data(self, data):
+        if self.skip_depth or not data:
+            return
+        words = len(WORD_RE.findall(data))
+        if words and self.in_word and not data[0].isspace():
+            words -= 1
+        self.word_count += words
+        self.in_word = not data[-1].isspace()
+        self.out.append(escape(data, quote=False))
+
+        if self.heading is not None:
+            self.heading['parts'].append(data)
+        elif self.excerpt_length < EXCERPT_LENGTH:
+            self.excerpt_parts.append(data)
+            self.excerpt_length += len(data)
+
+    def close(self):
+        super().close()
+        if self.heading:
+            self._close_heading()
+        while self.open_tags:
+            self.out.append(f'</{self.open_tags.pop()}>')
+
+    def _break(self):
+        self.in_word = False
+        if self.excerpt_length < EXCERPT_LENGTH and self.excerpt_parts:
+            self.excerpt_parts.append(' ')
+
+    def _attrs(self, tag, attrs):
+        allowed = ALLOWED_ATTRS['*'] | ALLOWED_ATTRS.get(tag, set())
+        cleaned = {}
+        for name, value in attrs:
+            if name not in allowed or value is None:
+                continue
+            if name in URL_ATTRS:
+                value = _safe_url(tag, value)
+                if value is None:
+                    continue
+            cleaned[name] = value
+        if tag == 'a' and cleaned.get('target') == '_blank':
+            cleaned['rel'] = 'noopener noreferrer'
+        if tag == 'img':
+            cleaned['loading'] = 'lazy'
+            cleaned['decoding'] = 'async'
+        return ''.join(f' {name}="{escape(value)}"' for name, value in cleaned.items())
+
+    def _emit_start(self, tag, attrs):
+        if tag not in ALLOWED_TAGS:
+            return
+        if tag == 'img' and not any(name == 'src' and value and _safe_url(tag, value)
+                                    for name, value in attrs):
+            return
+        self.out.append(f'<{tag}{self._attrs(tag, attrs)}>')
+        if tag not in VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def _emit_end(self, tag):
+        # Only close tags that were opened, closing any left open inside them,
+        # so the output is always well nested.
+        if tag not in self.open_tags:
+            return
+        while self.open_tags:
+            open_tag = self.open_tags.pop()
+            self.out.append(f'</{open_tag}>')
+            if open_tag == tag:
+                break
+
+    def _close_heading(self):
+        heading, self.heading = self.heading, None
+        text = ' '.join(''.join(heading['parts']).split())
+        attrs = [(name, value) for name, value in heading['attrs'] if name != 'id']
+        tag = f"h{heading['level']}"
+        anchor_attr = ''
+        if text:
+            anchor = heading['id'] or slugify(unidecode(text)) or 'section'
+            base, n = anchor, 1
+            while anchor in self.anchors:
+                n += 1
+                anchor = f'{base}-{n}'
+            self.anchors.add(anchor)
+            self.toc.append({'level': heading['level'], 'text': text, 'id': anchor})
+            anchor_attr = f' id="{escape(anchor)}"'
+        self.out[heading['out_index']] = f'<{tag}{anchor_attr}{self._attrs(tag, attrs)}>'
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    text = ' '.join(text.split())
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(' ', 1)[0]
+    return f'{cut}…'
+
+
+def process_content(html):
+    """
+    Summarize and render article HTML: word count, reading time, plain-text
+    excerpt, heading TOC, and the sanitized HTML served to readers.
+    """
+    parser = _ContentParser()
+    parser.feed(html or '')
+    parser.close()
+
+    return ContentSummary(
+        word_count=parser.word_count,
+        reading_time=max(1, round(parser.word_count / WORDS_PER_MINUTE)),
+        excerpt=make_excerpt(''.join(parser.excerpt_parts)),
+        toc=parser.toc,
+        html=''.join(parser.out),
+    )
@@ -0,0 +1,94 @@
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ArticleDraft
+
+# Upper bound on draft content, so a runaway client can't grow it unchecked.
+MAX_DRAFT_LENGTH = 1_000_000
+
+
+def draft_state(article):
+    """
+    The article's draft buffer as a dict; version 0 means there is none yet
+    and the fields are the article's own.
+    """
+    draft = ArticleDraft.objects.filter(article=article).first()
+    if draft is None:
+        return {'version': 0, 'title': article.title, 'excerpt': article.excerpt,
+                'content': article.content, 'updated_at': None}
+    return {'version': draft.version, 'title': draft.title, 'excerpt': draft.excerpt,
+            'content': draft.content, 'updated_at': draft.updated_at}
+
+
+def apply_ops(text, ops):
+    """
+    Apply a list of ``{"start": i, "end": j, "text": "..."}`` operations,
+    each replacing text[start:end] of the result of the previous one (an
+    insert has start == end, a deletion an empty text). Raises ValueError
+    for malformed or out-of-range operations.
+    """
+    if not isinstance(ops, list):
+        raise ValueError('ops must be a list')
+    for op in ops:
+        if not isinstance(op, dict):
+            raise ValueError('Each op must be an object')
+        start = op.get('start')
+        end = op.get('end', start)
+        insert = op.get('text', '')
+        if not isinstance(start, int) or not isinstance(end, int) or not isinstance(insert, str):
+            raise ValueError('Each op needs integer start/end and a string text')
+        if not 0 <= start <= end <= len(text):
+            raise ValueError(f'Op range {start}:{end} is outside the draft (length {len(text)})')
+        text = text[:start] + insert + text[end:]
+    if len(text) > MAX_DRAFT_LENGTH:
+        raise ValueError(f'Draft content is limited to {MAX_DRAFT_LENGTH} characters')
+    return text
+
+
+def autosave(article, user, version, ops=None, title=None, excerpt=None):
+    """
+    Apply a patch to the article's draft if ``version`` is still current,
+    writing only the columns that changed. Returns the new state, or None
+    when the draft moved on since ``version`` (the caller should reload).
+    Raises ValueError for invalid ops.
+    """
+    current = draft_state(article)
+    if current['version'] != version:
+        return None
+    changes = {}
+    if ops:
+        content = apply_ops(current['content'], ops)
+        if content != current['content']:
+            changes['content'] = content
+    for field, value in (('title', title), ('excerpt', excerpt)):
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f'{field} must be a string')
+        if field == 'title' and value is not None and len(value) > 255:
+            raise ValueError('title is limited to 255 characters')
+        if value is not None and value != current[field]:
+            changes[field] = value
+    if not changes:
+        return current
+
+    now = timezone.now()
+    if version == 0:
+        try:
+            with transaction.atomic():
+                ArticleDraft.objects.create(
+                    article=article, updated_by=user, updated_at=now,
+                    **{**{field: current[field] for field in ('title', 'excerpt', 'content')},
+                       **changes})
+        except IntegrityError:
+            # Another autosave created the draft first.
+            return None
+    else:
+        # The whole content column is rewritten even for a one-character op:
+        # drafts are capped at MAX_DRAFT_LENGTH, the databases rewrite a
+        # changed text value in full anyway, and a stored op log would have to
+        # be replayed on every read and conflict check instead.
+        updated = ArticleDraft.objects.filter(article=article, version=version).update(
+            version=F('version') + 1, updated_by=user, updated_at=now, **changes)
+        if not updated:
+            return None
+    return {**current, **changes, 'version': version + 1, 'updated_at': now}
@@ -0,0 +1,47 @@
+# Generated by Django 5.2 on 2026-10-19 02:03
+
+from django.db import migrations, models
+
+from articles.content import process_content
+
+
+def summarize_existing_content(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    batch = []
+    for article in Article.objects.only('id', 'content').iterator(chunk_size=500):
+        summary = process_content(article.content)
+        article.word_count = summary.word_count
+        article.reading_time = summary.reading_time
+        article.toc = summary.toc
+        batch.append(article)
+        if len(batch) >= 500:
+            Article.objects.bulk_update(batch, ['word_count', 'reading_time', 'toc'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['word_count', 'reading_time', 'toc'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0003_article_articles_author_status_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='toc',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='article',
+            name='excerpt',
+            field=models.TextField(blank=True),
+        ),
+        migrations.RunPython(summarize_existing_content, migrations.RunPython.noop),
+    ]
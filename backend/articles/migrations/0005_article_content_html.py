@@ -0,0 +1,40 @@
+# Generated by Django 5.2 on 2026-10-19 02:06
+
+from django.db import migrations, models
+
+from articles.content import content_hash, process_content
+
+
+def render_existing_content(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    batch = []
+    for article in Article.objects.only('id', 'content').iterator(chunk_size=500):
+        article.content_html = process_content(article.content).html
+        article.content_hash = content_hash(article.content)
+        batch.append(article)
+        if len(batch) >= 500:
+            Article.objects.bulk_update(batch, ['content_html', 'content_hash'])
+            batch = []
+    if batch:
+        Article.objects.bulk_update(batch, ['content_html', 'content_hash'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0004_article_content_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='article',
+            name='content_hash',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='content_html',
+            field=models.TextField(blank=True),
+        ),
+        migrations.RunPython(render_existing_content, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-19 02:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0005_article_content_html'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RelatedArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbors', to='articles.article')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='neighbor_of', to='articles.article')),
+            ],
+            options={
+                'db_table': 'related_articles',
+                'ordering': ['article', '-score'],
+                'indexes': [models.Index(fields=['related'], name='related_articles_related_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'related'), name='related_articles_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2 on 2026-10-19 02:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0006_relatedarticle'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('likes', models.IntegerField(default=0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity', to='articles.article')),
+            ],
+            options={
+                'db_table': 'article_activity',
+                'ordering': ['-bucket'],
+                'indexes': [models.Index(fields=['bucket'], name='article_activity_bucket_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'bucket'), name='article_activity_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TrendingArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('window', models.CharField(max_length=8)),
+                ('scope', models.CharField(choices=[('all', 'All articles'), ('category', 'Category'), ('tag', 'Tag')], default='all', max_length=10)),
+                ('scope_id', models.PositiveIntegerField(default=0)),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('score', models.FloatField()),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trending', to='articles.article')),
+            ],
+            options={
+                'db_table': 'trending_articles',
+                'ordering': ['window', 'scope', 'scope_id', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('window', 'scope', 'scope_id', 'rank'), name='trending_articles_rank_unique')],
+            },
+        ),
+    ]
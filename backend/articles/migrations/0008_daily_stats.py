@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-19 02:11
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0007_trending'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleEvent',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('kind', models.CharField(choices=[('view', 'View'), ('like', 'Like'), ('dislike', 'Dislike'), ('bookmark', 'Bookmark'), ('comment', 'Comment')], max_length=10)),
+                ('viewer', models.CharField(blank=True, max_length=32)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('article', models.ForeignKey(db_constraint=False, db_index=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='articles.article')),
+            ],
+            options={
+                'db_table': 'article_events',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArticleDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('unique_viewers', models.PositiveIntegerField(default=0)),
+                ('likes', models.PositiveIntegerField(default=0)),
+                ('dislikes', models.PositiveIntegerField(default=0)),
+                ('bookmarks', models.PositiveIntegerField(default=0)),
+                ('comments', models.PositiveIntegerField(default=0)),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_stats', to='articles.article')),
+            ],
+            options={
+                'db_table': 'article_daily_stats',
+                'ordering': ['article', 'date'],
+                'indexes': [models.Index(fields=['date'], name='article_daily_stats_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('article', 'date'), name='article_daily_stats_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-19 02:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0008_daily_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleViewerSketch',
+            fields=[
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='viewer_sketch', serialize=False, to='articles.article')),
+                ('sketch', models.BinaryField(default=b'')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'article_viewer_sketches',
+                'ordering': ['article'],
+            },
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='unique_viewers',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='articledailystats',
+            name='viewer_sketch',
+            field=models.BinaryField(blank=True, default=b''),
+        ),
+    ]
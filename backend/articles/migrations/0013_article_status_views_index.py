@@ -0,0 +1,21 @@
+# Generated by Django 5.2 on 2026-10-19 02:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0012_article_drafts'),
+        ('categories', '0001_initial'),
+        ('tags', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['status', '-views'], name='articles_status_views_idx'),
+        ),
+    ]
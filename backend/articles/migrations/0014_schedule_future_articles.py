@@ -0,0 +1,50 @@
+from django.db import migrations
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+
+def _refresh_published_stats(apps, author_ids):
+    Article = apps.get_model('articles', 'Article')
+    AuthorStats = apps.get_model('users', 'AuthorStats')
+    totals = {
+        row['author_id']: row
+        for row in Article.objects.filter(author_id__in=author_ids).order_by()
+        .values('author_id').annotate(
+            published_count=Count('id', filter=Q(status='published')),
+            last_published_at=Max('publish_date', filter=Q(status='published')),
+        )
+    }
+    for author_id in author_ids:
+        row = totals.get(author_id, {'published_count': 0, 'last_published_at': None})
+        AuthorStats.objects.filter(user_id=author_id).update(
+            published_count=row['published_count'], last_published_at=row['last_published_at'])
+
+
+def schedule_future_articles(apps, schema_editor):
+    # Published before 'scheduled' existed but dated in the future: hide them
+    # until publish_due releases them, like articles published since.
+    Article = apps.get_model('articles', 'Article')
+    future = Article.objects.filter(status='published', publish_date__gt=timezone.now())
+    author_ids = set(future.values_list('author_id', flat=True))
+    future.update(status='scheduled')
+    _refresh_published_stats(apps, author_ids)
+
+
+def unschedule_articles(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    scheduled = Article.objects.filter(status='scheduled')
+    author_ids = set(scheduled.values_list('author_id', flat=True))
+    scheduled.update(status='published')
+    _refresh_published_stats(apps, author_ids)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('articles', '0013_article_status_views_index'),
+        ('users', '0002_authorstats'),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_future_articles, unschedule_articles),
+    ]
@@ -1,22 +1,32 @@
-from django.db import models
+import heapq
+import math
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models import F
+from django.utils import timezone
 from django.utils.text import slugify
-from users.models import User
+from users.models import AuthorStats, User
 from categories.models import Category
 from tags.models import Tag
-from core.utils import compress_image, generate_unique_slug
+from core.async_views import invalidate_cached_reads
+from core.utils import compress_image, save_with_unique_slug
+from .content import content_hash, process_content
 
 
 class Article(models.Model):
     STATUS_CHOICES = (
         ('draft', 'Draft'),
         ('pending', 'Pending'),
+        # Published by the publish_scheduled worker once publish_date passes.
+        ('scheduled', 'Scheduled'),
         ('published', 'Published'),
         ('archived', 'Archived'),
     )
 
     title = models.CharField(max_length=255)
     slug = models.SlugField(max_length=255, unique=True)
-    excerpt = models.TextField()
+    excerpt = models.TextField(blank=True)
     content = models.TextField()
     featured_image = models.ImageField(
         upload_to='articles/', blank=True, null=True)
@@ -31,23 +41,74 @@ class Article(models.Model):
     tags = models.ManyToManyField(Tag, related_name='articles')
     featured = models.BooleanField(default=False)
     views = models.PositiveIntegerField(default=0)
+    # Approximate distinct readers, maintained from ArticleViewerSketch.
+    unique_viewers = models.PositiveIntegerField(default=0)
     reading_time = models.PositiveIntegerField(default=0)
+    # Derived from content by process_content() whenever content changes.
+    word_count = models.PositiveIntegerField(default=0)
+    toc = models.JSONField(default=list, blank=True)
+    # Sanitized HTML served to readers, and content_hash() of the source it
+    # was rendered from.
+    content_html = models.TextField(blank=True)
+    content_hash = models.CharField(max_length=64, blank=True)
 
     class Meta:
         ordering = ['-publish_date', '-created_at']
         db_table = 'articles'
+        indexes = [
+            models.Index(fields=['author', 'status'], name='articles_author_status_idx'),
+            models.Index(fields=['status', 'publish_date'], name='articles_status_pubdate_idx'),
+            models.Index(fields=['status', '-views'], name='articles_status_views_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._stats_state = instance._author_stats_state()
+        instance._processed_content = instance.__dict__.get('content')
+        return instance
+
+    def _author_stats_state(self):
+        # Deferred fields are left out rather than loaded just for this check.
+        deferred = self.get_deferred_fields()
+        return tuple(
+            None if name in deferred else getattr(self, name)
+            for name in ('author_id', 'status', 'publish_date'))
+
+    def _content_changed(self):
+        if 'content' in self.get_deferred_fields():
+            return False
+        return self.content != getattr(self, '_processed_content', None)
+
+    def apply_content_summary(self):
+        """Recompute the fields derived from content; returns their names."""
+        summary = process_content(self.content)
+        self.word_count = summary.word_count
+        self.reading_time = summary.reading_time
+        self.toc = summary.toc
+        self.content_html = summary.html
+        self.content_hash = content_hash(self.content)
+        fields = ['word_count', 'reading_time', 'toc', 'content_html', 'content_hash']
+        if not self.excerpt.strip():
+            self.excerpt = summary.excerpt
+            fields.append('excerpt')
+        return fields
+
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = generate_unique_slug(self, 'title')
+        # Publishing with a future date schedules the article instead, so
+        # listings can keep filtering on status alone.
+        if self.status == 'published' and self.publish_date and self.publish_date > timezone.now():
+            self.status = 'scheduled'
 
-        if self.content:
-            words_per_minute = 200
-            word_count = len(self.content.split())
-            self.reading_time = max(1, round(word_count / words_per_minute))
+        # Only parse the body when it changed, not on every save (views, status, ...).
+        update_fields = kwargs.get('update_fields')
+        if self._content_changed() and (update_fields is None or 'content' in update_fields):
+            derived = self.apply_content_summary()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, *derived}
 
         if self.featured_image:
             try:
@@ -55,7 +116,43 @@ class Article(models.Model):
             except Exception:
                 pass
 
-        super().save(*args, **kwargs)
+        save_with_unique_slug(self, 'title', super().save, *args, **kwargs)
+        self._processed_content = self.__dict__.get('content')
+
+        previous = getattr(self, '_stats_state', None)
+        current = self._author_stats_state()
+        if previous != current:
+            authors = {self.author_id}
+            if previous and previous[0] is not None:
+                authors.add(previous[0])
+            AuthorStats.refresh(*authors)
+            # Status and publish date decide whether (and how high) the
+            # article appears in other articles' related lists. New articles
+            # are picked up when their tags and categories are set.
+            if previous is not None and previous[1:] != current[1:]:
+                RelatedArticle.update(self.pk)
+            self._stats_state = current
+        invalidate_cached_reads('articles')
+
+    def delete(self, *args, **kwargs):
+        author_id = self.author_id
+        referencing = list(self.neighbor_of.values_list('article_id', flat=True))
+        result = super().delete(*args, **kwargs)
+        AuthorStats.refresh(author_id)
+        RelatedArticle.refresh(*referencing)
+        invalidate_cached_reads('articles')
+        return result
+
+    def record_view(self, viewer=''):
+        """
+        Count one view on the article without a read-modify-write, and
+        buffer it as an event. ``viewer`` (see articles.analytics.viewer_key)
+        feeds the unique-viewer counts. The author's total, the trending
+        counters and the daily rollups are updated from the buffer by
+        compact_article_events.
+        """
+        Article.objects.filter(pk=self.pk).update(views=F('views') + 1)
+        ArticleEvent.record(self.pk, 'view', viewer)
 
     @property
     def like_count(self):
@@ -76,6 +173,339 @@ class Article(models.Model):
             return None
 
 
+# Related-article scoring: a shared tag is worth more the fewer articles use
+# it, a shared category is worth a flat amount, and recency adds a bonus that
+# halves every RELATED_HALF_LIFE_DAYS.
+RELATED_TAG_WEIGHT = 3.0
+RELATED_CATEGORY_WEIGHT = 1.0
+RELATED_RECENCY_WEIGHT = 1.0
+RELATED_HALF_LIFE_DAYS = 180
+RELATED_LIMIT = 10
+
+
+class RelatedArticle(models.Model):
+    """
+    Precomputed neighbor list: the RELATED_LIMIT best published matches for
+    each article, so the related endpoint is an indexed lookup instead of a
+    join over the taxonomy tables. Kept current when an article's tags,
+    categories, status or publish date change; rebuild_related_articles
+    recomputes every list.
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='neighbors')
+    related = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='neighbor_of')
+    score = models.FloatField()
+
+    class Meta:
+        db_table = 'related_articles'
+        ordering = ['article', '-score']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'related'], name='related_articles_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['related'], name='related_articles_related_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.article_id} -> {self.related_id} ({self.score:.2f})'
+
+    @staticmethod
+    def compute(article_ids):
+        """Score and rank the published neighbors of each article, keyed by article id."""
+        tag_links = Article.tags.through.objects
+        category_links = Article.categories.through.objects
+        source_tags, source_categories = defaultdict(set), defaultdict(set)
+        for article_id, tag_id in tag_links.filter(
+                article_id__in=article_ids).values_list('article_id', 'tag_id'):
+            source_tags[article_id].add(tag_id)
+        for article_id, category_id in category_links.filter(
+                article_id__in=article_ids).values_list('article_id', 'category_id'):
+            source_categories[article_id].add(category_id)
+
+        # Every published article sharing a term with any source, with its
+        # publish date from the same join.
+        publish_dates = {}
+        tag_members, category_members = defaultdict(list), defaultdict(list)
+        for links, column, terms, members in (
+            (tag_links, 'tag_id', set().union(*source_tags.values()), tag_members),
+            (category_links, 'category_id', set().union(*source_categories.values()), category_members),
+        ):
+            rows = links.filter(**{f'{column}__in': terms}, article__status='published').values_list(
+                column, 'article_id', 'article__publish_date')
+            for term_id, article_id, publish_date in rows:
+                members[term_id].append(article_id)
+                publish_dates[article_id] = publish_date
+        tag_weights = {
+            tag_id: RELATED_TAG_WEIGHT / math.log2(1 + len(members))
+            for tag_id, members in tag_members.items()
+        }
+
+        now = timezone.now()
+        recency = {
+            article_id: RELATED_RECENCY_WEIGHT * 0.5 ** (
+                max((now - publish_date).days, 0) / RELATED_HALF_LIFE_DAYS)
+            if publish_date else 0.0
+            for article_id, publish_date in publish_dates.items()
+        }
+
+        neighbors = {}
+        for article_id in article_ids:
+            scores = defaultdict(float)
+            for tag_id in source_tags[article_id]:
+                for other_id in tag_members[tag_id]:
+                    scores[other_id] += tag_weights[tag_id]
+            for category_id in source_categories[article_id]:
+                for other_id in category_members[category_id]:
+                    scores[other_id] += RELATED_CATEGORY_WEIGHT
+            scores.pop(article_id, None)
+            neighbors[article_id] = heapq.nlargest(
+                RELATED_LIMIT,
+                ((other_id, score + recency[other_id]) for other_id, score in scores.items()),
+                key=lambda item: (item[1], item[0]),
+            )
+        return neighbors
+
+    @classmethod
+    def store(cls, neighbors):
+        """Replace the stored lists for the articles in ``neighbors``."""
+        with transaction.atomic():
+            cls.objects.filter(article_id__in=neighbors.keys()).delete()
+            cls.objects.bulk_create([
+                cls(article_id=article_id, related_id=related_id, score=round(score, 4))
+                for article_id, ranked in neighbors.items()
+                for related_id, score in ranked
+            ])
+
+    @classmethod
+    def refresh(cls, *article_ids):
+        """Recompute the given articles' own lists."""
+        if article_ids:
+            cls.store(cls.compute(article_ids))
+
+    @classmethod
+    def update(cls, *article_ids):
+        """
+        Recompute after the given articles' taxonomy or status changed: their
+        own lists, the lists that currently include them, and the lists of
+        their new neighbors, which may now rank them.
+        """
+        if not article_ids:
+            return
+        neighbors = cls.compute(article_ids)
+        affected = set(cls.objects.filter(related_id__in=article_ids).values_list(
+            'article_id', flat=True))
+        affected.update(related_id for ranked in neighbors.values() for related_id, _ in ranked)
+        affected.difference_update(article_ids)
+        if affected:
+            neighbors.update(cls.compute(list(affected)))
+        cls.store(neighbors)
+
+
+class ArticleActivity(models.Model):
+    """
+    Hourly view and like counters per article, the input to the trending
+    ranking (articles.trending). Filled from ArticleEvent by
+    compact_article_events; likes count the likes given in the hour, and
+    withdrawals are not subtracted.
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='activity')
+    bucket = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    likes = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'article_activity'
+        ordering = ['-bucket']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'bucket'], name='article_activity_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['bucket'], name='article_activity_bucket_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.article_id} @ {self.bucket:%Y-%m-%d %H:00}: {self.views} views, {self.likes} likes'
+
+
+class TrendingArticle(models.Model):
+    """
+    Precomputed trending ranking per window, globally (scope 'all',
+    scope_id 0) and per category and tag. Replaced wholesale by
+    compute_trending.
+    """
+    SCOPE_CHOICES = (
+        ('all', 'All articles'),
+        ('category', 'Category'),
+        ('tag', 'Tag'),
+    )
+
+    window = models.CharField(max_length=8)
+    scope = models.CharField(max_length=10, choices=SCOPE_CHOICES, default='all')
+    scope_id = models.PositiveIntegerField(default=0)
+    rank = models.PositiveSmallIntegerField()
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='trending')
+    score = models.FloatField()
+
+    class Meta:
+        db_table = 'trending_articles'
+        ordering = ['window', 'scope', 'scope_id', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['window', 'scope', 'scope_id', 'rank'],
+                                    name='trending_articles_rank_unique'),
+        ]
+
+    def __str__(self):
+        return f'{self.window} {self.scope}:{self.scope_id} #{self.rank} {self.article_id}'
+
+
+class ArticleEvent(models.Model):
+    """
+    Append-only buffer of reader activity (views, reactions, bookmarks,
+    comments). Writers only ever insert; compact_article_events folds the
+    rows into ArticleDailyStats and deletes them. There is no foreign key
+    constraint or index on article so inserts stay cheap and deleting an
+    article doesn't scan the buffer; events of deleted articles are dropped
+    during compaction.
+    """
+    KIND_CHOICES = (
+        ('view', 'View'),
+        ('like', 'Like'),
+        ('dislike', 'Dislike'),
+        ('bookmark', 'Bookmark'),
+        ('comment', 'Comment'),
+    )
+
+    id = models.BigAutoField(primary_key=True)
+    article = models.ForeignKey(
+        Article, on_delete=models.DO_NOTHING, db_constraint=False, db_index=False,
+        related_name='+')
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    viewer = models.CharField(max_length=32, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'article_events'
+        ordering = ['id']
+
+    def __str__(self):
+        return f'{self.kind} on {self.article_id} at {self.created_at}'
+
+    @classmethod
+    def record(cls, article_id, kind, viewer=''):
+        cls.objects.create(article_id=article_id, kind=kind, viewer=viewer)
+
+
+class ArticleDailyStats(models.Model):
+    """
+    Per-article, per-day totals compacted from ArticleEvent, so analytics
+    charts read a date range of small rows instead of aggregating events.
+    Reactions, bookmarks and comments count the ones made that day;
+    withdrawals are not subtracted. Unique viewers are a HyperLogLog
+    estimate, so sketches of several days merge into a period total.
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='daily_stats')
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+    unique_viewers = models.PositiveIntegerField(default=0)
+    # HyperLogLog of the day's viewer keys (core.hll), merged on each compaction.
+    viewer_sketch = models.BinaryField(default=b'', blank=True)
+    likes = models.PositiveIntegerField(default=0)
+    dislikes = models.PositiveIntegerField(default=0)
+    bookmarks = models.PositiveIntegerField(default=0)
+    comments = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'article_daily_stats'
+        ordering = ['article', 'date']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'date'], name='article_daily_stats_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['date'], name='article_daily_stats_date_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.article_id} on {self.date}: {self.views} views'
+
+
+class ArticleViewerSketch(models.Model):
+    """
+    Lifetime HyperLogLog of an article's viewer keys, kept apart from the
+    article row so listings don't load it. Its estimate is copied to
+    Article.unique_viewers whenever compaction merges new viewers in.
+    """
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, primary_key=True, related_name='viewer_sketch')
+    sketch = models.BinaryField(default=b'')
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'article_viewer_sketches'
+        ordering = ['article']
+
+    def __str__(self):
+        return f'Viewer sketch for {self.article_id}'
+
+
+class ArticleRevision(models.Model):
+    """
+    One saved version of an article's title, excerpt and content. Content
+    is stored as a delta against the previous revision, with a full
+    snapshot every SNAPSHOT_INTERVAL revisions (or when the delta would be
+    about as large as the text), so storage grows with the size of edits
+    and rebuilding any revision applies a bounded number of deltas. See
+    articles.revisions.
+    """
+    article = models.ForeignKey(Article, on_delete=models.CASCADE, related_name='revisions')
+    number = models.PositiveIntegerField()
+    author = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    title = models.CharField(max_length=255)
+    excerpt = models.TextField(blank=True)
+    is_snapshot = models.BooleanField(default=False)
+    # Full content for snapshots, a JSON delta otherwise.
+    data = models.TextField()
+    # Length of the reconstructed content.
+    size = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'article_revisions'
+        ordering = ['article', '-number']
+        constraints = [
+            models.UniqueConstraint(fields=['article', 'number'], name='article_revisions_unique'),
+        ]
+
+    def __str__(self):
+        return f'{self.article_id} r{self.number}'
+
+
+class ArticleDraft(models.Model):
+    """
+    Server-held autosave buffer for an article being edited, kept apart
+    from the article row so autosaves don't rewrite it (or re-run content
+    processing and image compression). Clients send small patches with the
+    version they last saw; a stale version is rejected instead of silently
+    overwriting another tab's edits. Committing copies the buffer onto the
+    article. See articles.drafts.
+    """
+    article = models.OneToOneField(
+        Article, on_delete=models.CASCADE, primary_key=True, related_name='draft')
+    title = models.CharField(max_length=255)
+    excerpt = models.TextField(blank=True)
+    content = models.TextField(blank=True)
+    version = models.PositiveIntegerField(default=1)
+    updated_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'article_drafts'
+        ordering = ['-updated_at']
+
+    def __str__(self):
+        return f'Draft of {self.article_id} v{self.version}'
+
+
 class ArticleLike(models.Model):
     """Model to track likes and dislikes for articles"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='article_likes')
@@ -91,6 +521,28 @@ class ArticleLike(models.Model):
         reaction = 'liked' if self.is_like else 'disliked'
         return f'{self.user.name} {reaction} {self.article.title}'
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._saved_is_like = instance.__dict__.get('is_like')
+        return instance
+
+    def save(self, *args, **kwargs):
+        previous = getattr(self, '_saved_is_like', None)
+        super().save(*args, **kwargs)
+        delta = int(bool(self.is_like)) - int(bool(previous))
+        if delta:
+            AuthorStats.add(self.article.author_id, total_likes=delta)
+        if self.is_like != previous:
+            ArticleEvent.record(self.article_id, 'like' if self.is_like else 'dislike')
+        self._saved_is_like = self.is_like
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        if self.is_like:
+            AuthorStats.add(self.article.author_id, total_likes=-1)
+        return result
+
 
 class BookmarkedArticle(models.Model):
     """Model to track bookmarked articles for users"""
@@ -104,3 +556,9 @@ class BookmarkedArticle(models.Model):
 
     def __str__(self):
         return f'{self.user.name} bookmarked {self.article.title}'
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            ArticleEvent.record(self.article_id, 'bookmark')
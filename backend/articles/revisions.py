@@ -0,0 +1,141 @@
+import difflib
+import json
+import re
+
+from django.db import transaction
+
+from .models import Article, ArticleRevision
+
+# A full copy of the content at least every this many revisions, so
+# rebuilding one applies at most SNAPSHOT_INTERVAL - 1 deltas.
+SNAPSHOT_INTERVAL = 20
+# Store a snapshot instead when the delta is over this share of the text.
+SNAPSHOT_RATIO = 0.5
+# Diff units end at a newline, a closing '>' or a sentence break, so edits
+# to long single-line HTML bodies still produce small deltas.
+_TOKEN_SPLIT = re.compile(r'(?<=\n)|(?<=>)|(?<=[.!?] )')
+
+
+def _tokens(text):
+    return [token for token in _TOKEN_SPLIT.split(text) if token]
+
+
+def make_delta(old, new):
+    """
+    Delta turning ``old`` into ``new``: a list where a positive int copies
+    that many tokens of ``old``, a negative int skips that many, and a
+    string is inserted as is.
+    """
+    old_tokens, new_tokens = _tokens(old), _tokens(new)
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == 'equal':
+            ops.append(i2 - i1)
+            continue
+        if i2 > i1:
+            ops.append(i1 - i2)
+        if j2 > j1:
+            ops.append(''.join(new_tokens[j1:j2]))
+    return ops
+
+
+def apply_delta(old, ops):
+    old_tokens = _tokens(old)
+    position = 0
+    parts = []
+    for op in ops:
+        if isinstance(op, str):
+            parts.append(op)
+        elif op > 0:
+            parts.extend(old_tokens[position:position + op])
+            position += op
+        else:
+            position -= op
+    return ''.join(parts)
+
+
+def revision_content(article_id, number):
+    """
+    Rebuild the content of revision ``number``: the nearest snapshot at or
+    before it plus the deltas after that, read in one query.
+    Raises ArticleRevision.DoesNotExist for unknown revisions.
+    """
+    snapshot = (
+        ArticleRevision.objects.filter(article_id=article_id, number__lte=number, is_snapshot=True)
+        .order_by('-number').values_list('number', flat=True).first()
+    )
+    revisions = list(
+        ArticleRevision.objects.filter(
+            article_id=article_id, number__gte=snapshot or 0, number__lte=number)
+        .order_by('number').values_list('number', 'is_snapshot', 'data')
+    )
+    if snapshot is None or not revisions or revisions[-1][0] != number:
+        raise ArticleRevision.DoesNotExist(f'Article {article_id} has no revision {number}')
+    content = ''
+    for _number, is_snapshot, data in revisions:
+        content = data if is_snapshot else apply_delta(content, json.loads(data))
+    return content
+
+
+def record_revision(article, user, previous=None):
+    """
+    Save the article's current title, excerpt and content as its next
+    revision, unless they match the latest one. ``previous`` is the
+    (title, excerpt, content) before the edit; for an article without
+    history it is stored first, so the version being replaced can be
+    restored. Returns the new revision, or None when nothing changed.
+    """
+    with transaction.atomic():
+        # Serializes numbering between concurrent edits of one article.
+        Article.objects.select_for_update().filter(pk=article.pk).values_list('pk').first()
+        latest = article.revisions.order_by('-number').first()
+        if latest is None and previous is not None and previous != (
+                article.title, article.excerpt, article.content):
+            latest = _store(article.pk, 1, user=None, fields=previous, base=None)
+
+        fields = (article.title, article.excerpt, article.content)
+        if latest is None:
+            return _store(article.pk, 1, user, fields, base=None)
+        base = revision_content(article.pk, latest.number)
+        if (latest.title, latest.excerpt, base) == fields:
+            return None
+        last_snapshot = (
+            article.revisions.filter(is_snapshot=True)
+            .order_by('-number').values_list('number', flat=True).first()
+        )
+        number = latest.number + 1
+        if number - last_snapshot >= SNAPSHOT_INTERVAL:
+            base = None
+        return _store(article.pk, number, user, fields, base)
+
+
+def _store(article_id, number, user, fields, base):
+    title, excerpt, content = fields
+    data, is_snapshot = content, True
+    if base is not None:
+        delta = json.dumps(make_delta(base, content), separators=(',', ':'))
+        if len(delta) <= SNAPSHOT_RATIO * len(content):
+            data, is_snapshot = delta, False
+    return ArticleRevision.objects.create(
+        article_id=article_id, number=number, author=user, title=title,
+        excerpt=excerpt, is_snapshot=is_snapshot, data=data, size=len(content))
+
+
+def unified_diff(article_id, from_number, to_number):
+    """Line diff between two revisions' title and content, as a list of lines."""
+    revisions = {
+        revision.number: revision
+        for revision in ArticleRevision.objects.filter(
+            article_id=article_id, number__in=[from_number, to_number])
+    }
+    for number in (from_number, to_number):
+        if number not in revisions:
+            raise ArticleRevision.DoesNotExist(f'Article {article_id} has no revision {number}')
+    old, new = (
+        f'{revisions[number].title}\n\n{revision_content(article_id, number)}'
+        for number in (from_number, to_number)
+    )
+    return list(difflib.unified_diff(
+        old.splitlines(), new.splitlines(),
+        fromfile=f'r{from_number}', tofile=f'r{to_number}', lineterm=''))
@@ -0,0 +1,55 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from core.async_views import invalidate_cached_reads
+from core.utils import log_action
+from subscribers.campaigns import create_articles_campaign
+from users.models import AuthorStats
+from .models import Article, RelatedArticle
+
+
+def publish_due(batch_size=100, now=None):
+    """
+    Publish scheduled articles whose publish_date has passed, oldest first,
+    one locked batch per transaction (an index range on status/publish_date).
+    Side effects Article.save() would have run are applied per batch, and
+    subscribers are notified with one campaign per run when
+    SCHEDULED_PUBLISH_NOTIFY is on. Returns the published articles' ids.
+    """
+    now = now or timezone.now()
+    published = []
+    while True:
+        with transaction.atomic():
+            rows = list(
+                Article.objects.select_for_update(skip_locked=True)
+                .filter(status='scheduled', publish_date__lte=now)
+                .order_by('publish_date')
+                .values_list('id', 'author_id')[:batch_size]
+            )
+            if not rows:
+                break
+            ids = [article_id for article_id, _author_id in rows]
+            Article.objects.filter(id__in=ids).update(status='published', last_modified=now)
+
+        AuthorStats.refresh(*{author_id for _article_id, author_id in rows})
+        RelatedArticle.update(*ids)
+        published.extend(ids)
+        if len(rows) < batch_size:
+            break
+
+    if published:
+        invalidate_cached_reads('articles')
+        if settings.SCHEDULED_PUBLISH_NOTIFY:
+            notify_subscribers(published)
+        log_action('scheduled_articles_published', None, f'Article IDs: {published}')
+    return published
+
+
+def notify_subscribers(article_ids):
+    """Queue a newsletter campaign for the given articles; send_newsletter delivers it."""
+    articles = list(
+        Article.objects.filter(id__in=article_ids, status='published')
+        .select_related('author').order_by('-publish_date')[:20]
+    )
+    return create_articles_campaign(articles)
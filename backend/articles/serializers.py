@@ -1,6 +1,6 @@
 from rest_framework import serializers
-from .models import Article
-from users.serializers import UserSerializer
+from .models import Article, ArticleRevision
+from users.serializers import BasicUserSerializer, UserSerializer
 from categories.serializers import CategorySerializer
 from tags.serializers import TagSerializer
 from django.utils import timezone
@@ -18,9 +18,9 @@ class ArticleListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'slug', 'excerpt', 'featured_image',
             'publish_date', 'author', 'author_detail', 'categories_detail',
-            'featured', 'views', 'reading_time'
+            'featured', 'views', 'unique_viewers', 'reading_time'
         ]
-        read_only_fields = ['id', 'slug', 'views', 'reading_time']
+        read_only_fields = ['id', 'slug', 'views', 'unique_viewers', 'reading_time']
 
 
 class ArticleSerializer(serializers.ModelSerializer):
@@ -53,11 +53,13 @@ class ArticleSerializer(serializers.ModelSerializer):
             'id', 'title', 'slug', 'excerpt', 'content', 'featured_image',
             'status', 'publish_date', 'last_modified', 'created_at',
             'author', 'author_detail', 'categories_detail', 'tags_detail',
-            'category_ids', 'tag_ids', 'featured', 'views', 'reading_time',
-            'like_count', 'dislike_count', 'user_reaction', 'is_bookmarked'
+            'category_ids', 'tag_ids', 'featured', 'views', 'unique_viewers', 'reading_time',
+            'word_count', 'toc', 'like_count', 'dislike_count', 'user_reaction',
+            'is_bookmarked'
         ]
         read_only_fields = ['id', 'slug', 'last_modified', 'created_at',
-                            'views', 'reading_time', 'author']
+                            'views', 'unique_viewers', 'reading_time', 'word_count', 'toc',
+                            'author']
 
     def get_user_reaction(self, obj):
         request = self.context.get('request')
@@ -89,6 +91,14 @@ class ArticleSerializer(serializers.ModelSerializer):
                 "Content must be at least 100 characters long.")
         return value.strip()
 
+    def validate(self, attrs):
+        status = attrs.get('status', getattr(self.instance, 'status', None))
+        publish_date = attrs.get('publish_date', getattr(self.instance, 'publish_date', None))
+        if status == 'scheduled' and not publish_date:
+            raise serializers.ValidationError(
+                {'publish_date': 'A scheduled article needs a publish date.'})
+        return attrs
+
     def create(self, validated_data):
         category_ids = validated_data.pop('categories', [])
         tag_ids = validated_data.pop('tags', [])
@@ -115,3 +125,26 @@ class ArticleSerializer(serializers.ModelSerializer):
             validated_data['publish_date'] = timezone.now()
 
         return super().update(instance, validated_data)
+
+
+class ArticleDetailSerializer(ArticleSerializer):
+    """ArticleSerializer plus the pre-rendered body, for single-article responses."""
+
+    class Meta(ArticleSerializer.Meta):
+        fields = ArticleSerializer.Meta.fields + ['content_html']
+        read_only_fields = ArticleSerializer.Meta.read_only_fields + ['content_html']
+
+
+class ArticleRevisionSerializer(serializers.ModelSerializer):
+    """Revision metadata; content is rebuilt on demand by the revision detail view."""
+    author_detail = BasicUserSerializer(source='author', read_only=True)
+    stored_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ArticleRevision
+        fields = ['number', 'title', 'excerpt', 'author_detail', 'created_at',
+                  'is_snapshot', 'size', 'stored_size']
+        read_only_fields = fields
+
+    def get_stored_size(self, obj):
+        return len(obj.data)
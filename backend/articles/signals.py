@@ -0,0 +1,27 @@
+from django.db.models.signals import m2m_changed
+from django.dispatch import receiver
+
+from core.async_views import invalidate_cached_reads
+from .models import Article, RelatedArticle
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+@receiver(m2m_changed, sender=Article.categories.through)
+def update_related_articles(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Re-rank related articles when an article's tags or categories change,
+    and drop cached article payloads, which embed them.
+    """
+    if action == 'pre_clear' and reverse:
+        # tag.articles.clear() reports no pk_set, so note the articles first.
+        instance._cleared_article_ids = list(instance.articles.values_list('id', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    invalidate_cached_reads('articles')
+    if not reverse:
+        RelatedArticle.update(instance.pk)
+    else:
+        # e.g. tag.articles.add(...): the changed articles are in pk_set.
+        article_ids = pk_set or getattr(instance, '_cleared_article_ids', ())
+        RelatedArticle.update(*article_ids)
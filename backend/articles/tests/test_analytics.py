@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from articles.analytics import compact_events
+from articles.models import Article, ArticleActivity, ArticleDailyStats, ArticleEvent, ArticleLike
+from users.models import AuthorStats, User
+
+
+class EventCompactionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(email='author@example.com', name='Author')
+        cls.reader = User.objects.create(email='reader@example.com', name='Reader')
+        cls.article = Article.objects.create(
+            title='Counted article', author=cls.author, status='published', content='<p>Body</p>')
+
+    def test_view_is_one_update_and_one_insert(self):
+        with self.assertNumQueries(2):
+            self.article.record_view('u1')
+
+        self.assertEqual(Article.objects.get(pk=self.article.pk).views, 1)
+        self.assertEqual(ArticleEvent.objects.count(), 1)
+        self.assertFalse(ArticleActivity.objects.exists())
+
+    def test_compaction_fills_hourly_buckets_and_author_totals(self):
+        AuthorStats.refresh(self.author.pk)
+        hour = timezone.now().replace(minute=0, second=0, microsecond=0)
+        ArticleEvent.objects.create(
+            article=self.article, kind='view', viewer='u9', created_at=hour - timedelta(minutes=30))
+        Article.objects.filter(pk=self.article.pk).update(views=1)
+        self.article.record_view('u1')
+        self.article.record_view('u2')
+        ArticleLike.objects.create(user=self.reader, article=self.article, is_like=True)
+
+        self.assertEqual(compact_events(), 4)
+
+        buckets = {row.bucket: (row.views, row.likes) for row in ArticleActivity.objects.all()}
+        self.assertEqual(buckets, {hour - timedelta(hours=1): (1, 0), hour: (2, 1)})
+        self.assertEqual(AuthorStats.objects.get(pk=self.author.pk).total_views, 3)
+        self.assertEqual(sum(ArticleDailyStats.objects.values_list('views', flat=True)), 3)
+        self.assertFalse(ArticleEvent.objects.exists())
+
+        # A later batch adds to the existing bucket.
+        self.article.record_view('u3')
+        compact_events()
+        self.assertEqual(ArticleActivity.objects.get(bucket=hour).views, 3)
+
+    def test_refresh_before_compaction_does_not_double_count_views(self):
+        AuthorStats.refresh(self.author.pk)
+        for viewer in ('u1', 'u2', 'u3', 'u4', 'u5'):
+            self.article.record_view(viewer)
+        # Publishing another article refreshes the author's row.
+        Article.objects.create(title='Second article', author=self.author, status='published',
+                               content='<p>Body</p>')
+        self.assertEqual(AuthorStats.objects.get(pk=self.author.pk).total_views, 0)
+
+        compact_events()
+
+        self.assertEqual(AuthorStats.objects.get(pk=self.author.pk).total_views, 5)
+
+    def test_compaction_creates_missing_author_row_once(self):
+        self.article.record_view('u1')
+        self.article.record_view('u2')
+        AuthorStats.objects.filter(pk=self.author.pk).delete()
+
+        compact_events()
+
+        self.assertEqual(AuthorStats.objects.get(pk=self.author.pk).total_views, 2)
@@ -0,0 +1,121 @@
+from django.test import SimpleTestCase
+
+from articles.content import EXCERPT_LENGTH, process_content
+
+
+def render(html):
+    return process_content(html).html
+
+
+class SanitizerTests(SimpleTestCase):
+    def test_dangerous_elements_are_dropped_with_their_content(self):
+        html = ('<p>Before</p><script>alert(1)</script><style>p{color:red}</style>'
+                '<iframe src="https://evil.example"></iframe><svg><script>x</script></svg>'
+                '<noscript><img src=x></noscript><p>After</p>')
+
+        self.assertEqual(render(html), '<p>Before</p><p>After</p>')
+
+    def test_unknown_tags_keep_their_text(self):
+        self.assertEqual(render('<custom-box><font>kept</font></custom-box>'), 'kept')
+
+    def test_unsafe_urls_are_removed(self):
+        for href in ('javascript:alert(1)', ' JAVASCRIPT:alert(1)', 'java\tscript:alert(1)',
+                     'jav&#x61;script:alert(1)', '&#106;avascript:alert(1)',
+                     'javascript&colon;alert(1)', '&#x0A;javascript:alert(1)',
+                     '\x01javascript:alert(1)', 'vbscript:msgbox(1)',
+                     'data:text/html;base64,PHNjcmlwdD4='):
+            with self.subTest(href=href):
+                self.assertEqual(render(f'<a href="{href}">x</a>'), '<a>x</a>')
+
+    def test_images_need_a_safe_src(self):
+        self.assertEqual(render('<img src="javascript:alert(1)">'), '')
+        self.assertEqual(render('<img src="data:text/html;base64,PHNjcmlwdD4=">'), '')
+        self.assertEqual(
+            render('<img src="data:image/png;base64,iVBOR" alt="Dot" onerror="alert(1)">'),
+            '<img src="data:image/png;base64,iVBOR" alt="Dot" loading="lazy" decoding="async">')
+
+    def test_safe_urls_are_kept(self):
+        for href in ('https://example.com/a?b=1&c=2', '/relative/path', '#section',
+                     'mailto:editor@example.com'):
+            with self.subTest(href=href):
+                self.assertIn('href=', render(f'<a href="{href}">x</a>'))
+
+    def test_attribute_allowlist(self):
+        html = ('<a href="https://example.com" target="_blank" onclick="steal()" '
+                'style="color:red" class="link">x</a>')
+
+        self.assertEqual(
+            render(html),
+            '<a href="https://example.com" target="_blank" class="link" '
+            'rel="noopener noreferrer">x</a>')
+        self.assertEqual(render('<p onmouseover="x" title="T">y</p>'), '<p title="T">y</p>')
+
+    def test_attribute_values_are_escaped(self):
+        self.assertEqual(render('<p title="&quot;><script>">x</p>'),
+                         '<p title="&quot;&gt;&lt;script&gt;">x</p>')
+
+    def test_unbalanced_tags_are_closed_and_stray_ends_dropped(self):
+        self.assertEqual(render('<p>unclosed <b>bold <i>italic</p> after'),
+                         '<p>unclosed <b>bold <i>italic</i></b></p> after')
+        self.assertEqual(render('</div></p>text<b>'), 'text<b></b>')
+        # Misnested end tags close what is open inside them.
+        self.assertEqual(render('<b>bold<i>both</b>italic</i>'), '<b>bold<i>both</i></b>italic')
+
+    def test_text_is_escaped(self):
+        self.assertEqual(render('1 &lt; 2 &amp;&amp; <b>x</b>'), '1 &lt; 2 &amp;&amp; <b>x</b>')
+
+
+class HeadingAnchorTests(SimpleTestCase):
+    def test_headings_get_slug_anchors_and_a_toc(self):
+        summary = process_content('<h2>Getting Started</h2><p>x</p><h3>Café <em>setup</em></h3>')
+
+        self.assertEqual(summary.html, '<h2 id="getting-started">Getting Started</h2><p>x</p>'
+                                       '<h3 id="cafe-setup">Café <em>setup</em></h3>')
+        self.assertEqual(summary.toc, [
+            {'level': 2, 'text': 'Getting Started', 'id': 'getting-started'},
+            {'level': 3, 'text': 'Café setup', 'id': 'cafe-setup'},
+        ])
+
+    def test_colliding_anchors_are_numbered(self):
+        summary = process_content('<h2>Intro</h2><h2>Intro</h2><h2>intro</h2>')
+
+        self.assertEqual([entry['id'] for entry in summary.toc], ['intro', 'intro-2', 'intro-3'])
+
+    def test_user_ids_are_reused_and_deduplicated(self):
+        summary = process_content(
+            '<h2 id="intro-2">Custom</h2><h2>Intro</h2><h2>Intro</h2><h2 id="intro">Again</h2>')
+
+        self.assertEqual([entry['id'] for entry in summary.toc],
+                         ['intro-2', 'intro', 'intro-3', 'intro-4'])
+
+    def test_user_ids_are_escaped(self):
+        summary = process_content('<h2 id="x&quot; onmouseover=&quot;alert(1)">Title</h2>')
+
+        self.assertEqual(summary.html, '<h2 id="x&quot; onmouseover=&quot;alert(1)">Title</h2>')
+
+    def test_headings_without_text_get_no_anchor(self):
+        summary = process_content('<h2 id="empty"> </h2><h2>!!!</h2>')
+
+        self.assertEqual(summary.html, '<h2> </h2><h2 id="section">!!!</h2>')
+        self.assertEqual([entry['id'] for entry in summary.toc], ['section'])
+
+    def test_unclosed_heading_ends_at_the_next_heading(self):
+        summary = process_content('<h2>First<h2>Second</h2>')
+
+        self.assertEqual([entry['text'] for entry in summary.toc], ['First', 'Second'])
+
+
+class SummaryTests(SimpleTestCase):
+    def test_word_count_reading_time_and_excerpt(self):
+        summary = process_content('<h1>Title</h1><p>foo<b>bar</b> baz</p><script>a b c</script>'
+                                  + '<p>' + 'word ' * 400 + '</p>')
+
+        self.assertEqual(summary.word_count, 403)
+        self.assertEqual(summary.reading_time, 2)
+        self.assertTrue(summary.excerpt.startswith('foobar baz word'))
+        self.assertLessEqual(len(summary.excerpt), EXCERPT_LENGTH + 1)
+
+    def test_empty_content(self):
+        summary = process_content(None)
+
+        self.assertEqual((summary.word_count, summary.reading_time, summary.html), (0, 1, ''))
@@ -0,0 +1,129 @@
+from django.test import SimpleTestCase, TestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.drafts import MAX_DRAFT_LENGTH, apply_ops
+from articles.models import Article, ArticleDraft
+from articles.revisions import revision_content
+from users.models import User
+
+# Article content must be at least 100 characters long.
+BODY = '<p>' + 'The original body of the article. ' * 4 + '</p>'
+
+
+class ApplyOpsTests(SimpleTestCase):
+    def test_insert_delete_and_replace(self):
+        self.assertEqual(apply_ops('Hello world', [{'start': 5, 'text': ','}]), 'Hello, world')
+        self.assertEqual(apply_ops('Hello world', [{'start': 5, 'end': 11}]), 'Hello')
+        self.assertEqual(apply_ops('Hello world', [{'start': 6, 'end': 11, 'text': 'there'}]),
+                         'Hello there')
+
+    def test_ops_apply_in_sequence(self):
+        # The second op's offsets refer to the text after the first.
+        ops = [{'start': 0, 'end': 5, 'text': 'Hi'}, {'start': 2, 'text': ' there,'}]
+
+        self.assertEqual(apply_ops('Hello world', ops), 'Hi there, world')
+
+    def test_unicode_offsets_are_characters(self):
+        self.assertEqual(apply_ops('café ☕', [{'start': 4, 'end': 6, 'text': '!'}]), 'café!')
+
+    def test_invalid_ops(self):
+        for ops in ('not a list', ['not an op'], [{'end': 1}], [{'start': '0'}],
+                    [{'start': 0, 'text': 5}], [{'start': 3, 'end': 2}], [{'start': -1}],
+                    [{'start': 0, 'end': 12}], [{'start': 12}]):
+            with self.subTest(ops=ops), self.assertRaises(ValueError):
+                apply_ops('Hello world', ops)
+
+    def test_length_limit(self):
+        with self.assertRaises(ValueError):
+            apply_ops('', [{'start': 0, 'text': 'x' * (MAX_DRAFT_LENGTH + 1)}])
+
+
+class DraftViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(email='author@example.com', name='Author')
+        cls.other = User.objects.create(email='other@example.com', name='Other')
+        cls.article = Article.objects.create(
+            title='Drafted', author=cls.author, status='published', content=BODY)
+
+    def setUp(self):
+        self.url = f'/api/articles/{self.article.slug}/draft/'
+        self.auth = self.auth_for(self.author)
+
+    def auth_for(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+    def patch(self, data, auth=None):
+        return self.client.patch(self.url, data, content_type='application/json',
+                                 **(auth or self.auth))
+
+    def test_initial_state_is_the_article(self):
+        data = self.client.get(self.url, **self.auth).json()
+
+        self.assertEqual((data['version'], data['title'], data['content']), (0, 'Drafted', BODY))
+
+    def test_autosaves_apply_ops_and_bump_the_version(self):
+        first = self.patch({'version': 0, 'ops': [{'start': 0, 'text': '<h2>Intro</h2>'}]})
+        second = self.patch({'version': 1, 'title': 'Drafted, revised'})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()['length'], len(BODY) + 14)
+        self.assertEqual(second.json()['version'], 2)
+        draft = ArticleDraft.objects.get(article=self.article)
+        self.assertEqual((draft.version, draft.title), (2, 'Drafted, revised'))
+        self.assertEqual(draft.content, '<h2>Intro</h2>' + BODY)
+        # The article itself is untouched until the draft is committed.
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.title, self.article.content), ('Drafted', BODY))
+
+    def test_stale_version_conflicts(self):
+        self.patch({'version': 0, 'ops': [{'start': 0, 'text': 'A'}]})
+
+        response = self.patch({'version': 0, 'ops': [{'start': 0, 'text': 'B'}]})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.json()['version'], 1)
+        self.assertEqual(ArticleDraft.objects.get(article=self.article).content, 'A' + BODY)
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.patch({'ops': []}).status_code, 400)
+        self.assertEqual(self.patch({'version': True}).status_code, 400)
+        self.assertEqual(self.patch({'version': 0, 'ops': [{'start': 10_000}]}).status_code, 400)
+        self.assertEqual(self.patch({'version': 0, 'title': 'x' * 256}).status_code, 400)
+        self.assertFalse(ArticleDraft.objects.exists())
+
+    def test_only_the_author_can_edit(self):
+        response = self.patch({'version': 0, 'title': 'Hijacked'}, auth=self.auth_for(self.other))
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+
+    def test_commit_applies_the_draft_as_a_revision(self):
+        self.patch({'version': 0, 'ops': [{'start': 0, 'text': '<h2>Intro</h2>'}],
+                    'title': 'Drafted, revised'})
+
+        stale = self.client.post(f'{self.url}commit/', {'version': 5},
+                                 content_type='application/json', **self.auth)
+        response = self.client.post(f'{self.url}commit/', {'version': 1},
+                                    content_type='application/json', **self.auth)
+
+        self.assertEqual(stale.status_code, 409)
+        self.assertEqual(response.status_code, 200)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.title, 'Drafted, revised')
+        self.assertEqual(self.article.content, '<h2>Intro</h2>' + BODY)
+        self.assertEqual(self.article.toc[0]['id'], 'intro')
+        self.assertFalse(ArticleDraft.objects.exists())
+        self.assertEqual(revision_content(self.article.pk, 1), BODY)
+        self.assertEqual(revision_content(self.article.pk, 2), self.article.content)
+
+    def test_commit_without_a_draft(self):
+        response = self.client.post(f'{self.url}commit/', **self.auth)
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_discard(self):
+        self.patch({'version': 0, 'title': 'Discard me'})
+
+        self.assertEqual(self.client.delete(self.url, **self.auth).status_code, 204)
+        self.assertEqual(self.client.get(self.url, **self.auth).json()['version'], 0)
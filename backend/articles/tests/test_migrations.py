@@ -0,0 +1,80 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from articles.content import content_hash
+
+
+class MigrationTestCase(TransactionTestCase):
+    """Migrate back to ``migrate_from``, seed rows with the historical models, then forward."""
+    migrate_from = None
+    migrate_to = None
+
+    def setUp(self):
+        self.executor = MigrationExecutor(connection)
+        self.apps = self.migrate(self.migrate_from)
+
+    def tearDown(self):
+        self.migrate(self.executor.loader.graph.leaf_nodes())
+
+    def migrate(self, targets):
+        self.executor.loader.build_graph()
+        self.executor.migrate(targets)
+        # The state of everything applied, not only the targets' ancestors.
+        self.executor.loader.build_graph()
+        return self.executor.loader.project_state(
+            list(self.executor.loader.applied_migrations)).apps
+
+    def create_article(self, apps, **fields):
+        User = apps.get_model('users', 'User')
+        author, _created = User.objects.get_or_create(
+            email='author@example.com', defaults={'name': 'Author'})
+        fields.setdefault('slug', fields['title'].lower().replace(' ', '-'))
+        return apps.get_model('articles', 'Article').objects.create(author=author, **fields)
+
+
+class ScheduleFutureArticlesMigrationTests(MigrationTestCase):
+    migrate_from = [('articles', '0013_article_status_views_index')]
+    migrate_to = [('articles', '0014_schedule_future_articles')]
+
+    def test_future_published_articles_become_scheduled(self):
+        now = timezone.now()
+        future = self.create_article(self.apps, title='Future', status='published',
+                                     publish_date=now + timedelta(days=1))
+        past = self.create_article(self.apps, title='Past', status='published',
+                                   publish_date=now - timedelta(days=1))
+        self.apps.get_model('users', 'AuthorStats').objects.create(
+            user_id=future.author_id, article_count=2, published_count=2,
+            last_published_at=future.publish_date)
+
+        apps = self.migrate(self.migrate_to)
+        Article = apps.get_model('articles', 'Article')
+        self.assertEqual(Article.objects.get(pk=future.pk).status, 'scheduled')
+        self.assertEqual(Article.objects.get(pk=past.pk).status, 'published')
+        stats = apps.get_model('users', 'AuthorStats').objects.get(user_id=future.author_id)
+        self.assertEqual((stats.published_count, stats.last_published_at), (1, past.publish_date))
+
+        apps = self.migrate(self.migrate_from)
+        self.assertEqual(apps.get_model('articles', 'Article').objects.get(pk=future.pk).status,
+                         'published')
+
+
+class ContentBackfillMigrationTests(MigrationTestCase):
+    migrate_from = [('articles', '0003_article_articles_author_status_idx')]
+    migrate_to = [('articles', '0005_article_content_html')]
+
+    def test_existing_articles_are_summarized_and_rendered(self):
+        article = self.create_article(
+            self.apps, title='Old article', status='published',
+            content='<h2>Setup</h2><p>Install it.</p><script>alert(1)</script>')
+
+        apps = self.migrate(self.migrate_to)
+        article = apps.get_model('articles', 'Article').objects.get(pk=article.pk)
+
+        self.assertEqual(article.content_html, '<h2 id="setup">Setup</h2><p>Install it.</p>')
+        self.assertEqual(article.content_hash, content_hash(article.content))
+        self.assertEqual(article.word_count, 3)
+        self.assertEqual(article.toc, [{'level': 2, 'text': 'Setup', 'id': 'setup'}])
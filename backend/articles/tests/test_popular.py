@@ -0,0 +1,45 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from articles.models import Article, TrendingArticle
+from categories.models import Category
+from users.models import User
+
+
+class PopularArticlesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create(email='author@example.com', name='Author')
+        cls.category = Category.objects.create(name='Engineering', slug='engineering')
+        cls.articles = []
+        for i, views in enumerate([5, 50, 20]):
+            article = Article.objects.create(
+                title=f'Popular article {i}', author=author, status='published',
+                content='<p>Body</p>')
+            Article.objects.filter(pk=article.pk).update(views=views)
+            cls.articles.append(article)
+        cls.articles[0].categories.set([cls.category])
+        cls.articles[2].categories.set([cls.category])
+        Article.objects.create(title='Draft', author=author, status='draft', content='<p>Body</p>')
+
+    def setUp(self):
+        cache.clear()
+
+    def titles(self, path):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return [article['title'] for article in response.json()['results']]
+
+    def test_falls_back_to_most_viewed_without_ranking(self):
+        self.assertEqual(self.titles('/api/articles/popular/'),
+                         ['Popular article 1', 'Popular article 2', 'Popular article 0'])
+
+    def test_fallback_keeps_category_scope(self):
+        self.assertEqual(self.titles('/api/articles/popular/?category=engineering'),
+                         ['Popular article 2', 'Popular article 0'])
+
+    def test_uses_ranking_when_present(self):
+        TrendingArticle.objects.create(window='7d', scope='all', scope_id=0, rank=1,
+                                       article=self.articles[0], score=3.0)
+
+        self.assertEqual(self.titles('/api/articles/popular/'), ['Popular article 0'])
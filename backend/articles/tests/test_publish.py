@@ -0,0 +1,38 @@
+from datetime import datetime, timezone as dt_timezone
+
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.models import Article
+from users.models import User
+
+
+class ArticlePublishTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(email='author@example.com', name='Author')
+        self.article = Article.objects.create(
+            title='Publish me', author=self.author, status='draft', content='<p>Body</p>')
+        self.auth = f'Bearer {RefreshToken.for_user(self.author).access_token}'
+
+    def publish(self, publish_date):
+        return self.client.post(f'/api/articles/{self.article.slug}/publish/',
+                                {'publish_date': publish_date}, content_type='application/json',
+                                HTTP_AUTHORIZATION=self.auth)
+
+    def test_naive_date_is_read_in_the_site_time_zone(self):
+        response = self.publish('2030-01-02T10:00:00')
+
+        self.assertEqual(response.status_code, 200)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.status, 'scheduled')
+        self.assertEqual(self.article.publish_date,
+                         datetime(2030, 1, 2, 10, tzinfo=dt_timezone.utc))
+
+    def test_out_of_range_date_is_rejected(self):
+        response = self.publish('2030-13-45T10:00:00')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('publish_date', response.json()['error'])
+
+    def test_malformed_date_is_rejected(self):
+        self.assertEqual(self.publish('next tuesday').status_code, 400)
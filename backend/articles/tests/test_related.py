@@ -0,0 +1,72 @@
+from django.test import TestCase
+
+from articles.models import Article, RelatedArticle
+from categories.models import Category
+from tags.models import Tag
+from users.models import User
+
+
+class RelatedArticleSignalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create(email='author@example.com', name='Author')
+        cls.first, cls.second, cls.third = (
+            Article.objects.create(title=f'Article {n}', author=author, status='published',
+                                   content='<p>Body</p>')
+            for n in range(3)
+        )
+        cls.draft = Article.objects.create(title='Draft', author=author, status='draft',
+                                           content='<p>Body</p>')
+        cls.tag = Tag.objects.create(name='Python')
+
+    def neighbors(self, article):
+        return set(RelatedArticle.objects.filter(article=article).values_list('related_id', flat=True))
+
+    def test_adding_tags_links_both_articles(self):
+        self.first.tags.add(self.tag)
+        self.assertEqual(self.neighbors(self.first), set())
+
+        self.second.tags.add(self.tag)
+
+        self.assertEqual(self.neighbors(self.first), {self.second.pk})
+        self.assertEqual(self.neighbors(self.second), {self.first.pk})
+
+    def test_removing_a_tag_updates_the_neighbors_lists(self):
+        for article in (self.first, self.second, self.third):
+            article.tags.add(self.tag)
+
+        self.second.tags.remove(self.tag)
+
+        self.assertEqual(self.neighbors(self.first), {self.third.pk})
+        self.assertEqual(self.neighbors(self.second), set())
+        self.assertEqual(self.neighbors(self.third), {self.first.pk})
+
+    def test_reverse_changes_update_every_article(self):
+        self.tag.articles.add(self.first, self.second, self.draft)
+
+        self.assertEqual(self.neighbors(self.first), {self.second.pk})
+        # Drafts get a list but never appear in one.
+        self.assertEqual(self.neighbors(self.draft), {self.first.pk, self.second.pk})
+
+        self.tag.articles.clear()
+
+        self.assertFalse(RelatedArticle.objects.exists())
+
+    def test_categories_count_too(self):
+        category = Category.objects.create(name='Backend')
+
+        category.articles.add(self.first, self.third)
+        self.assertEqual(self.neighbors(self.first), {self.third.pk})
+
+        self.first.categories.clear()
+
+        self.assertEqual(self.neighbors(self.first), set())
+        self.assertEqual(self.neighbors(self.third), set())
+
+    def test_unpublishing_drops_the_article_from_lists(self):
+        self.tag.articles.add(self.first, self.second)
+
+        self.second.status = 'draft'
+        self.second.save()
+
+        self.assertEqual(self.neighbors(self.first), set())
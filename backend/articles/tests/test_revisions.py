@@ -0,0 +1,184 @@
+import random
+
+from django.test import TestCase
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.models import Article, ArticleRevision
+from articles.revisions import (
+    SNAPSHOT_INTERVAL, apply_delta, make_delta, record_revision, revision_content)
+from users.models import User
+
+# Article content must be at least 100 characters long.
+FILLER = '<p>' + 'Filler text for the length check. ' * 4 + '</p>\n'
+
+
+def edited(text, rng):
+    """A random small edit of ``text``: replace, insert or delete a sentence."""
+    sentences = text.split('. ')
+    index = rng.randrange(len(sentences))
+    action = rng.choice(('replace', 'insert', 'delete'))
+    if action == 'replace':
+        sentences[index] = f'Sentence {rng.randrange(10_000)} changed'
+    elif action == 'insert':
+        sentences.insert(index, f'New sentence {rng.randrange(10_000)}')
+    elif len(sentences) > 1:
+        del sentences[index]
+    return '. '.join(sentences)
+
+
+class DeltaTests(TestCase):
+    def assertRoundTrip(self, old, new):
+        self.assertEqual(apply_delta(old, make_delta(old, new)), new)
+
+    def test_round_trips(self):
+        cases = [
+            ('', ''),
+            ('', '<p>First text.</p>'),
+            ('<p>Only text.</p>', ''),
+            ('<p>Same.</p>', '<p>Same.</p>'),
+            ('<p>One. Two. Three.</p>\n<p>Four.</p>', '<p>One. 2. Three.</p>\n<p>Four!</p>\n'),
+            ('<p>Ünïcödé — naïve café. 日本語のテキスト。</p>', '<p>Ünïcödé — naive café. 日本語。 🎉</p>'),
+        ]
+        for old, new in cases:
+            with self.subTest(old=old, new=new):
+                self.assertRoundTrip(old, new)
+
+    def test_random_edits(self):
+        rng = random.Random(7)
+        text = '. '.join(f'Sentence {i} with <b>markup</b>' for i in range(50))
+        for _ in range(200):
+            new = edited(text, rng)
+            self.assertRoundTrip(text, new)
+            text = new
+
+    def test_small_edit_gives_small_delta(self):
+        old = '<p>' + '. '.join(f'Sentence number {i}' for i in range(200)) + '</p>'
+        new = old.replace('Sentence number 100', 'Sentence number one hundred')
+
+        self.assertLess(len(str(make_delta(old, new))), 100)
+
+
+class RecordRevisionTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(email='author@example.com', name='Author')
+        self.article = Article.objects.create(
+            title='Versioned', author=self.author, status='draft', content='')
+
+    def save_version(self, content, title=None):
+        previous = (self.article.title, self.article.excerpt, self.article.content)
+        self.article.content = content
+        if title:
+            self.article.title = title
+        self.article.save()
+        return record_revision(self.article, self.author, previous)
+
+    def test_rebuilds_every_revision_across_snapshot_boundaries(self):
+        rng = random.Random(3)
+        text = '. '.join(f'Sentence {i} with ünïcödé and 日本語' for i in range(100))
+        history = {}
+        for _ in range(SNAPSHOT_INTERVAL * 2 + 5):
+            text = edited(text, rng)
+            revision = self.save_version(text)
+            history[revision.number] = text
+
+        # Revision 1 is the empty article as it was before the first edit.
+        self.assertEqual(revision_content(self.article.pk, 1), '')
+        for number, content in history.items():
+            self.assertEqual(revision_content(self.article.pk, number), content)
+        snapshots = list(self.article.revisions.filter(is_snapshot=True)
+                         .order_by('number').values_list('number', flat=True))
+        self.assertEqual(snapshots[:3], [1, 2, 2 + SNAPSHOT_INTERVAL])
+        self.assertTrue(self.article.revisions.filter(is_snapshot=False).exists())
+
+    def test_unchanged_content_records_nothing(self):
+        self.save_version('<p>Text.</p>')
+
+        self.assertIsNone(record_revision(self.article, self.author))
+        self.assertEqual(self.article.revisions.count(), 2)
+
+    def test_empty_article_without_history(self):
+        revision = record_revision(self.article, self.author)
+
+        self.assertEqual((revision.number, revision.is_snapshot), (1, True))
+        self.assertEqual(revision_content(self.article.pk, 1), '')
+
+    def test_unknown_revision(self):
+        self.save_version('<p>Text.</p>')
+
+        with self.assertRaises(ArticleRevision.DoesNotExist):
+            revision_content(self.article.pk, 99)
+
+
+class RevisionViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create(email='author@example.com', name='Author')
+        cls.other = User.objects.create(email='other@example.com', name='Other')
+        cls.admin = User.objects.create(email='admin@example.com', name='Admin', role='admin')
+        cls.article = Article.objects.create(
+            title='Versioned', author=cls.author, status='published',
+            content=FILLER + '<p>Line one.</p>\n<p>Line two.</p>')
+
+    def auth(self, user):
+        return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+    def edit(self, content, user=None):
+        response = self.client.patch(f'/api/articles/{self.article.slug}/',
+                                     {'content': FILLER + content},
+                                     content_type='application/json',
+                                     **self.auth(user or self.author))
+        self.assertEqual(response.status_code, 200)
+
+    def url(self, suffix=''):
+        return f'/api/articles/{self.article.slug}/revisions/{suffix}'
+
+    def test_edits_are_listed(self):
+        self.edit('<p>Line one.</p>\n<p>Line 2.</p>')
+
+        response = self.client.get(self.url(), **self.auth(self.author))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([revision['number'] for revision in response.json()['results']], [2, 1])
+
+    def test_detail_and_diff(self):
+        self.edit('<p>Line one.</p>\n<p>Line 2.</p>')
+
+        detail = self.client.get(self.url('1/'), **self.auth(self.author)).json()
+        diff = self.client.get(self.url('2/diff/'), **self.auth(self.author)).json()
+
+        self.assertEqual(detail['content'], FILLER + '<p>Line one.</p>\n<p>Line two.</p>')
+        self.assertEqual((diff['from'], diff['to']), (1, 2))
+        self.assertIn('-<p>Line two.</p>', diff['diff'])
+        self.assertIn('+<p>Line 2.</p>', diff['diff'])
+
+    def test_diff_errors(self):
+        self.edit('<p>Changed.</p>')
+
+        bad = self.client.get(self.url('2/diff/?against=latest'), **self.auth(self.author))
+        missing = self.client.get(self.url('9/diff/'), **self.auth(self.author))
+
+        self.assertEqual(bad.status_code, 400)
+        self.assertEqual(missing.status_code, 404)
+
+    def test_restore_records_a_new_revision(self):
+        self.edit('<p>Changed.</p>')
+
+        response = self.client.post(self.url('1/restore/'), **self.auth(self.author))
+
+        self.assertEqual(response.status_code, 200)
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.content, FILLER + '<p>Line one.</p>\n<p>Line two.</p>')
+        self.assertEqual(revision_content(self.article.pk, 3), self.article.content)
+
+    def test_permissions(self):
+        self.edit('<p>Changed.</p>')
+
+        self.assertEqual(self.client.get(self.url()).status_code, 401)
+        for suffix in ('', '1/', '2/diff/'):
+            with self.subTest(suffix=suffix):
+                self.assertEqual(self.client.get(self.url(suffix), **self.auth(self.other)).status_code,
+                                 404)
+                self.assertEqual(self.client.get(self.url(suffix), **self.auth(self.admin)).status_code,
+                                 200)
+        self.assertEqual(
+            self.client.post(self.url('1/restore/'), **self.auth(self.other)).status_code, 404)
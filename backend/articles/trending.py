@@ -0,0 +1,99 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from core.utils import log_action
+from .models import Article, ArticleActivity, TrendingArticle
+
+# Window name -> (how far back activity counts, half-life of its weight).
+TRENDING_WINDOWS = {
+    '24h': (timedelta(hours=24), timedelta(hours=6)),
+    '7d': (timedelta(days=7), timedelta(hours=36)),
+    '30d': (timedelta(days=30), timedelta(days=7)),
+}
+DEFAULT_TRENDING_WINDOW = '7d'
+# A like counts as this many views.
+LIKE_WEIGHT = 5
+# Articles kept per window and scope.
+TRENDING_SIZE = 10
+
+
+def score_activity(now=None):
+    """
+    Decayed score per window and article from the hourly counters:
+    sum of (views + LIKE_WEIGHT * likes) * 0.5 ** (age / half-life).
+    Only published articles with a positive score are returned.
+    """
+    now = now or timezone.now()
+    longest = max(span for span, _half_life in TRENDING_WINDOWS.values())
+    scores = {name: defaultdict(float) for name in TRENDING_WINDOWS}
+
+    rows = ArticleActivity.objects.filter(
+        bucket__gte=now - longest, article__status='published',
+    ).values_list('article_id', 'bucket', 'views', 'likes')
+    for article_id, bucket, views, likes in rows.iterator(chunk_size=5000):
+        weight = views + LIKE_WEIGHT * likes
+        if not weight:
+            continue
+        age = now - bucket
+        for name, (span, half_life) in TRENDING_WINDOWS.items():
+            if age <= span:
+                scores[name][article_id] += weight * 0.5 ** (age / half_life)
+
+    return {
+        name: {article_id: score for article_id, score in window.items() if score > 0}
+        for name, window in scores.items()
+    }
+
+
+def _memberships(article_ids, chunk_size=500):
+    """Category and tag ids of each article, as (scope, scope_id) pairs."""
+    scopes = defaultdict(list)
+    article_ids = list(article_ids)
+    for start in range(0, len(article_ids), chunk_size):
+        chunk = article_ids[start:start + chunk_size]
+        for scope, through, column in (
+            ('category', Article.categories.through, 'category_id'),
+            ('tag', Article.tags.through, 'tag_id'),
+        ):
+            for article_id, scope_id in through.objects.filter(
+                    article_id__in=chunk).values_list('article_id', column):
+                scopes[article_id].append((scope, scope_id))
+    return scopes
+
+
+def compute_trending(now=None):
+    """Rebuild the trending ranking table; returns the number of rows written."""
+    scores = score_activity(now)
+    memberships = _memberships(set().union(*(window.keys() for window in scores.values())))
+
+    rows = []
+    for name, window in scores.items():
+        ranked = sorted(window.items(), key=lambda item: (-item[1], -item[0]))
+        lists = defaultdict(list)
+        for article_id, score in ranked:
+            for scope in [('all', 0), *memberships.get(article_id, ())]:
+                if len(lists[scope]) < TRENDING_SIZE:
+                    lists[scope].append((article_id, score))
+        rows.extend(
+            TrendingArticle(window=name, scope=scope, scope_id=scope_id, rank=rank,
+                            article_id=article_id, score=round(score, 4))
+            for (scope, scope_id), entries in lists.items()
+            for rank, (article_id, score) in enumerate(entries, start=1)
+        )
+
+    with transaction.atomic():
+        TrendingArticle.objects.all().delete()
+        TrendingArticle.objects.bulk_create(rows, batch_size=1000)
+    log_action('trending_computed', None, f'Rows: {len(rows)}')
+    return len(rows)
+
+
+def prune_activity(now=None):
+    """Delete hourly counters older than the longest window; returns the count removed."""
+    now = now or timezone.now()
+    longest = max(span for span, _half_life in TRENDING_WINDOWS.values())
+    removed, _ = ArticleActivity.objects.filter(bucket__lt=now - longest - timedelta(hours=1)).delete()
+    return removed
@@ -1,12 +1,14 @@
 from django.urls import path
 from .views import (
-    ArticleListCreateView,
     ArticleRetrieveUpdateDestroyView,
     ArticlePublishView,
     ArticleUnpublishView,
-    ArticleBySlugView,
-    PopularArticlesView,
-    RecentArticlesView,
+    ArticleDraftView,
+    ArticleDraftCommitView,
+    ArticleRevisionListView,
+    ArticleRevisionDetailView,
+    ArticleRevisionDiffView,
+    ArticleRevisionRestoreView,
     RelatedArticlesView,
     IncrementViewsView,
     ImageUploadView,
@@ -18,15 +20,22 @@ from .views import (
     UserLikedArticlesView,
     UserDislikedArticlesView,
 )
+from .async_views import (
+    AsyncArticleListView,
+    AsyncArticleBySlugView,
+    AsyncArticlePageView,
+    AsyncPopularArticlesView,
+    AsyncRecentArticlesView,
+)
 
 urlpatterns = [
-    path('', ArticleListCreateView.as_view(), name='article-list-create'),
+    path('', AsyncArticleListView.as_view(), name='article-list-create'),
     path('me/', UserArticlesView.as_view(), name='user-articles'),
     path('me/bookmarks/', UserBookmarksView.as_view(), name='user-bookmarks'),
     path('me/liked/', UserLikedArticlesView.as_view(), name='user-liked'),
     path('me/disliked/', UserDislikedArticlesView.as_view(), name='user-disliked'),
-    path('popular/', PopularArticlesView.as_view(), name='popular-articles'),
-    path('recent/', RecentArticlesView.as_view(), name='recent-articles'),
+    path('popular/', AsyncPopularArticlesView.as_view(), name='popular-articles'),
+    path('recent/', AsyncRecentArticlesView.as_view(), name='recent-articles'),
     path('upload-image/', ImageUploadView.as_view(), name='upload-image'),
     path('<int:pk>/related/', RelatedArticlesView.as_view(),
          name='related-articles'),
@@ -40,6 +49,18 @@ urlpatterns = [
          name='article-publish'),
     path('<slug:slug>/unpublish/', ArticleUnpublishView.as_view(),
          name='article-unpublish'),
-    path('by-slug/<slug:slug>/', ArticleBySlugView.as_view(), name='article-by-slug'),
+    path('<slug:slug>/page/', AsyncArticlePageView.as_view(), name='article-page'),
+    path('<slug:slug>/draft/', ArticleDraftView.as_view(), name='article-draft'),
+    path('<slug:slug>/draft/commit/', ArticleDraftCommitView.as_view(),
+         name='article-draft-commit'),
+    path('<slug:slug>/revisions/', ArticleRevisionListView.as_view(),
+         name='article-revisions'),
+    path('<slug:slug>/revisions/<int:number>/', ArticleRevisionDetailView.as_view(),
+         name='article-revision-detail'),
+    path('<slug:slug>/revisions/<int:number>/diff/', ArticleRevisionDiffView.as_view(),
+         name='article-revision-diff'),
+    path('<slug:slug>/revisions/<int:number>/restore/', ArticleRevisionRestoreView.as_view(),
+         name='article-revision-restore'),
+    path('by-slug/<slug:slug>/', AsyncArticleBySlugView.as_view(), name='article-by-slug'),
     path('admin/', AdminArticleListAPIView.as_view(), name='article_admin_list'),
 ]
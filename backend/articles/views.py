@@ -3,13 +3,24 @@ from rest_framework import generics, permissions, status, filters
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.utils import timezone
-from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from rest_framework.exceptions import NotFound
 from django.http import Http404
-from .models import Article
-from .serializers import ArticleSerializer
-from comments.serializers import CommentSerializer
+from .models import Article, ArticleDraft, ArticleRevision
+from .serializers import (
+    ArticleDetailSerializer, ArticleListSerializer, ArticleRevisionSerializer, ArticleSerializer)
+from .revisions import record_revision, revision_content, unified_diff
+from .drafts import autosave, draft_state
+from .analytics import viewer_key
+from .trending import DEFAULT_TRENDING_WINDOW, TRENDING_SIZE, TRENDING_WINDOWS
+from categories.models import Category
+from tags.models import Tag
+from comments.serializers import CommentSerializer, prefetch_comment_tree
+from users.models import User
+from users.serializers import AuthorListSerializer
+from users.views import with_author_stats
 from core.utils import get_search_filter, log_action, log_exception, compress_image
 from core.permissions import IsAuthorOrReadOnly
 import os
@@ -20,6 +31,7 @@ from pathlib import Path
 
 
 class ArticleListCreateView(generics.ListCreateAPIView):
+    read_from_replica = True
     serializer_class = ArticleSerializer
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'content', 'excerpt',
@@ -29,8 +41,9 @@ class ArticleListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
 
+        # The rendered body is only served by the detail endpoints.
         queryset = Article.objects.select_related(
-            'author').prefetch_related('categories', 'tags')
+            'author').prefetch_related('categories', 'tags').defer('content_html')
 
         if self.request.user.is_authenticated and self.request.query_params.get('include_drafts'):
 
@@ -88,7 +101,8 @@ class ArticleListCreateView(generics.ListCreateAPIView):
             else:
                 status = 'pending'
         
-        serializer.save(author=self.request.user, status=status)
+        article = serializer.save(author=self.request.user, status=status)
+        record_revision(article, self.request.user)
 
 
 class AdminArticleListAPIView(generics.ListAPIView):
@@ -108,9 +122,10 @@ class AdminArticleListAPIView(generics.ListAPIView):
 
 
 class ArticleRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+    read_from_replica = True
     queryset = Article.objects.select_related(
         'author').prefetch_related('categories', 'tags')
-    serializer_class = ArticleSerializer
+    serializer_class = ArticleDetailSerializer
     permission_classes = [IsAuthorOrReadOnly]
     lookup_field = 'slug'
 
@@ -126,8 +141,10 @@ class ArticleRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
             instance = self.get_object()
             if instance.status == 'published' or instance.author == request.user:
                 if instance.status == 'published' and request.user != instance.author:
+                    # An F() update on the primary; the instance may come from
+                    # the replica, so only its in-memory copy is bumped for display.
+                    instance.record_view(viewer_key(request))
                     instance.views += 1
-                    instance.save(update_fields=['views'])
                 serializer = self.get_serializer(instance)
                 return Response(serializer.data)
             return Response(
@@ -142,7 +159,10 @@ class ArticleRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
     def perform_update(self, serializer):
         try:
+            instance = serializer.instance
+            previous = (instance.title, instance.excerpt, instance.content)
             article = serializer.save()
+            record_revision(article, self.request.user, previous)
             log_action('article_updated', self.request.user,
                        f'Article ID: {article.id}')
         except Exception as e:
@@ -167,9 +187,29 @@ class ArticlePublishView(APIView):
     def post(self, request, slug):
         try:
             article = Article.objects.get(slug=slug, author=request.user)
+            # An optional future publish_date schedules the article instead.
+            publish_date = timezone.now()
+            if request.data.get('publish_date'):
+                try:
+                    # None when malformed; ValueError for out-of-range values.
+                    publish_date = parse_datetime(str(request.data['publish_date']))
+                except ValueError:
+                    publish_date = None
+                if publish_date is None:
+                    return Response(
+                        {'error': 'publish_date must be an ISO 8601 datetime'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+                if timezone.is_naive(publish_date):
+                    publish_date = timezone.make_aware(publish_date)
             article.status = 'published'
-            article.publish_date = timezone.now()
+            article.publish_date = publish_date
             article.save()
+            if article.status == 'scheduled':
+                log_action('article_scheduled', request.user,
+                           f'Article ID: {article.id}, publish date: {article.publish_date}')
+                return Response({'status': 'Article scheduled successfully',
+                                 'publish_date': article.publish_date})
             log_action('article_published', request.user,
                        f'Article ID: {article.id}')
             return Response({'status': 'Article published successfully'})
@@ -204,9 +244,158 @@ class ArticleUnpublishView(APIView):
             raise
 
 
+class ArticleDraftView(APIView):
+    """
+    Autosave buffer of one of the user's articles. PATCH takes
+    ``{"version": n, "ops": [{"start": i, "end": j, "text": "..."}],
+    "title": ..., "excerpt": ...}`` and answers 409 when ``version`` is
+    stale; version 0 means no draft has been saved yet.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, slug):
+        article = get_object_or_404(Article, slug=slug, author=request.user)
+        return Response(draft_state(article))
+
+    def patch(self, request, slug):
+        article = get_object_or_404(Article, slug=slug, author=request.user)
+        version = request.data.get('version')
+        if not isinstance(version, int) or isinstance(version, bool):
+            return Response({'error': 'version is required'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            state = autosave(article, request.user, version, ops=request.data.get('ops'),
+                             title=request.data.get('title'), excerpt=request.data.get('excerpt'))
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        if state is None:
+            current = draft_state(article)
+            return Response(
+                {'error': 'Draft was changed elsewhere; reload it before saving again',
+                 'version': current['version']},
+                status=status.HTTP_409_CONFLICT
+            )
+        # The client already holds the text; only echo what it needs to continue.
+        return Response({'version': state['version'], 'length': len(state['content']),
+                         'updated_at': state['updated_at']})
+
+    def delete(self, request, slug):
+        article = get_object_or_404(Article, slug=slug, author=request.user)
+        ArticleDraft.objects.filter(article=article).delete()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ArticleDraftCommitView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, slug):
+        """Validate the draft, save it onto the article as a new revision and drop the buffer."""
+        article = get_object_or_404(Article, slug=slug, author=request.user)
+        draft = ArticleDraft.objects.filter(article=article).first()
+        if draft is None:
+            return Response({'error': 'No draft to commit'}, status=status.HTTP_404_NOT_FOUND)
+        version = request.data.get('version')
+        if version is not None and version != draft.version:
+            return Response(
+                {'error': 'Draft was changed elsewhere; reload it before committing',
+                 'version': draft.version},
+                status=status.HTTP_409_CONFLICT
+            )
+        previous = (article.title, article.excerpt, article.content)
+        serializer = ArticleDetailSerializer(
+            article, data={'title': draft.title, 'excerpt': draft.excerpt, 'content': draft.content},
+            partial=True, context={'request': request})
+        serializer.is_valid(raise_exception=True)
+        try:
+            article = serializer.save()
+            record_revision(article, request.user, previous)
+            ArticleDraft.objects.filter(article=article, version=draft.version).delete()
+            log_action('article_draft_committed', request.user, f'Article ID: {article.id}')
+        except Exception as e:
+            log_exception(e, f'Error committing draft of article ID: {article.id}')
+            raise
+        return Response(serializer.data)
+
+
+class ArticleRevisionMixin:
+    """Revision history is visible to the article's author and to admins."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_article(self, request, slug):
+        article = get_object_or_404(Article.objects.only('id', 'author_id'), slug=slug)
+        if article.author_id != request.user.id and request.user.role != 'admin':
+            raise NotFound(detail="Article not found")
+        return article
+
+
+class ArticleRevisionListView(ArticleRevisionMixin, generics.ListAPIView):
+    serializer_class = ArticleRevisionSerializer
+
+    def get_queryset(self):
+        article = self.get_article(self.request, self.kwargs['slug'])
+        return ArticleRevision.objects.filter(article=article).select_related('author')
+
+
+class ArticleRevisionDetailView(ArticleRevisionMixin, APIView):
+
+    def get(self, request, slug, number):
+        article = self.get_article(request, slug)
+        try:
+            revision = ArticleRevision.objects.select_related('author').get(
+                article=article, number=number)
+            content = revision_content(article.id, number)
+        except ArticleRevision.DoesNotExist:
+            return Response({'error': 'Revision not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response({**ArticleRevisionSerializer(revision).data, 'content': content})
+
+
+class ArticleRevisionDiffView(ArticleRevisionMixin, APIView):
+
+    def get(self, request, slug, number):
+        """Diff revision ``number`` against ?against=<number> (default: the one before it)."""
+        article = self.get_article(request, slug)
+        against = request.query_params.get('against', number - 1)
+        try:
+            against = int(against)
+        except (TypeError, ValueError):
+            return Response({'error': 'against must be a revision number'},
+                            status=status.HTTP_400_BAD_REQUEST)
+        try:
+            diff = unified_diff(article.id, against, number)
+        except ArticleRevision.DoesNotExist:
+            return Response({'error': 'Revision not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response({'from': against, 'to': number, 'diff': diff})
+
+
+class ArticleRevisionRestoreView(ArticleRevisionMixin, APIView):
+
+    def post(self, request, slug, number):
+        """Make revision ``number`` the current version, recorded as a new revision."""
+        article = self.get_article(request, slug)
+        try:
+            revision = ArticleRevision.objects.get(article=article, number=number)
+            content = revision_content(article.id, number)
+        except ArticleRevision.DoesNotExist:
+            return Response({'error': 'Revision not found'}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            article = Article.objects.get(pk=article.pk)
+            previous = (article.title, article.excerpt, article.content)
+            article.title = revision.title
+            article.excerpt = revision.excerpt
+            article.content = content
+            article.save()
+            record_revision(article, request.user, previous)
+            log_action('article_revision_restored', request.user,
+                       f'Article ID: {article.id}, revision: {number}')
+        except Exception as e:
+            log_exception(e, f'Error restoring revision {number} of article ID: {article.id}')
+            raise
+        return Response(ArticleDetailSerializer(article, context={'request': request}).data)
+
+
 class ArticleBySlugView(generics.RetrieveAPIView):
+    read_from_replica = True
     queryset = Article.objects.all()
-    serializer_class = ArticleSerializer
+    serializer_class = ArticleDetailSerializer
     permission_classes = [permissions.AllowAny]
     lookup_field = 'slug'
 
@@ -224,17 +413,17 @@ class ArticleBySlugView(generics.RetrieveAPIView):
                 )
 
         # Get comments for this article
-        comments = instance.comments.filter(
+        comments = list(instance.comments.filter(
             status='approved',
             parent=None  # Only top-level comments
-        ).order_by('-created_at')
+        ).select_related('user').order_by('-created_at'))
         
         # Serialize article and comments
         article_serializer = self.get_serializer(instance)
         comments_serializer = CommentSerializer(
             comments, 
             many=True, 
-            context={'request': request}
+            context={'request': request, **prefetch_comment_tree(comments, request.user)}
         )
         
         # Combine data
@@ -244,33 +433,139 @@ class ArticleBySlugView(generics.RetrieveAPIView):
         return Response(data)
 
 
+# Optional parts of the article page bundle, selected with ?include=.
+PAGE_PARTS = ('comments', 'related', 'author')
+# Related articles shown on the page (RelatedArticlesView serves the same list).
+PAGE_RELATED_LIMIT = 5
+
+
+def page_parts(request):
+    """Parts named by ?include=comments,related,author (all by default); None if any is unknown."""
+    value = request.GET.get('include')
+    if value is None:
+        return set(PAGE_PARTS)
+    parts = {part.strip() for part in value.split(',') if part.strip()}
+    return parts if parts <= set(PAGE_PARTS) else None
+
+
+def page_related_articles(article_id):
+    return Article.objects.filter(
+        neighbor_of__article_id=article_id, status='published',
+    ).order_by('-neighbor_of__score')[:PAGE_RELATED_LIMIT]
+
+
+def page_author(author_id):
+    return with_author_stats(User.objects.filter(pk=author_id))
+
+
+class ArticlePageView(APIView):
+    """
+    Everything the article page renders in one response: the article, its
+    approved comment threads, related articles and the author card. The
+    anonymous, cached path is AsyncArticlePageView; this view serves
+    signed-in readers, whose payload includes their own reaction state.
+    """
+    read_from_replica = True
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, slug):
+        parts = page_parts(request)
+        if parts is None:
+            return Response(
+                {'error': f'include accepts: {", ".join(PAGE_PARTS)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        article = get_object_or_404(
+            Article.objects.select_related('author').prefetch_related('categories', 'tags'),
+            slug=slug)
+        if article.status != 'published' and (
+            not request.user.is_authenticated or (
+                request.user != article.author and request.user.role != 'admin')
+        ):
+            return Response(
+                {'error': 'You do not have permission to view this article.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        context = {'request': request}
+        data = {'article': ArticleDetailSerializer(article, context=context).data}
+        if 'comments' in parts:
+            comments = list(article.comments.filter(status='approved', parent=None)
+                            .select_related('user').order_by('-created_at'))
+            data['comments'] = CommentSerializer(
+                comments, many=True,
+                context={**context, **prefetch_comment_tree(comments, request.user)}).data
+        if 'related' in parts:
+            data['related'] = ArticleListSerializer(
+                page_related_articles(article.id).select_related('author')
+                .prefetch_related('categories'),
+                many=True, context=context).data
+        if 'author' in parts:
+            data['author'] = AuthorListSerializer(
+                page_author(article.author_id).get(), context=context).data
+        return Response(data)
+
+
 class PopularArticlesView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = ArticleSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        return Article.objects.filter(status='published').order_by('-views')[:10]
+        # Reads the ranking precomputed by compute_trending: ?window=24h|7d|30d,
+        # optionally narrowed with ?category= or ?tag= (id or slug).
+        params = self.request.query_params
+        window = params.get('window')
+        if window not in TRENDING_WINDOWS:
+            window = DEFAULT_TRENDING_WINDOW
+
+        scope, scope_filter, fallback_filter = 'all', {'trending__scope_id': 0}, {}
+        for name, model, relation in (('category', Category, 'categories'), ('tag', Tag, 'tags')):
+            value = params.get(name)
+            if value:
+                scope = name
+                if value.isdigit():
+                    scope_filter = {'trending__scope_id': int(value)}
+                    fallback_filter = {f'{relation}__id': int(value)}
+                else:
+                    scope_filter = {'trending__scope_id__in': model.objects.filter(
+                        slug=value).values('id')}
+                    fallback_filter = {f'{relation}__slug': value}
+                break
+
+        articles = Article.objects.filter(status='published').select_related(
+            'author').prefetch_related('categories', 'tags').defer('content_html')
+        ranked = articles.filter(
+            trending__window=window, trending__scope=scope, **scope_filter,
+        ).order_by('trending__rank')
+        if ranked.exists():
+            return ranked
+        # No ranking yet (compute_trending hasn't run, or no recent activity):
+        # the all-time most viewed articles instead.
+        return articles.filter(**fallback_filter).order_by('-views', '-id')[:TRENDING_SIZE]
 
 
 class RecentArticlesView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = ArticleSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        return Article.objects.filter(status='published').order_by('-publish_date')[:10]
+        return Article.objects.filter(status='published').defer('content_html').order_by('-publish_date')[:10]
 
 
 class RelatedArticlesView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = ArticleSerializer
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
-        article = get_object_or_404(Article, pk=self.kwargs['pk'])
+        # Ranked neighbors precomputed in RelatedArticle; one indexed join.
         return Article.objects.filter(
-            categories__in=article.categories.all()
-        ).exclude(
-            id=article.id
-        ).distinct()[:5]
+            neighbor_of__article_id=self.kwargs['pk'],
+            status='published',
+        ).select_related('author').prefetch_related('categories', 'tags').defer(
+            'content_html').order_by('-neighbor_of__score')[:5]
 
 
 class IncrementViewsView(APIView):
@@ -278,9 +573,8 @@ class IncrementViewsView(APIView):
 
     def post(self, request, pk):
         try:
-            article = get_object_or_404(Article, pk=pk)
-            article.views = F('views') + 1
-            article.save()
+            article = get_object_or_404(Article.objects.only('id', 'author_id'), pk=pk)
+            article.record_view(viewer_key(request))
             log_action('article_viewed', getattr(request.user, 'is_authenticated', False) and request.user or None,
                        f'Article ID: {article.id}')
             return Response({'status': 'success'})
@@ -13,7 +13,9 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from datetime import timedelta
 import os
 from pathlib import Path
+from django.conf import global_settings
 from dotenv import load_dotenv
+from .database import database_config
 
 load_dotenv()
 
@@ -57,6 +59,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -83,13 +86,27 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'blog_backend.wsgi.application'
 
+# Set DATABASE_URL (postgres://... or sqlite:///...) to pick the backend; the
+# local SQLite file is used otherwise. See blog_backend/database.py for the
+# SQLITE_* and DB_* tuning variables.
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(os.getenv('DATABASE_URL'), BASE_DIR / 'db.sqlite3'),
 }
 
+# Optional read replica for public GET endpoints (views with
+# read_from_replica = True). A second SQLite file works as a local stand-in,
+# e.g. DATABASE_REPLICA_URL=sqlite:///db.replica.sqlite3.
+DATABASE_READ_REPLICA = os.getenv('DATABASE_READ_REPLICA', 'replica')
+if os.getenv('DATABASE_REPLICA_URL'):
+    DATABASES[DATABASE_READ_REPLICA] = database_config(
+        os.getenv('DATABASE_REPLICA_URL'), BASE_DIR / 'db.replica.sqlite3')
+    DATABASES[DATABASE_READ_REPLICA]['TEST'] = {'MIRROR': 'default'}
+
+DATABASE_ROUTERS = ['core.db_routers.PrimaryReplicaRouter']
+
+# Reads go to the primary for this many seconds after a client writes.
+REPLICA_STICKY_SECONDS = int(os.getenv('REPLICA_STICKY_SECONDS', '5'))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -108,6 +125,32 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# PASSWORD_HASHER_PROFILE picks the hasher used for new password hashes:
+# 'pbkdf2' (Django's default), 'scrypt', or 'argon2' (needs argon2-cffi), with
+# cost parameters from the env vars below; `manage.py benchmark_hashers`
+# suggests values. The other stock hashers stay listed so existing hashes still
+# verify and are upgraded to the preferred one on the next successful login.
+PASSWORD_HASHER_PROFILE = os.getenv('PASSWORD_HASHER_PROFILE', 'pbkdf2')
+_HASHER_PROFILES = {
+    # profile: (preferred hasher, stock hasher it replaces)
+    'pbkdf2': ('django.contrib.auth.hashers.PBKDF2PasswordHasher',
+               'django.contrib.auth.hashers.PBKDF2PasswordHasher'),
+    'scrypt': ('core.hashers.TunedScryptPasswordHasher',
+               'django.contrib.auth.hashers.ScryptPasswordHasher'),
+    'argon2': ('core.hashers.TunedArgon2PasswordHasher',
+               'django.contrib.auth.hashers.Argon2PasswordHasher'),
+}
+_preferred_hasher, _replaced_hasher = _HASHER_PROFILES[PASSWORD_HASHER_PROFILE]
+PASSWORD_HASHERS = [_preferred_hasher] + [
+    hasher for hasher in global_settings.PASSWORD_HASHERS if hasher != _replaced_hasher]
+
+SCRYPT_WORK_FACTOR = int(os.getenv('SCRYPT_WORK_FACTOR', 2 ** 14))
+SCRYPT_BLOCK_SIZE = int(os.getenv('SCRYPT_BLOCK_SIZE', 8))
+SCRYPT_PARALLELISM = int(os.getenv('SCRYPT_PARALLELISM', 5))
+ARGON2_TIME_COST = int(os.getenv('ARGON2_TIME_COST', 2))
+ARGON2_MEMORY_COST = int(os.getenv('ARGON2_MEMORY_COST', 102400))
+ARGON2_PARALLELISM = int(os.getenv('ARGON2_PARALLELISM', 8))
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -129,9 +172,29 @@ AUTHENTICATION_BACKENDS = [
     'django.contrib.auth.backends.ModelBackend',
 ]
 
+# JSON_BACKEND picks DRF's JSON renderer and parser: 'orjson' (core.renderers,
+# which falls back to the stdlib when orjson isn't installed or for indented
+# output) or 'stdlib' (DRF's own). `manage.py benchmark_json` compares them.
+JSON_BACKEND = os.getenv('JSON_BACKEND', 'orjson')
+_JSON_BACKENDS = {
+    # backend: (renderer, parser)
+    'orjson': ('core.renderers.FastJSONRenderer', 'core.renderers.FastJSONParser'),
+    'stdlib': ('rest_framework.renderers.JSONRenderer', 'rest_framework.parsers.JSONParser'),
+}
+_json_renderer, _json_parser = _JSON_BACKENDS[JSON_BACKEND]
+
 REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        _json_renderer,
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        _json_parser,
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'core.authentication.CachedUserJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -152,8 +215,16 @@ SIMPLE_JWT = {
     'TOKEN_TYPE_CLAIM': 'token_type',
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
+    'TOKEN_REFRESH_SERIALIZER': 'core.tokens.CachedBlacklistTokenRefreshSerializer',
 }
 
+# Seconds an authenticated user row is cached for read requests; 0 disables.
+JWT_USER_CACHE_SECONDS = int(os.getenv('JWT_USER_CACHE_SECONDS', '30'))
+
+# Check refresh tokens against the cached blacklist only, skipping the
+# database. Enable only with a cache shared by every worker (not LocMemCache).
+JWT_BLACKLIST_CACHE = os.getenv('JWT_BLACKLIST_CACHE', 'False').lower() in ('true', '1', 'yes')
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
@@ -184,6 +255,15 @@ ADMIN_EMAIL = os.getenv('ADMIN_EMAIL', os.getenv(
     'EMAIL_HOST_USER', 'admin@blankpage.com'))
 
 SITE_URL = 'http://localhost:8000'
+FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:8080')
+
+# Queue a newsletter campaign when publish_scheduled publishes articles.
+SCHEDULED_PUBLISH_NOTIFY = os.getenv('SCHEDULED_PUBLISH_NOTIFY', 'True').lower() in ('true', '1', 'yes')
+
+# /api/batch/: sub-requests accepted per call, and how many run at once. The
+# cap only matters for async views; sync views share one thread and run in turn.
+BATCH_MAX_REQUESTS = int(os.getenv('BATCH_MAX_REQUESTS', '20'))
+BATCH_CONCURRENCY = int(os.getenv('BATCH_CONCURRENCY', '4'))
 
 
 LOGGING = {
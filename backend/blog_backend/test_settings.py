@@ -0,0 +1,21 @@
+"""
+Settings for `manage.py test`.
+
+Adds a read replica as a second SQLite file with its own test database
+(not a mirror of the primary), so routing tests can tell which database
+served a query. Routing stays off unless a test enables it with
+override_settings(DATABASE_READ_REPLICA=TEST_REPLICA_ALIAS); every other
+test reads and writes the primary only.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import BASE_DIR, DATABASES, database_config
+
+TEST_REPLICA_ALIAS = 'replica'
+
+DATABASES[TEST_REPLICA_ALIAS] = database_config('', BASE_DIR / 'db.replica.sqlite3')
+DATABASES[TEST_REPLICA_ALIAS]['TEST'] = {'NAME': str(BASE_DIR / 'test_db.replica.sqlite3')}
+if DATABASES['default']['ENGINE'] == 'django.db.backends.sqlite3':
+    DATABASES['default']['TEST'] = {'NAME': str(BASE_DIR / 'test_db.sqlite3')}
+DATABASE_READ_REPLICA = None
+
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
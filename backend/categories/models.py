@@ -1,6 +1,6 @@
 from django.db import models
 from django.core.exceptions import ValidationError
-from core.utils import generate_unique_slug, validate_image_url
+from core.utils import save_with_unique_slug, validate_image_url
 
 
 class Category(models.Model):
@@ -22,10 +22,8 @@ class Category(models.Model):
             })
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = generate_unique_slug(self, 'name')
         self.clean()
-        super().save(*args, **kwargs)
+        save_with_unique_slug(self, 'name', super().save, *args, **kwargs)
 
     class Meta:
         db_table = 'categories'
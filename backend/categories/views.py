@@ -15,6 +15,7 @@ class StandardResultsSetPagination(PageNumberPagination):
 
 
 class CategoryListView(generics.ListCreateAPIView):
+    read_from_replica = True
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -37,6 +38,7 @@ class CategoryListView(generics.ListCreateAPIView):
 
 
 class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
+    read_from_replica = True
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -75,6 +77,7 @@ class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 class CategoryBySlugView(generics.RetrieveAPIView):
+    read_from_replica = True
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [permissions.AllowAny]
@@ -94,6 +97,7 @@ class CategoryBySlugView(generics.RetrieveAPIView):
 
 
 class CategoryArticlesView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = ArticleSerializer
     permission_classes = [permissions.AllowAny]
     pagination_class = StandardResultsSetPagination
@@ -0,0 +1,58 @@
+from core.async_views import (
+    AsyncReadView, drf_datetime, invalid_page_response, json_response, paginate, user_payload)
+from .models import Comment
+from .views import CommentListView
+
+
+def comment_payload(request, comment):
+    """Mirror CommentSerializer output for an anonymous reader."""
+    return {
+        'id': comment.id,
+        'article': comment.article_id,
+        'user': user_payload(request, comment.user),
+        'user_name': comment.user_name,
+        'user_email': comment.user_email,
+        'content': comment.content,
+        'created_at': drf_datetime(comment.created_at),
+        'updated_at': drf_datetime(comment.updated_at),
+        'status': comment.status,
+        'replies': [],
+        'likes_count': comment.likes_count,
+        'dislikes_count': comment.dislikes_count,
+        'flags_count': comment.flags_count,
+        'is_edited': comment.is_edited,
+        'user_like_status': None,
+        'user_has_flagged': False,
+    }
+
+
+async def serialize_comment_threads(request, queryset):
+    """
+    Serialize comments with their full reply trees, loading one level of
+    replies per query instead of one query per comment.
+    """
+    roots = [comment_payload(request, comment)
+             async for comment in queryset.select_related('user').aiterator()]
+    frontier = {payload['id']: payload for payload in roots}
+    while frontier:
+        replies = Comment.objects.filter(
+            parent_id__in=list(frontier)).select_related('user')
+        next_frontier = {}
+        async for reply in replies.aiterator():
+            payload = comment_payload(request, reply)
+            frontier[reply.parent_id]['replies'].append(payload)
+            next_frontier[reply.id] = payload
+        frontier = next_frontier
+    return roots
+
+
+class AsyncCommentListView(AsyncReadView):
+    fallback_view = CommentListView
+
+    async def read(self, request, *args, **kwargs):
+        queryset = self.drf_view(request, *args, **kwargs).get_queryset()
+        page, envelope = await paginate(request, queryset)
+        if page is None:
+            return invalid_page_response()
+        envelope['results'] = await serialize_comment_threads(request, page)
+        return json_response(envelope)
@@ -1,5 +1,6 @@
 from django.db import models
-from articles.models import Article
+from articles.models import Article, ArticleEvent
+from core.async_views import invalidate_cached_reads
 from users.models import User
 
 
@@ -37,6 +38,19 @@ class Comment(models.Model):
     def __str__(self):
         return f'Comment by {self.user.username if self.user else self.user_name} on {self.article.title}'
 
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if adding:
+            ArticleEvent.record(self.article_id, 'comment')
+        # Article payloads (by-slug, page) embed the comment threads.
+        invalidate_cached_reads('articles')
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_cached_reads('articles')
+        return result
+
     def update_likes_count(self):
         """Update the likes count based on CommentLike objects"""
         self.likes_count = self.likes.filter(is_like=True).count()
@@ -1,8 +1,33 @@
+from django.db.models import Prefetch, prefetch_related_objects
 from rest_framework import serializers
 from .models import Comment, CommentLike, CommentFlag
 from users.serializers import UserSerializer
 
 
+def prefetch_comment_tree(comments, user=None):
+    """
+    Load the full reply trees of ``comments`` (a list) one level per query,
+    plus ``user``'s likes and flags on every comment in them. Returns the
+    extra CommentSerializer context, so serializing the trees makes no
+    further queries.
+    """
+    ids = []
+    level = comments
+    while level:
+        ids.extend(comment.id for comment in level)
+        prefetch_related_objects(
+            level, Prefetch('replies', queryset=Comment.objects.select_related('user')))
+        level = [reply for comment in level for reply in comment.replies.all()]
+    if user is None or not user.is_authenticated:
+        return {}
+    return {
+        'comment_likes': dict(CommentLike.objects.filter(
+            user=user, comment_id__in=ids).values_list('comment_id', 'is_like')),
+        'flagged_comments': set(CommentFlag.objects.filter(
+            user=user, comment_id__in=ids).values_list('comment_id', flat=True)),
+    }
+
+
 class CommentFlagSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
 
@@ -61,7 +86,10 @@ class CommentSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return None
-        
+        if 'comment_likes' in self.context:
+            is_like = self.context['comment_likes'].get(obj.id)
+            return None if is_like is None else ('like' if is_like else 'dislike')
+
         try:
             like = CommentLike.objects.get(comment=obj, user=request.user)
             return 'like' if like.is_like else 'dislike'
@@ -73,7 +101,9 @@ class CommentSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if not request or not request.user.is_authenticated:
             return False
-        
+        if 'flagged_comments' in self.context:
+            return obj.id in self.context['flagged_comments']
+
         return CommentFlag.objects.filter(comment=obj, user=request.user).exists()
 
     def validate(self, attrs):
@@ -0,0 +1,78 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.models import Article
+from comments.models import Comment, CommentFlag, CommentLike
+from users.models import User
+
+
+class SignedInCommentTreeTests(TestCase):
+    """Signed-in readers get DRF-serialized comment trees with their own reaction state."""
+
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create(email='author@example.com', name='Author')
+        cls.reader = User.objects.create(email='reader@example.com', name='Reader')
+        cls.article = Article.objects.create(
+            title='Discussed article', author=author, status='published', content='<p>Body</p>')
+        cls.roots = []
+        for i in range(3):
+            root = Comment.objects.create(article=cls.article, user=author,
+                                          content=f'Root {i}', status='approved')
+            reply = Comment.objects.create(article=cls.article, user=cls.reader,
+                                           content=f'Reply {i}', parent=root, status='approved')
+            Comment.objects.create(article=cls.article, user=author, content=f'Nested {i}',
+                                   parent=reply, status='approved')
+            cls.roots.append(root)
+        CommentLike.objects.create(comment=cls.roots[0], user=cls.reader, is_like=False)
+        CommentFlag.objects.create(comment=cls.roots[1].replies.get(), user=cls.reader,
+                                   reason='spam')
+
+    def setUp(self):
+        cache.clear()
+        self.auth = f'Bearer {RefreshToken.for_user(self.reader).access_token}'
+
+    def get(self, path):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, HTTP_AUTHORIZATION=self.auth)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), len(queries)
+
+    def assertReactions(self, comments):
+        by_content = {}
+        stack = list(comments)
+        while stack:
+            comment = stack.pop()
+            by_content[comment['content']] = comment
+            stack.extend(comment['replies'])
+        self.assertEqual(len(by_content), 9)
+        self.assertEqual(by_content['Root 0']['user_like_status'], 'dislike')
+        self.assertIsNone(by_content['Root 1']['user_like_status'])
+        self.assertTrue(by_content['Reply 1']['user_has_flagged'])
+        self.assertFalse(by_content['Reply 0']['user_has_flagged'])
+
+    def test_article_page_queries_per_level(self):
+        data, queries = self.get(f'/api/articles/{self.article.slug}/page/')
+        self.assertReactions(data['comments'])
+
+        # More comments per level must not add queries.
+        for root in self.roots:
+            reply = root.replies.get()
+            Comment.objects.create(article=self.article, user=self.reader, content='More',
+                                   parent=reply, status='approved')
+            Comment.objects.create(article=self.article, user=self.reader, content='Root',
+                                   status='approved')
+        cache.clear()
+        _data, more_queries = self.get(f'/api/articles/{self.article.slug}/page/')
+        self.assertEqual(more_queries, queries)
+
+    def test_comment_list(self):
+        data, _queries = self.get(f'/api/comments/article/{self.article.id}/')
+        self.assertReactions(data['results'])
+
+    def test_article_by_slug(self):
+        data, _queries = self.get(f'/api/articles/by-slug/{self.article.slug}/')
+        self.assertReactions(data['comments'])
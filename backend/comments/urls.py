@@ -1,9 +1,9 @@
 from django.urls import path
-from . import views
+from . import async_views, views
 
 urlpatterns = [
     path('article/<int:article_id>/',
-         views.CommentListView.as_view(), name='comment_list'),
+         async_views.AsyncCommentListView.as_view(), name='comment_list'),
     path('<int:pk>/', views.CommentDetailView.as_view(), name='comment_detail'),
     path('create/', views.CommentCreateView.as_view(), name='comment_create'),
     
@@ -6,10 +6,12 @@ from rest_framework.decorators import action
 from django.shortcuts import get_object_or_404
 from django.db import IntegrityError
 from .models import Comment, CommentLike, CommentFlag
-from .serializers import CommentSerializer, CommentLikeSerializer, CommentFlagSerializer
+from .serializers import (
+    CommentSerializer, CommentLikeSerializer, CommentFlagSerializer, prefetch_comment_tree)
 
 
 class CommentListView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = CommentSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -18,10 +20,19 @@ class CommentListView(generics.ListAPIView):
             article_id=self.kwargs['article_id'],
             parent=None,
             status='approved'
-        )
+        ).select_related('user')
+
+    def get_serializer(self, *args, **kwargs):
+        if kwargs.get('many') and args:
+            comments = list(args[0])
+            kwargs['context'] = {**self.get_serializer_context(),
+                                 **prefetch_comment_tree(comments, self.request.user)}
+            args = (comments, *args[1:])
+        return super().get_serializer(*args, **kwargs)
 
 
 class CommentDetailView(generics.RetrieveUpdateDestroyAPIView):
+    read_from_replica = True
     queryset = Comment.objects.all()
     serializer_class = CommentSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -166,6 +177,7 @@ class PendingCommentsView(generics.ListAPIView):
 
 
 class RecentCommentsView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = CommentSerializer
     permission_classes = [permissions.AllowAny]
 
@@ -0,0 +1,180 @@
+import math
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils import timezone
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.request import Request
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .renderers import dumps
+
+
+class AsyncReadView(View):
+    """
+    Serve anonymous GET requests with a native async handler and hand every
+    other request (writes, authenticated reads) to the existing DRF view.
+
+    Subclasses implement ``async def read(request, *args, **kwargs)`` returning
+    a json_response(), and set ``fallback_view`` to the DRF view whose behaviour
+    and payload they mirror.
+    """
+    fallback_view = None
+    fallback_handler = None
+    read_from_replica = True
+    # Seconds to cache anonymous payloads; 0 disables caching for the view.
+    cache_timeout = 0
+    # Views sharing a namespace can have all their cached payloads dropped at
+    # once with invalidate_cached_reads().
+    cache_namespace = ''
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        initkwargs.setdefault(
+            'fallback_handler', sync_to_async(cls.fallback_view.as_view()))
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method in ('GET', 'HEAD') and not request.headers.get('Authorization'):
+            return await self.get(request, *args, **kwargs)
+        return await self.fallback_handler(request, *args, **kwargs)
+
+    async def get(self, request, *args, **kwargs):
+        cache_key = None
+        if self.cache_timeout:
+            version = await cache.aget(cache_version_key(self.cache_namespace), 0)
+            # The path, not the absolute URI: the Host header is client-controlled.
+            cache_key = f'async_read_{self.cache_namespace}_{version}_{request.get_full_path()}'
+            cached = await cache.aget(cache_key)
+            if cached is not None:
+                return json_response(cached)
+
+        response = await self.read(request, *args, **kwargs)
+        if cache_key and response.status_code == 200:
+            await cache.aset(cache_key, response.payload, self.cache_timeout)
+        return response
+
+    async def read(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def drf_view(self, request, *args, **kwargs):
+        """
+        Instantiate the fallback DRF view for this request without dispatching it,
+        so its get_queryset()/filter_queryset() can build the same query.
+        """
+        view = self.fallback_view()
+        view.args = args
+        view.kwargs = kwargs
+        view.request = Request(request)
+        view.format_kwarg = None
+        return view
+
+
+def cache_version_key(namespace):
+    return f'async_read_version_{namespace}'
+
+
+def invalidate_cached_reads(namespace):
+    """
+    Make every cached payload of the views in ``namespace`` unreachable by
+    bumping the version in their keys; the old entries simply expire. Inside
+    a transaction the bump waits for the commit, so a read in between can't
+    cache the old rows under the new version.
+    """
+    def bump():
+        key = cache_version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def json_response(payload, status=200):
+    response = HttpResponse(dumps(payload), status=status, content_type='application/json')
+    response.payload = payload
+    return response
+
+
+def drf_datetime(value):
+    """Format a datetime exactly like DRF's DateTimeField."""
+    if value is None:
+        return None
+    if settings.USE_TZ and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def file_url(request, value):
+    """Absolute URL of a FieldFile, like DRF's FileField/ImageField with a request."""
+    if not value:
+        return None
+    try:
+        url = value.url
+    except (AttributeError, ValueError):
+        return None
+    return request.build_absolute_uri(url)
+
+
+async def paginate(request, queryset, page_size=None):
+    """
+    Async PageNumberPagination: returns (objects, envelope) where the envelope
+    has DRF's count/next/previous keys, or (None, None) for an invalid page.
+    """
+    page_size = page_size or settings.REST_FRAMEWORK.get('PAGE_SIZE', 10)
+    count = await queryset.acount()
+    num_pages = max(1, math.ceil(count / page_size))
+
+    page_number = request.GET.get('page', 1)
+    if page_number == 'last':
+        page_number = num_pages
+    try:
+        page_number = int(page_number)
+    except (TypeError, ValueError):
+        return None, None
+    if page_number < 1 or page_number > num_pages:
+        return None, None
+
+    offset = (page_number - 1) * page_size
+    objects = queryset[offset:offset + page_size]
+
+    url = request.build_absolute_uri()
+    next_url = replace_query_param(url, 'page', page_number + 1) if page_number < num_pages else None
+    if page_number <= 1:
+        previous_url = None
+    elif page_number - 1 == 1:
+        previous_url = remove_query_param(url, 'page')
+    else:
+        previous_url = replace_query_param(url, 'page', page_number - 1)
+
+    return objects, {'count': count, 'next': next_url, 'previous': previous_url}
+
+
+def invalid_page_response():
+    return json_response({'detail': 'Invalid page.'}, status=404)
+
+
+def user_payload(request, user):
+    """Mirror users.serializers.UserSerializer output."""
+    if user is None:
+        return None
+    return {
+        'id': user.id,
+        'email': user.email,
+        'name': user.name,
+        'role': user.role,
+        'avatar': file_url(request, user.avatar),
+        'bio': user.bio,
+        'join_date': drf_datetime(user.join_date),
+        'last_login': drf_datetime(user.last_login),
+        'is_active': user.is_active,
+    }
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import auth_cache_key
+
+
+class CachedUserJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that serves read requests from a short-lived cache of
+    the user row instead of querying it on every request.
+
+    Writes still load the user from the database, so views that save
+    request.user never act on a stale copy. The password hash is never
+    cached; it is a deferred field on cached users. User.save() drops the
+    entry, so bans and role changes apply at once in this process and
+    within JWT_USER_CACHE_SECONDS everywhere else.
+    """
+
+    def authenticate(self, request):
+        self.use_cache = request.method in SAFE_METHODS
+        return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        timeout = getattr(settings, 'JWT_USER_CACHE_SECONDS', 0)
+        if not (timeout and getattr(self, 'use_cache', False)) or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        key = auth_cache_key(user_id)
+        fields = cache.get(key)
+        if fields is None:
+            user = super().get_user(validated_token)
+            cache.set(key, {
+                field.attname: getattr(user, field.attname)
+                for field in user._meta.concrete_fields if field.attname != 'password'
+            }, timeout)
+            return user
+
+        user = self.user_model.from_db('default', list(fields), list(fields.values()))
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+        return user
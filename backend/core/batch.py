@@ -0,0 +1,122 @@
+import asyncio
+import io
+import json
+from urllib.parse import urlsplit
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import Http404, HttpRequest, QueryDict
+from django.urls import Resolver404, resolve
+
+from .utils import log_exception
+
+BATCH_METHODS = ('GET', 'HEAD')
+# Outer request headers that describe its own body, not the sub-requests'.
+_BODY_META = ('CONTENT_LENGTH', 'CONTENT_TYPE', 'HTTP_CONTENT_ENCODING', 'HTTP_ACCEPT_ENCODING')
+
+
+def parse_batch(body):
+    """
+    Validate a batch body, ``{"requests": [{"id": ..., "method": "GET",
+    "path": "/api/..."}]}``, returning the list of sub-requests with ids
+    filled in. Raises ValueError when the body is malformed.
+    """
+    try:
+        data = json.loads(body or b'null')
+    except ValueError:
+        raise ValueError('Body must be JSON')
+    items = data.get('requests') if isinstance(data, dict) else None
+    if not isinstance(items, list) or not items:
+        raise ValueError('requests must be a non-empty list')
+    if len(items) > settings.BATCH_MAX_REQUESTS:
+        raise ValueError(f'At most {settings.BATCH_MAX_REQUESTS} requests per batch')
+
+    parsed = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not isinstance(item.get('path'), str):
+            raise ValueError(f'Request {index} needs a path')
+        parsed.append({
+            'id': item.get('id', index),
+            'method': str(item.get('method', 'GET')).upper(),
+            'path': item['path'],
+        })
+    return parsed
+
+
+def _sub_request(request, user, auth, method, path, query):
+    """
+    A bodiless request to ``path`` carrying the outer request's headers and
+    its already authenticated user, so DRF views skip decoding the token again.
+    """
+    sub = HttpRequest()
+    sub.method = method
+    sub.path = sub.path_info = path
+    sub.META = {key: value for key, value in request.META.items() if key not in _BODY_META}
+    sub.META.update(REQUEST_METHOD=method, PATH_INFO=path, QUERY_STRING=query)
+    sub.GET = QueryDict(query)
+    sub.COOKIES = request.COOKIES
+    sub._body = b''
+    sub._stream = io.BytesIO(b'')
+    sub.user = user
+    # Honoured by rest_framework.request.Request in place of its authenticators.
+    sub._force_auth_user = user
+    sub._force_auth_token = auth
+    return sub
+
+
+def _payload(response):
+    content = b'' if response.streaming else response.content
+    if response.get('Content-Type', '').startswith('application/json') and content:
+        return json.loads(content)
+    return content.decode(errors='replace')
+
+
+async def _dispatch(request, user, auth, item, batch_path):
+    method, url = item['method'], urlsplit(item['path'])
+    if method not in BATCH_METHODS:
+        return 405, {'error': f'Only {", ".join(BATCH_METHODS)} requests can be batched'}
+    if not url.path.startswith('/api/') or url.path == batch_path:
+        return 400, {'error': 'Path must be an API endpoint other than the batch endpoint'}
+    try:
+        match = resolve(url.path)
+    except Resolver404:
+        return 404, {'error': 'Not found', 'details': url.path}
+
+    sub = _sub_request(request, user, auth, method, url.path, url.query)
+    try:
+        if iscoroutinefunction(match.func):
+            response = await match.func(sub, *match.args, **match.kwargs)
+        else:
+            # thread_sensitive: every sync view runs on the one shared thread,
+            # and so on the request's database connection.
+            response = await sync_to_async(match.func)(sub, *match.args, **match.kwargs)
+        if hasattr(response, 'render') and not response.is_rendered:
+            # DRF responses, including those of async views' DRF fallbacks.
+            response = await sync_to_async(response.render)()
+    except Http404 as e:
+        return 404, {'error': 'Not found', 'details': str(e)}
+    except PermissionDenied as e:
+        return 403, {'error': 'Permission denied', 'details': str(e)}
+    except Exception as e:
+        log_exception(e, f'Error in batched request: {item["path"]}')
+        return 500, {'error': 'Internal server error',
+                     'details': 'An unexpected error occurred'}
+    return response.status_code, _payload(response)
+
+
+async def run_batch(request, user, auth, items):
+    """
+    Dispatch ``items`` to their views in-process, at most
+    BATCH_CONCURRENCY at a time, returning one result per item in order.
+    Only async views overlap: sync views all run on the request's one
+    thread_sensitive thread, one after another.
+    """
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+
+    async def run(item):
+        async with semaphore:
+            status, body = await _dispatch(request, user, auth, item, request.path)
+        return {'id': item['id'], 'status': status, 'body': body}
+
+    return await asyncio.gather(*(run(item) for item in items))
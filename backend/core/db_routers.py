@@ -0,0 +1,75 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Set by ReplicaRoutingMiddleware for the duration of a request that may read
+# from the replica. Anything outside such a request (writes, admin, commands)
+# keeps using the primary.
+_use_replica = ContextVar('use_replica', default=False)
+
+
+def replica_alias():
+    """Return the configured replica alias, or None when no replica is set up."""
+    alias = getattr(settings, 'DATABASE_READ_REPLICA', None)
+    return alias if alias in settings.DATABASES else None
+
+
+def use_replica(enabled=True):
+    """Route reads in the current context to the replica, or back to the primary."""
+    # Set and cleared explicitly rather than with a reset token: under ASGI the
+    # middleware hooks run in separate sync_to_async contexts.
+    _use_replica.set(enabled)
+
+
+@contextmanager
+def primary_reads():
+    """
+    Read from the primary inside the block, e.g. for a write that first
+    reads rows (or aggregates) during a replica-routed request.
+    """
+    previous = _use_replica.get()
+    _use_replica.set(False)
+    try:
+        yield
+    finally:
+        _use_replica.set(previous)
+
+
+def _pin_key(request):
+    # Authentication runs inside the view, after routing is decided, so the
+    # client is identified by its bearer token or, failing that, its address.
+    identity = request.META.get('HTTP_AUTHORIZATION') or request.META.get('REMOTE_ADDR', '')
+    return f'replica_pin_{hashlib.sha1(identity.encode()).hexdigest()}'
+
+
+def pin_to_primary(request):
+    """Send this client's reads to the primary for REPLICA_STICKY_SECONDS after a write."""
+    timeout = getattr(settings, 'REPLICA_STICKY_SECONDS', 5)
+    if timeout:
+        cache.set(_pin_key(request), True, timeout=timeout)
+
+
+def is_pinned_to_primary(request):
+    return bool(cache.get(_pin_key(request)))
+
+
+class PrimaryReplicaRouter:
+    """
+    Send reads to the replica only when the current request opted in,
+    and every write to the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if _use_replica.get():
+            return replica_alias()
+        return None
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Primary and replica hold the same data.
+        return True
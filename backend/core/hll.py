@@ -0,0 +1,63 @@
+import hashlib
+import math
+import zlib
+
+# 2**11 one-byte registers: 2 KB uncompressed, about 2.3% standard error.
+PRECISION = 11
+
+
+class HyperLogLog:
+    """
+    Approximate distinct counter. Sketches built on different days or
+    workers combine with merge(), and serialize to a compressed blob small
+    enough to store next to the counts it describes.
+    """
+
+    def __init__(self, registers=None, precision=PRECISION):
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers else bytearray(self.size)
+        if len(self.registers) != self.size:
+            raise ValueError('Register count does not match precision')
+
+    @classmethod
+    def from_bytes(cls, data, precision=PRECISION):
+        """Load a sketch from to_bytes() output; empty data gives an empty sketch."""
+        return cls(zlib.decompress(data) if data else None, precision)
+
+    def to_bytes(self):
+        # Mostly-zero registers (small counts) compress to a few bytes.
+        return zlib.compress(bytes(self.registers))
+
+    def add(self, value):
+        digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, 'big')
+        bits = 64 - self.precision
+        index = hashed >> bits
+        rank = bits - (hashed & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values):
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError('Cannot merge sketches of different precision')
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        size = self.size
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            # Linear counting is more accurate while many registers are empty.
+            estimate = size * math.log(size / zeros)
+        return round(estimate)
+
+    def __len__(self):
+        return self.count()
@@ -0,0 +1,141 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import OutboundEmail
+from .utils import log_action, log_exception
+
+# How long a worker owns the rows it claimed before another worker may retry them.
+SEND_LEASE = timedelta(minutes=10)
+
+
+def queue_mail(subject, recipients, body='', template_name='', context=None, from_email=None):
+    """
+    Put an email in the outbox instead of sending it on the request thread.
+
+    Either pass a plain-text ``body`` or a ``template_name`` with a
+    JSON-serializable ``context``; templates are rendered by the worker.
+    """
+    return OutboundEmail.objects.create(
+        to=list(recipients),
+        subject=subject,
+        body=body,
+        template_name=template_name,
+        context=context or {},
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+    )
+
+
+def retry_delay(attempts):
+    """Exponential backoff: 1, 2, 4, ... minutes, capped at a day."""
+    return timedelta(minutes=min(2 ** (attempts - 1), 24 * 60))
+
+
+def claim_batch(batch_size):
+    """Lease up to ``batch_size`` due emails to this worker and return them."""
+    now = timezone.now()
+    due = Q(status='pending') | Q(status='sending')  # expired leases are retried
+    with transaction.atomic():
+        ids = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(due, next_attempt_at__lte=now)
+            .order_by('next_attempt_at')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        OutboundEmail.objects.filter(id__in=ids).update(
+            status='sending', next_attempt_at=now + SEND_LEASE)
+    return list(OutboundEmail.objects.filter(id__in=ids).order_by('id'))
+
+
+def build_message(email, connection):
+    text, html = email.render()
+    message = EmailMultiAlternatives(
+        email.subject, text, email.from_email or settings.DEFAULT_FROM_EMAIL,
+        email.to, connection=connection)
+    if html:
+        message.attach_alternative(html, 'text/html')
+    return message
+
+
+def record_failure(emails, error, max_attempts):
+    """
+    Put ``emails`` back in the queue after a failed attempt, with backoff,
+    or mark them failed once they reach ``max_attempts``.
+    """
+    now = timezone.now()
+    for email in emails:
+        attempts = email.attempts + 1
+        give_up = attempts >= max_attempts
+        updates = {
+            'status': 'failed' if give_up else 'pending',
+            'attempts': attempts,
+            'last_error': str(error)[:2000],
+            'next_attempt_at': now + retry_delay(attempts),
+        }
+        if give_up:
+            # Templates may carry secrets such as password reset links.
+            updates.update(context={}, body='')
+        OutboundEmail.objects.filter(id=email.id).update(**updates)
+
+
+def deliver(emails, max_attempts=5, connection=None):
+    """
+    Send ``emails`` over one reused backend connection and record the outcome
+    of each. If the backend can't be reached, the rest of the batch is
+    released with backoff instead of waiting for its lease to expire.
+    Returns (sent_count, failed_count).
+    """
+    if not emails:
+        return 0, 0
+    connection = connection or get_connection(fail_silently=False)
+    sent_ids = []
+    failed = 0
+
+    try:
+        connection.open()
+    except Exception as e:
+        log_exception(e, 'Error connecting to the email backend')
+        record_failure(emails, e, max_attempts)
+        return 0, len(emails)
+
+    try:
+        for index, email in enumerate(emails):
+            try:
+                connection.send_messages([build_message(email, connection)])
+                sent_ids.append(email.id)
+            except Exception as e:
+                failed += 1
+                record_failure([email], e, max_attempts)
+                log_exception(e, f'Error sending email ID: {email.id}')
+                # A failed SMTP exchange can leave the session unusable.
+                connection.close()
+                try:
+                    connection.open()
+                except Exception as e:
+                    log_exception(e, 'Error reconnecting to the email backend')
+                    remaining = emails[index + 1:]
+                    record_failure(remaining, e, max_attempts)
+                    failed += len(remaining)
+                    break
+    finally:
+        connection.close()
+
+    if sent_ids:
+        # The rendered context is no longer needed once sent.
+        OutboundEmail.objects.filter(id__in=sent_ids).update(
+            status='sent', sent_at=timezone.now(), attempts=F('attempts') + 1,
+            last_error='', context={}, body='')
+    log_action('outbox_batch_sent', None, f'Sent: {len(sent_ids)}, failed: {failed}')
+    return len(sent_ids), failed
+
+
+def purge_outbox(keep_days=7):
+    """Delete sent and failed emails older than ``keep_days``; returns the count removed."""
+    cutoff = timezone.now() - timedelta(days=keep_days)
+    removed, _ = OutboundEmail.objects.filter(
+        status__in=['sent', 'failed'], created_at__lt=cutoff).delete()
+    return removed
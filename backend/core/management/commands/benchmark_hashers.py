@@ -0,0 +1,76 @@
+"""
+Management command to time password hashers and suggest cost settings
+"""
+import time
+
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, PBKDF2PasswordHasher, ScryptPasswordHasher, get_hasher)
+from django.core.management.base import BaseCommand
+
+
+def _time(hasher, rounds):
+    salt = hasher.salt()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        hasher.encode('benchmark-password', salt)
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+class Command(BaseCommand):
+    help = 'Time the configured and candidate password hashers and suggest cost settings for a target login latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--target-ms', type=float, default=50,
+                            help='Target hashing time per login in milliseconds (default: 50)')
+        parser.add_argument('--rounds', type=int, default=3,
+                            help='Hashes timed per measurement (default: 3)')
+
+    def handle(self, *args, **options):
+        target = options['target_ms']
+        rounds = options['rounds']
+
+        current = get_hasher()
+        self.stdout.write(
+            f'Configured hasher: {current.algorithm} ({_time(current, rounds):.1f} ms/hash)')
+        self.stdout.write(f'Stock costs, then the highest cost within {target:.0f} ms:')
+
+        pbkdf2 = PBKDF2PasswordHasher()
+        ms = _time(pbkdf2, rounds)
+        iterations = int(pbkdf2.iterations * target / ms)
+        self.stdout.write(
+            f'  pbkdf2_sha256  {ms:7.1f} ms  ->  ~{iterations} iterations')
+
+        scrypt = ScryptPasswordHasher()
+        self.stdout.write(f'  scrypt         {_time(scrypt, rounds):7.1f} ms')
+        best = None
+        for exponent in range(10, 21):
+            scrypt.work_factor = 2 ** exponent
+            # scrypt needs 128 * n * r bytes of memory; leave headroom over that.
+            scrypt.maxmem = 256 * scrypt.work_factor * scrypt.block_size
+            ms = _time(scrypt, rounds)
+            if ms > target:
+                break
+            best = (exponent, ms)
+        if best:
+            self.stdout.write(
+                f'                 ->  SCRYPT_WORK_FACTOR={2 ** best[0]} ({best[1]:.1f} ms)')
+
+        try:
+            argon2 = Argon2PasswordHasher()
+            self.stdout.write(f'  argon2         {_time(argon2, rounds):7.1f} ms')
+        except ValueError:
+            self.stdout.write(self.style.WARNING('  argon2         not available (pip install argon2-cffi)'))
+        else:
+            best = None
+            for memory_cost in (8192, 16384, 32768, 65536, 102400):
+                argon2.memory_cost = memory_cost
+                ms = _time(argon2, rounds)
+                if ms > target:
+                    break
+                best = (memory_cost, ms)
+            if best:
+                self.stdout.write(
+                    f'                 ->  ARGON2_MEMORY_COST={best[0]} ARGON2_TIME_COST={argon2.time_cost} ({best[1]:.1f} ms)')
+
+        self.stdout.write(self.style.SUCCESS(
+            'Set PASSWORD_HASHER_PROFILE and the suggested values in the environment'))
@@ -0,0 +1,89 @@
+"""
+Management command to compare the stdlib and orjson DRF renderers and parsers on real payloads
+"""
+import io
+import json
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from articles.models import Article
+from articles.serializers import ArticleDetailSerializer, ArticleSerializer
+from comments.serializers import CommentSerializer
+from core.renderers import FastJSONParser, FastJSONRenderer, orjson
+
+
+def _time(func, rounds):
+    started = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+class Command(BaseCommand):
+    help = 'Time the stdlib and orjson JSON renderers and parsers on article list and article page payloads'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page-size', type=int, default=50,
+                            help='Articles in the list payload (default: 50)')
+        parser.add_argument('--rounds', type=int, default=50,
+                            help='Renders/parses timed per measurement (default: 50)')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING(
+                'orjson is not installed (pip install orjson); FastJSONRenderer falls back to the stdlib'))
+
+        articles = Article.objects.filter(status='published').select_related(
+            'author').prefetch_related('categories', 'tags')
+        article = articles.filter(comments__isnull=False).first() or articles.first()
+        if article is None:
+            self.stdout.write(self.style.ERROR('No published articles; run generate_data first'))
+            return
+
+        context = {'request': None}
+        payloads = {
+            'article list': {
+                'count': articles.count(), 'next': None, 'previous': None,
+                'results': ArticleSerializer(articles[:options['page_size']], many=True,
+                                             context=context).data,
+            },
+            'article page': {
+                **ArticleDetailSerializer(article, context=context).data,
+                'comments': CommentSerializer(
+                    article.comments.filter(status='approved', parent=None),
+                    many=True, context=context).data,
+            },
+        }
+
+        rounds = options['rounds']
+        stdlib_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+        stdlib_parser, fast_parser = JSONParser(), FastJSONParser()
+        for name, payload in payloads.items():
+            expected = stdlib_renderer.render(payload)
+            rendered = fast_renderer.render(payload)
+            if json.loads(rendered) != json.loads(expected):
+                self.stdout.write(self.style.ERROR(f'{name}: renderers disagree on the output'))
+                continue
+            if rendered != expected:
+                # Same values; float notation differs (see core.renderers.dumps).
+                self.stdout.write(self.style.WARNING(
+                    f'{name}: same values, but the bytes differ from the stdlib renderer'))
+
+            timings = [
+                _time(lambda: stdlib_renderer.render(payload), rounds),
+                _time(lambda: fast_renderer.render(payload), rounds),
+                _time(lambda: stdlib_parser.parse(io.BytesIO(expected)), rounds),
+                _time(lambda: fast_parser.parse(io.BytesIO(expected)), rounds),
+            ]
+            self.stdout.write(f'{name} ({len(expected) / 1024:.0f} KB):')
+            self.stdout.write(
+                f'  render  stdlib {timings[0]:7.2f} ms  orjson {timings[1]:7.2f} ms  '
+                f'({timings[0] / timings[1]:.1f}x)')
+            self.stdout.write(
+                f'  parse   stdlib {timings[2]:7.2f} ms  orjson {timings[3]:7.2f} ms  '
+                f'({timings[2] / timings[3]:.1f}x)')
+
+        self.stdout.write(self.style.SUCCESS('Select the backend with JSON_BACKEND=orjson|stdlib'))
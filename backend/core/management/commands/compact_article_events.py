@@ -0,0 +1,28 @@
+"""
+Management command to fold buffered article events into the daily rollups
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from articles.analytics import compact_events
+
+
+class Command(BaseCommand):
+    help = 'Compact the append-only article event buffer into the daily, trending and author totals (run one instance periodically)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000,
+                            help='Events folded per transaction (default: 10000)')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running and compact periodically')
+        parser.add_argument('--interval', type=float, default=60,
+                            help='Seconds between runs in --loop mode (default: 60)')
+
+    def handle(self, *args, **options):
+        while True:
+            consumed = compact_events(options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Compacted {consumed} events'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
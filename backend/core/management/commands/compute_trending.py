@@ -0,0 +1,28 @@
+"""
+Management command to rebuild the trending articles ranking
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from articles.trending import compute_trending, prune_activity
+
+
+class Command(BaseCommand):
+    help = 'Score recent article activity with time decay and rebuild the trending ranking (run every few minutes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running and recompute periodically')
+        parser.add_argument('--interval', type=float, default=300,
+                            help='Seconds between runs in --loop mode (default: 300)')
+
+    def handle(self, *args, **options):
+        while True:
+            rows = compute_trending()
+            removed = prune_activity()
+            self.stdout.write(self.style.SUCCESS(
+                f'Ranked {rows} trending entries ({removed} expired activity buckets removed)'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,87 @@
+"""
+Management command to stress the database with concurrent readers and writers
+
+Run it once with the default settings and once with e.g. SQLITE_JOURNAL_MODE=DELETE
+to compare throughput and lock errors between journal modes.
+"""
+import random
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import OperationalError, connection
+from django.db.models import F
+
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    help = 'Run concurrent view-increment writes and list reads against the database and report throughput'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8,
+                            help='Number of concurrent workers (default: 8)')
+        parser.add_argument('--duration', type=float, default=10.0,
+                            help='Seconds to run (default: 10)')
+        parser.add_argument('--write-ratio', type=float, default=0.2,
+                            help='Fraction of operations that are writes (default: 0.2)')
+
+    def handle(self, *args, **options):
+        article_ids = list(
+            Article.objects.filter(status='published').values_list('id', flat=True)[:1000])
+        if not article_ids:
+            raise CommandError(
+                'No published articles found. Run "manage.py generate_data" first.')
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute('PRAGMA journal_mode')
+                journal_mode = cursor.fetchone()[0]
+                cursor.execute('PRAGMA synchronous')
+                synchronous = cursor.fetchone()[0]
+            self.stdout.write(
+                f'SQLite journal_mode={journal_mode} synchronous={synchronous}')
+        connection.close()
+
+        deadline = time.monotonic() + options['duration']
+        lock = threading.Lock()
+        totals = {'reads': 0, 'writes': 0, 'errors': 0}
+
+        def worker(seed):
+            rng = random.Random(seed)
+            counts = {'reads': 0, 'writes': 0, 'errors': 0}
+            try:
+                while time.monotonic() < deadline:
+                    try:
+                        if rng.random() < options['write_ratio']:
+                            Article.objects.filter(pk=rng.choice(article_ids)).update(
+                                views=F('views') + 1)
+                            counts['writes'] += 1
+                        else:
+                            list(Article.objects.filter(status='published')
+                                 .order_by('-publish_date')
+                                 .values('id', 'title', 'views')[:10])
+                            counts['reads'] += 1
+                    except OperationalError:
+                        counts['errors'] += 1
+            finally:
+                connection.close()
+                with lock:
+                    for key, value in counts.items():
+                        totals[key] += value
+
+        started = time.monotonic()
+        workers = [threading.Thread(target=worker, args=(i,))
+                   for i in range(options['threads'])]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        elapsed = time.monotonic() - started
+
+        self.stdout.write(
+            f'Reads:  {totals["reads"]} ({totals["reads"] / elapsed:.0f}/s)')
+        self.stdout.write(
+            f'Writes: {totals["writes"]} ({totals["writes"] / elapsed:.0f}/s)')
+        style = self.style.ERROR if totals['errors'] else self.style.SUCCESS
+        self.stdout.write(style(f'Errors: {totals["errors"]} (database is locked)'))
@@ -0,0 +1,328 @@
+"""
+Management command to generate large volumes of synthetic data for load and performance testing
+"""
+import random
+import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.text import slugify
+
+from articles.content import content_hash, process_content
+from articles.models import Article, ArticleActivity, ArticleLike, BookmarkedArticle
+from categories.models import Category
+from comments.models import Comment
+from subscribers.models import Subscriber
+from tags.models import Tag
+
+User = get_user_model()
+
+WORDS = (
+    'django python react api cache query index database server client request '
+    'response latency throughput design pattern model view template deploy '
+    'container cluster scale monitor test release feature bug review merge '
+    'frontend backend schema migration token session security performance'
+).split()
+
+# Pragmas trading durability for speed while loading. They only apply to the
+# current connection, so regular request handling is unaffected.
+SQLITE_LOAD_PRAGMAS = (
+    'PRAGMA synchronous = OFF',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -262144',
+)
+
+
+class Command(BaseCommand):
+    help = 'Generate synthetic users, taxonomy, articles, comments and reactions in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100,
+                            help='Number of users (default: 100)')
+        parser.add_argument('--categories', type=int, default=20,
+                            help='Number of categories (default: 20)')
+        parser.add_argument('--tags', type=int, default=100,
+                            help='Number of tags (default: 100)')
+        parser.add_argument('--articles', type=int, default=1000,
+                            help='Number of articles (default: 1000)')
+        parser.add_argument('--comments', type=int, default=10000,
+                            help='Number of comments, replies included (default: 10000)')
+        parser.add_argument('--likes', type=int, default=10000,
+                            help='Approximate number of article reactions (default: 10000)')
+        parser.add_argument('--bookmarks', type=int, default=2000,
+                            help='Approximate number of bookmarks (default: 2000)')
+        parser.add_argument('--subscribers', type=int, default=1000,
+                            help='Number of newsletter subscribers (default: 1000)')
+        parser.add_argument('--seed', type=int, default=42,
+                            help='Random seed, identical seeds produce identical content (default: 42)')
+        parser.add_argument('--batch-size', type=int, default=5000,
+                            help='Rows per INSERT batch (default: 5000)')
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.batch_size = options['batch_size']
+        self.now = timezone.now()
+        started = time.monotonic()
+
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                for pragma in SQLITE_LOAD_PRAGMAS:
+                    cursor.execute(pragma)
+
+        with transaction.atomic():
+            users = self.generate_users(options['users'])
+            categories = self.generate_categories(options['categories'])
+            tags = self.generate_tags(options['tags'])
+            articles = self.generate_articles(
+                options['articles'], users, categories, tags)
+            self.generate_comments(options['comments'], users, articles)
+            self.generate_reactions(options['likes'], options['bookmarks'],
+                                    users, articles)
+            self.generate_activity(articles)
+            self.generate_subscribers(options['subscribers'])
+            # Bulk inserts bypass the per-save AuthorStats and related-article
+            # bookkeeping.
+            call_command('rebuild_author_stats', stdout=self.stdout)
+            call_command('rebuild_related_articles', stdout=self.stdout)
+            call_command('compute_trending', stdout=self.stdout)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated data in {time.monotonic() - started:.1f}s'))
+
+    def _offset(self, model):
+        # Unique fields are suffixed with the current max id so repeated runs
+        # never collide, while the generated content itself stays seed-stable.
+        return model.objects.aggregate(max_id=Max('id'))['max_id'] or 0
+
+    def _words(self, count):
+        return ' '.join(self.rng.choices(WORDS, k=count))
+
+    def _bulk(self, model, rows):
+        """Insert an iterable of unsaved instances in batches, returning the saved ones."""
+        created = []
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                created.extend(model.objects.bulk_create(batch))
+                batch = []
+        if batch:
+            created.extend(model.objects.bulk_create(batch))
+        return created
+
+    def _report(self, label, count):
+        self.stdout.write(f'  {label}: {count}')
+
+    def generate_users(self, count):
+        offset = self._offset(User)
+        # Hashing is the slowest part of user creation, so every generated
+        # account shares one precomputed hash of the same password.
+        password = make_password('password123')
+        users = self._bulk(User, (
+            User(
+                email=f'user{offset + i}@example.com',
+                name=f'User {offset + i}',
+                password=password,
+                bio=self._words(12),
+                avatar=None,
+            )
+            for i in range(1, count + 1)
+        ))
+        self._report('Users', len(users))
+        return [user.id for user in users]
+
+    def generate_categories(self, count):
+        offset = self._offset(Category)
+        categories = self._bulk(Category, (
+            Category(
+                name=f'Category {offset + i}',
+                slug=f'category-{offset + i}',
+                description=self._words(10),
+            )
+            for i in range(1, count + 1)
+        ))
+        self._report('Categories', len(categories))
+        return [category.id for category in categories]
+
+    def generate_tags(self, count):
+        offset = self._offset(Tag)
+        tags = self._bulk(Tag, (
+            Tag(name=f'tag-{offset + i}', slug=f'tag-{offset + i}')
+            for i in range(1, count + 1)
+        ))
+        self._report('Tags', len(tags))
+        return [tag.id for tag in tags]
+
+    def _article(self, number, author_ids):
+        rng = self.rng
+        title = self._words(rng.randint(4, 9)).capitalize()
+        paragraphs = [self._words(rng.randint(40, 120))
+                      for _ in range(rng.randint(3, 8))]
+        content = ''.join(f'<h2>{self._words(3)}</h2><p>{p}</p>' for p in paragraphs)
+        summary = process_content(content)
+        status = rng.choices(['published', 'draft', 'pending'], [85, 10, 5])[0]
+        return Article(
+            title=title,
+            slug=f'{slugify(title)[:200]}-{number}',
+            excerpt=paragraphs[0][:200],
+            content=content,
+            status=status,
+            publish_date=(self.now - timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+                          if status == 'published' else None),
+            author_id=rng.choice(author_ids),
+            featured=rng.random() < 0.05,
+            views=int(rng.paretovariate(1.2) * 10),
+            reading_time=summary.reading_time,
+            word_count=summary.word_count,
+            toc=summary.toc,
+            content_html=summary.html,
+            content_hash=content_hash(content),
+        )
+
+    def generate_articles(self, count, author_ids, category_ids, tag_ids):
+        if not author_ids:
+            author_ids = list(User.objects.values_list('id', flat=True))
+        offset = self._offset(Article)
+        articles = self._bulk(Article, (
+            self._article(offset + i, author_ids) for i in range(1, count + 1)))
+        article_ids = [article.id for article in articles]
+
+        # Write the M2M through tables directly instead of calling .set() per article.
+        ArticleCategory = Article.categories.through
+        ArticleTag = Article.tags.through
+        category_links = self._bulk(ArticleCategory, (
+            ArticleCategory(article_id=article_id, category_id=category_id)
+            for article_id in article_ids
+            for category_id in self.rng.sample(
+                category_ids, min(len(category_ids), self.rng.randint(1, 2)))
+        ))
+        tag_links = self._bulk(ArticleTag, (
+            ArticleTag(article_id=article_id, tag_id=tag_id)
+            for article_id in article_ids
+            for tag_id in self.rng.sample(
+                tag_ids, min(len(tag_ids), self.rng.randint(2, 5)))
+        ))
+        self._report('Articles', len(article_ids))
+        self._report('Article categories', len(category_links))
+        self._report('Article tags', len(tag_links))
+        return [article.id for article in articles if article.status == 'published']
+
+    def generate_comments(self, count, user_ids, article_ids):
+        """
+        Insert comments with a prepared executemany rather than bulk_create.
+
+        Comments are the one table expected to reach millions of rows, where
+        the ORM's per-instance SQL compilation dominates. Primary keys are
+        assigned up front so replies can reference parents inserted in the
+        same batch, and the sequence is reset afterwards.
+        """
+        if not article_ids or not count:
+            return
+        rng = self.rng
+        table = Comment._meta.db_table
+        columns = ['id', 'article_id', 'user_id', 'user_name', 'user_email',
+                   'content', 'created_at', 'updated_at', 'status', 'parent_id',
+                   'likes_count', 'dislikes_count', 'flags_count', 'is_edited']
+        sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+            connection.ops.quote_name(table),
+            ', '.join(connection.ops.quote_name(c) for c in columns),
+            ', '.join(['%s'] * len(columns)),
+        )
+        next_id = self._offset(Comment) + 1
+        guest_name, guest_email = ('', '') if user_ids else ('Guest', 'guest@example.com')
+        # Drawing bodies and timestamps from small pools keeps row generation
+        # cheap enough that the INSERTs dominate, not the random text.
+        bodies = [self._words(rng.randint(5, 40)) for _ in range(2048)]
+        timestamps = [
+            connection.ops.adapt_datetimefield_value(
+                self.now - timedelta(minutes=rng.randint(0, 365 * 24 * 60)))
+            for _ in range(4096)
+        ]
+        # Roughly a quarter of the comments reply to an earlier comment in the batch.
+        parents = []
+
+        with connection.cursor() as cursor:
+            for batch_start in range(0, count, self.batch_size):
+                rows = []
+                for _ in range(min(self.batch_size, count - batch_start)):
+                    parent = rng.choice(parents) if parents and rng.random() < 0.25 else None
+                    article_id = parent[1] if parent else rng.choice(article_ids)
+                    created_at = rng.choice(timestamps)
+                    rows.append((
+                        next_id, article_id,
+                        rng.choice(user_ids) if user_ids else None,
+                        guest_name, guest_email,
+                        rng.choice(bodies),
+                        created_at, created_at, 'approved',
+                        parent[0] if parent else None,
+                        0, 0, 0, False,
+                    ))
+                    if parent is None:
+                        parents.append((next_id, article_id))
+                    next_id += 1
+                cursor.executemany(sql, rows)
+                parents = parents[-self.batch_size:]
+
+            for statement in connection.ops.sequence_reset_sql(no_style(), [Comment]):
+                cursor.execute(statement)
+        self._report('Comments', count)
+
+    def _pairs(self, total, user_ids, article_ids):
+        """Yield distinct (user_id, article_id) pairs spread across articles."""
+        if not user_ids or not article_ids or not total:
+            return
+        per_article = max(1, min(len(user_ids), total // len(article_ids)))
+        remaining = total
+        for article_id in article_ids:
+            for user_id in self.rng.sample(user_ids, min(per_article, remaining)):
+                yield user_id, article_id
+            remaining -= per_article
+            if remaining <= 0:
+                return
+
+    def generate_reactions(self, likes, bookmarks, user_ids, article_ids):
+        reactions = self._bulk(ArticleLike, (
+            ArticleLike(user_id=user_id, article_id=article_id,
+                        is_like=self.rng.random() > 0.15)
+            for user_id, article_id in self._pairs(likes, user_ids, article_ids)
+        ))
+        saved = self._bulk(BookmarkedArticle, (
+            BookmarkedArticle(user_id=user_id, article_id=article_id)
+            for user_id, article_id in self._pairs(bookmarks, user_ids, article_ids)
+        ))
+        self._report('Article reactions', len(reactions))
+        self._report('Bookmarks', len(saved))
+
+    def generate_activity(self, article_ids):
+        """Hourly view/like counters over the last 30 days for a share of the articles."""
+        rng = self.rng
+        hour = self.now.replace(minute=0, second=0, microsecond=0)
+        active = rng.sample(article_ids, len(article_ids) // 3)
+        buckets = self._bulk(ArticleActivity, (
+            ArticleActivity(article_id=article_id, bucket=bucket,
+                            views=int(rng.paretovariate(1.5) * 3),
+                            likes=int(rng.random() < 0.2))
+            for article_id in active
+            for bucket in sorted({hour - timedelta(hours=rng.randint(0, 30 * 24))
+                                  for _ in range(rng.randint(1, 24))})
+        ))
+        self._report('Activity buckets', len(buckets))
+
+    def generate_subscribers(self, count):
+        offset = self._offset(Subscriber)
+        subscribers = self._bulk(Subscriber, (
+            Subscriber(
+                email=f'subscriber{offset + i}@example.com',
+                name=f'Subscriber {offset + i}',
+                status='active' if self.rng.random() > 0.1 else 'unsubscribed',
+            )
+            for i in range(1, count + 1)
+        ))
+        self._report('Subscribers', len(subscribers))
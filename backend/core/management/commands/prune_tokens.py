@@ -0,0 +1,47 @@
+"""
+Management command to delete expired JWT outstanding and blacklisted tokens
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding/blacklisted refresh tokens in small batches so the tables stay bounded by the token lifetime'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Tokens deleted per transaction (default: 1000)')
+        parser.add_argument('--pause', type=float, default=0.05,
+                            help='Seconds to pause between batches so writers can get the lock (default: 0.05)')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running and prune periodically')
+        parser.add_argument('--interval', type=float, default=3600,
+                            help='Seconds between runs in --loop mode (default: 3600)')
+
+    def handle(self, *args, **options):
+        while True:
+            deleted = self.prune(options['batch_size'], options['pause'])
+            self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} expired tokens'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def prune(self, batch_size, pause):
+        cutoff = timezone.now()
+        expired = OutstandingToken.objects.filter(expires_at__lt=cutoff).order_by('expires_at')
+        deleted = 0
+        while True:
+            ids = list(expired.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return deleted
+            # Each batch is its own short transaction; blacklist rows go with
+            # their outstanding token through the cascade.
+            with transaction.atomic():
+                OutstandingToken.objects.filter(id__in=ids).delete()
+            deleted += len(ids)
+            if pause:
+                time.sleep(pause)
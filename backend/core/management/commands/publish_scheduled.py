@@ -0,0 +1,28 @@
+"""
+Management command to publish scheduled articles whose publish date has passed
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from articles.scheduling import publish_due
+
+
+class Command(BaseCommand):
+    help = 'Publish due scheduled articles in batches, refresh caches and queue subscriber notifications'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Articles published per transaction (default: 100)')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running and check for due articles periodically')
+        parser.add_argument('--interval', type=float, default=60,
+                            help='Seconds between checks in --loop mode (default: 60)')
+
+    def handle(self, *args, **options):
+        while True:
+            published = publish_due(options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Published {len(published)} scheduled articles'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
@@ -0,0 +1,33 @@
+"""
+Management command to recompute the denormalized author statistics
+"""
+from django.core.management.base import BaseCommand
+
+from users.models import AuthorStats
+
+
+class Command(BaseCommand):
+    help = 'Recompute AuthorStats for every author from articles and likes (after bulk imports or to repair drift)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Rows written per statement (default: 1000)')
+
+    def handle(self, *args, **options):
+        totals = AuthorStats.compute()
+        rows = [
+            AuthorStats(user_id=user_id, total_likes=values.pop('total_likes', 0), **values)
+            for user_id, values in totals.items()
+        ]
+        AuthorStats.objects.bulk_create(
+            rows,
+            batch_size=options['batch_size'],
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=['article_count', 'published_count', 'total_views',
+                           'total_likes', 'last_published_at'],
+        )
+        removed, _ = AuthorStats.objects.exclude(user_id__in=totals.keys()).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt stats for {len(rows)} authors ({removed} stale rows removed)'))
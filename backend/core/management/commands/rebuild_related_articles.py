@@ -0,0 +1,26 @@
+"""
+Management command to recompute every article's related-articles list
+"""
+from django.core.management.base import BaseCommand
+
+from articles.models import Article, RelatedArticle
+
+
+class Command(BaseCommand):
+    help = 'Recompute the precomputed related-articles lists (after bulk imports, taxonomy clean-ups or weight changes)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=200,
+                            help='Articles scored per batch (default: 200)')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        ids = list(Article.objects.order_by('id').values_list('id', flat=True))
+        stored = 0
+        for start in range(0, len(ids), batch_size):
+            neighbors = RelatedArticle.compute(ids[start:start + batch_size])
+            RelatedArticle.store(neighbors)
+            stored += sum(len(ranked) for ranked in neighbors.values())
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt related lists for {len(ids)} articles ({stored} links)'))
@@ -0,0 +1,60 @@
+"""
+Management command to send the newsletter digest to active subscribers
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from subscribers.campaigns import create_digest_campaign, send_campaign
+from subscribers.models import Campaign
+
+
+class Command(BaseCommand):
+    help = 'Render a digest of new articles once and send it to all active subscribers, resuming unfinished campaigns'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=7,
+                            help='Include articles published in the last N days (default: 7)')
+        parser.add_argument('--subject', type=str,
+                            help='Subject line (default: derived from the newest article)')
+        parser.add_argument('--campaign', type=int,
+                            help='Resume this campaign ID instead of the latest unfinished one')
+        parser.add_argument('--chunk-size', type=int, default=500,
+                            help='Subscribers per checkpoint (default: 500)')
+        parser.add_argument('--connections', type=int, default=2,
+                            help='Parallel mail connections (default: 2)')
+        parser.add_argument('--rate', type=float, default=0,
+                            help='Maximum emails per second across all connections (default: unlimited)')
+
+    def handle(self, *args, **options):
+        if options['campaign']:
+            campaign = Campaign.objects.filter(pk=options['campaign']).first()
+            if campaign is None:
+                raise CommandError(f'Campaign {options["campaign"]} does not exist')
+            if campaign.status == 'sent':
+                raise CommandError(f'Campaign {campaign.id} has already been sent')
+        else:
+            campaign = Campaign.objects.filter(status='sending').order_by('created_at').first()
+
+        if campaign is not None:
+            self.stdout.write(
+                f'Resuming campaign {campaign.id} after subscriber {campaign.last_subscriber_id}')
+        else:
+            campaign = create_digest_campaign(options['days'], options['subject'])
+            if campaign is None:
+                self.stdout.write(self.style.WARNING('No new articles to send'))
+                return
+            self.stdout.write(f'Created campaign {campaign.id}: {campaign.subject}')
+
+        try:
+            campaign = send_campaign(
+                campaign,
+                chunk_size=options['chunk_size'],
+                connections=max(1, options['connections']),
+                rate=options['rate'],
+                progress=lambda c: self.stdout.write(f'  {c.sent_count} sent, {c.failed_count} failed'),
+            )
+        except Exception as e:
+            raise CommandError(
+                f'Campaign {campaign.id} stopped after subscriber {campaign.last_subscriber_id}: '
+                f'{e}. Run the command again to resume.')
+        self.stdout.write(self.style.SUCCESS(
+            f'Campaign {campaign.id} finished: {campaign.sent_count} sent, {campaign.failed_count} failed'))
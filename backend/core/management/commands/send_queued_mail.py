@@ -0,0 +1,43 @@
+"""
+Management command to deliver emails queued in the outbox
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.mail import claim_batch, deliver, purge_outbox
+
+
+class Command(BaseCommand):
+    help = 'Send queued outbox emails over a reused connection, retrying failures with backoff'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Emails sent per connection (default: 100)')
+        parser.add_argument('--max-attempts', type=int, default=5,
+                            help='Attempts before an email is marked failed (default: 5)')
+        parser.add_argument('--keep-days', type=int, default=7,
+                            help='Days to keep sent and failed emails before purging them (default: 7)')
+        parser.add_argument('--loop', action='store_true',
+                            help='Keep running and poll for new emails')
+        parser.add_argument('--interval', type=float, default=5.0,
+                            help='Seconds between polls in --loop mode (default: 5)')
+
+    def handle(self, *args, **options):
+        while True:
+            total_sent = total_failed = 0
+            while True:
+                emails = claim_batch(options['batch_size'])
+                if not emails:
+                    break
+                sent, failed = deliver(emails, options['max_attempts'])
+                total_sent += sent
+                total_failed += failed
+
+            purged = purge_outbox(options['keep_days'])
+            if total_sent or total_failed or purged or not options['loop']:
+                self.stdout.write(self.style.SUCCESS(
+                    f'Sent {total_sent} emails, {total_failed} failed, purged {purged}'))
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
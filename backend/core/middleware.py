@@ -2,6 +2,8 @@ from django.middleware.gzip import GZipMiddleware
 from rest_framework.response import Response
 from rest_framework import status
 from django.utils.deprecation import MiddlewareMixin
+from rest_framework.permissions import SAFE_METHODS
+from .db_routers import is_pinned_to_primary, pin_to_primary, replica_alias, use_replica
 import json
 
 
@@ -31,7 +33,8 @@ class CustomGZipMiddleware(GZipMiddleware):
                 response.content = compressed_content
                 response['Content-Encoding'] = 'gzip'
                 response['Content-Length'] = str(len(compressed_content))
-        return response
+            return response
+        return super().process_response(request, response)
 
     def should_compress(self, request, response, content):
         # Check for gzip support in request
@@ -50,3 +53,26 @@ class CustomGZipMiddleware(GZipMiddleware):
             gzip_file.write(content if isinstance(
                 content, bytes) else content.encode('utf-8'))
         return stream.getvalue()
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Route safe requests to views marked ``read_from_replica = True`` to the read
+    replica, unless the client wrote something within REPLICA_STICKY_SECONDS.
+    """
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in SAFE_METHODS or not replica_alias():
+            return None
+        view_class = getattr(view_func, 'cls', None) or getattr(view_func, 'view_class', None)
+        if getattr(view_class, 'read_from_replica', False) and not is_pinned_to_primary(request):
+            request.uses_replica = True
+            use_replica(True)
+        return None
+
+    def process_response(self, request, response):
+        if getattr(request, 'uses_replica', False):
+            use_replica(False)
+        elif request.method not in SAFE_METHODS and response.status_code < 400 and replica_alias():
+            pin_to_primary(request)
+        return response
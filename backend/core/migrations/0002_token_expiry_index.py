@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 02:01
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Index the third-party outstanding-token table on expires_at so that
+    prune_tokens finds expired rows without scanning the whole table.
+    """
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            'CREATE INDEX IF NOT EXISTS token_blacklist_outstanding_expires_idx '
+            'ON token_blacklist_outstandingtoken (expires_at)',
+            'DROP INDEX IF EXISTS token_blacklist_outstanding_expires_idx',
+        ),
+    ]
@@ -1,3 +1,47 @@
 from django.db import models
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.html import strip_tags
 
-# Create your models here.
+
+class OutboundEmail(models.Model):
+    """An email waiting in the outbox for the send_queued_mail worker."""
+    STATUS_CHOICES = (
+        ('pending', 'Pending'),
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+        ('failed', 'Failed'),
+    )
+
+    to = models.JSONField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    template_name = models.CharField(max_length=255, blank=True)
+    context = models.JSONField(default=dict, blank=True)
+    from_email = models.CharField(max_length=255, blank=True)
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    # When the row may next be picked up: the retry time for pending rows and
+    # the lease expiry for rows a worker is currently sending.
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'outbound_emails'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.subject} -> {", ".join(self.to)} ({self.status})'
+
+    def render(self):
+        """Return (plain_text, html) bodies, rendering the template if one is set."""
+        if not self.template_name:
+            return self.body, None
+        html = render_to_string(self.template_name, self.context)
+        return self.body or strip_tags(html), html
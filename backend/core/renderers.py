@@ -0,0 +1,97 @@
+import codecs
+import math
+from decimal import Decimal
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    # Datetimes go through DRF's encoder so they keep its format ('Z' for UTC);
+    # UUIDs, dataclasses and str/dict/list subclasses are native.
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Values _has_non_finite() skips without further type checks.
+_SCALARS = frozenset({str, int, bool, type(None)})
+
+# Decimals, lazy translation strings, querysets, timedeltas, ... as DRF encodes them.
+_default = JSONEncoder().default
+
+
+def _has_non_finite(data):
+    """Whether ``data`` holds a NaN or infinite float or Decimal anywhere."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if type(value) in _SCALARS:
+            continue
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, Decimal) and not value.is_finite():
+            return True
+    return False
+
+
+def dumps(data):
+    """
+    Compact JSON bytes for ``data``, with orjson when it is installed. The
+    result parses to the same values as DRF's JSONRenderer (UNICODE_JSON,
+    COMPACT_JSON) output but is not byte-identical: floats use the shortest
+    notation (0.00001 and 1e16 where the stdlib writes 1e-05 and 1e+16).
+    Non-finite floats raise ValueError, as they do with STRICT_JSON.
+    """
+    if orjson is not None:
+        try:
+            rendered = orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits, recursion limits: let the stdlib decide.
+            pass
+        else:
+            if b'null' in rendered and _has_non_finite(data):
+                # orjson writes NaN and infinity as null; the stdlib raises.
+                return JSONRenderer().render(data)
+            # Keep the output a strict JavaScript subset, as DRF does.
+            return rendered.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return JSONRenderer().render(data)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer using orjson for compact output. Indented output (the
+    browsable API, ``Accept: application/json; indent=4``) and non-default
+    ensure_ascii/compact settings fall back to the stdlib renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (orjson is None or self.ensure_ascii or not self.compact
+                or self.get_indent(accepted_media_type, renderer_context or {}) is not None):
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class FastJSONParser(JSONParser):
+    """JSONParser using orjson for UTF-8 bodies; it rejects NaN and Infinity like STRICT_JSON."""
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        if orjson is None or not self.strict or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
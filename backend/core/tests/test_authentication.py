@@ -0,0 +1,66 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.authentication import CachedUserJWTAuthentication
+from users.models import User, auth_cache_key
+
+
+@override_settings(JWT_USER_CACHE_SECONDS=30)
+class CachedUserJWTAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='reader@example.com', name='Reader')
+
+    def setUp(self):
+        cache.clear()
+        self.header = {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(self.user).access_token}'}
+
+    def authenticate(self, method='get'):
+        request = getattr(RequestFactory(), method)('/api/articles/', **self.header)
+        user, _token = CachedUserJWTAuthentication().authenticate(request)
+        return user
+
+    def test_reads_reuse_the_cached_user(self):
+        self.authenticate()
+
+        with self.assertNumQueries(0):
+            user = self.authenticate()
+
+        self.assertEqual((user.pk, user.email, user.role), (self.user.pk, 'reader@example.com', 'user'))
+        # The password hash never goes into the cache.
+        self.assertIn('password', user.get_deferred_fields())
+        self.assertNotIn('password', cache.get(auth_cache_key(self.user.pk)))
+
+    def test_writes_load_the_user_from_the_database(self):
+        for method in ('post', 'patch', 'delete'):
+            with self.subTest(method=method), self.assertNumQueries(1):
+                self.authenticate(method)
+
+        self.assertIsNone(cache.get(auth_cache_key(self.user.pk)))
+
+    def test_saving_the_user_evicts_the_cached_copy(self):
+        self.authenticate()
+
+        self.user.role = 'admin'
+        self.user.save(update_fields=['role'])
+
+        self.assertIsNone(cache.get(auth_cache_key(self.user.pk)))
+        self.assertEqual(self.authenticate().role, 'admin')
+
+    def test_deactivated_users_are_refused_after_save(self):
+        self.authenticate()
+
+        self.user.is_active = False
+        self.user.save(update_fields=['is_active'])
+
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    def test_deleting_the_user_evicts_the_cached_copy(self):
+        self.authenticate()
+
+        self.user.delete()
+
+        self.assertIsNone(cache.get(auth_cache_key(self.user.pk)))
@@ -0,0 +1,112 @@
+import asyncio
+from unittest import mock
+
+from django.http import JsonResponse
+from django.test import TestCase, override_settings
+from django.urls import resolve
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.models import Article
+from tags.models import Tag
+from users.models import User
+
+
+class BatchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='reader@example.com', name='Reader')
+        author = User.objects.create(email='author@example.com', name='Author')
+        Tag.objects.create(name='Python', slug='python')
+        Article.objects.create(title='Batched article', author=author, status='published',
+                               content='<p>Body</p>')
+
+    def batch(self, requests, **extra):
+        return self.client.post('/api/batch/', {'requests': requests},
+                                content_type='application/json', **extra)
+
+    def results(self, requests, **extra):
+        response = self.batch(requests, **extra)
+        self.assertEqual(response.status_code, 200)
+        return {result['id']: result for result in response.json()['responses']}
+
+    def test_sync_and_async_views_in_request_order(self):
+        response = self.batch([
+            {'id': 'tags', 'path': '/api/tags/'},
+            {'id': 'articles', 'path': '/api/articles/?page_size=5'},
+            {'id': 'health', 'path': '/api/health/'},
+        ])
+
+        responses = response.json()['responses']
+        self.assertEqual([result['id'] for result in responses], ['tags', 'articles', 'health'])
+        self.assertEqual([result['status'] for result in responses], [200, 200, 200])
+        self.assertEqual(responses[0]['body']['results'][0]['slug'], 'python')
+        self.assertEqual(responses[1]['body']['results'][0]['title'], 'Batched article')
+        self.assertEqual(responses[2]['body']['status'], 'healthy')
+
+    def test_sub_requests_use_the_batch_user(self):
+        auth = f'Bearer {RefreshToken.for_user(self.user).access_token}'
+
+        signed_in = self.results([{'id': 'me', 'path': '/api/users/profile/'}],
+                                 HTTP_AUTHORIZATION=auth)
+        anonymous = self.results([{'id': 'me', 'path': '/api/users/profile/'}])
+
+        self.assertEqual(signed_in['me']['status'], 200)
+        self.assertEqual(signed_in['me']['body']['email'], 'reader@example.com')
+        self.assertEqual(anonymous['me']['status'], 403)
+
+    def test_rejected_sub_requests(self):
+        results = self.results([
+            {'id': 'post', 'method': 'POST', 'path': '/api/tags/'},
+            {'id': 'recursive', 'path': '/api/batch/'},
+            {'id': 'outside', 'path': '/admin/'},
+            {'id': 'missing', 'path': '/api/nothing-here/'},
+        ])
+
+        self.assertEqual({id: result['status'] for id, result in results.items()},
+                         {'post': 405, 'recursive': 400, 'outside': 400, 'missing': 404})
+        self.assertFalse(Tag.objects.exclude(slug='python').exists())
+
+    @override_settings(BATCH_MAX_REQUESTS=2)
+    def test_request_limit(self):
+        response = self.batch([{'path': '/api/tags/'}] * 3)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('At most 2', response.json()['error'])
+
+    def test_malformed_bodies(self):
+        for body in ({}, {'requests': []}, {'requests': [{'method': 'GET'}]}):
+            response = self.client.post('/api/batch/', body, content_type='application/json')
+            self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/batch/', 'not json', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+    @override_settings(BATCH_CONCURRENCY=2)
+    def test_concurrency_cap(self):
+        running = peak = 0
+
+        async def slow_view(request):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return JsonResponse({'ok': True})
+
+        def fake_resolve(path):
+            if path.startswith('/api/slow/'):
+                return mock.Mock(func=slow_view, args=(), kwargs={})
+            return resolve(path)
+
+        with mock.patch('core.batch.resolve', fake_resolve):
+            results = self.results([{'id': i, 'path': f'/api/slow/{i}/'} for i in range(6)])
+
+        self.assertEqual([result['status'] for result in results.values()], [200] * 6)
+        self.assertEqual(peak, 2)
+
+    def test_invalid_token_details_are_json(self):
+        response = self.batch([{'path': '/api/tags/'}], HTTP_AUTHORIZATION='Bearer not-a-token')
+
+        self.assertEqual(response.status_code, 401)
+        details = response.json()['details']
+        self.assertEqual(details['code'], 'token_not_valid')
+        self.assertIsInstance(details['messages'], list)
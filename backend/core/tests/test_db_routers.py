@@ -0,0 +1,102 @@
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from articles.models import Article
+from blog_backend.test_settings import TEST_REPLICA_ALIAS
+from core.db_routers import (
+    PrimaryReplicaRouter, is_pinned_to_primary, pin_to_primary, primary_reads, replica_alias,
+    use_replica)
+from tags.models import Tag
+from users.models import User
+
+with_replica = override_settings(DATABASE_READ_REPLICA=TEST_REPLICA_ALIAS)
+
+
+def copy_to_replica(*objects):
+    """Insert rows already saved on the primary into the replica, as replication would."""
+    for obj in objects:
+        type(obj).objects.using(TEST_REPLICA_ALIAS).bulk_create([obj])
+
+
+class PrimaryReplicaRouterTests(TestCase):
+    databases = {'default', TEST_REPLICA_ALIAS}
+
+    def tearDown(self):
+        use_replica(False)
+
+    def test_reads_use_primary_unless_request_opted_in(self):
+        router = PrimaryReplicaRouter()
+        with with_replica:
+            self.assertIsNone(router.db_for_read(Tag))
+            use_replica(True)
+            self.assertEqual(router.db_for_read(Tag), TEST_REPLICA_ALIAS)
+            self.assertEqual(router.db_for_write(Tag), 'default')
+            with primary_reads():
+                self.assertIsNone(router.db_for_read(Tag))
+            self.assertEqual(router.db_for_read(Tag), TEST_REPLICA_ALIAS)
+
+    def test_no_replica_configured(self):
+        self.assertIsNone(replica_alias())
+        use_replica(True)
+        self.assertIsNone(PrimaryReplicaRouter().db_for_read(Tag))
+
+
+class StickyPrimaryTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def test_pinned_per_client_after_write(self):
+        writer = self.factory.post('/api/tags/', HTTP_AUTHORIZATION='Bearer writer')
+        pin_to_primary(writer)
+        self.assertTrue(is_pinned_to_primary(self.factory.get('/', HTTP_AUTHORIZATION='Bearer writer')))
+        self.assertFalse(is_pinned_to_primary(self.factory.get('/', HTTP_AUTHORIZATION='Bearer other')))
+
+    @override_settings(REPLICA_STICKY_SECONDS=0)
+    def test_sticky_window_disabled(self):
+        request = self.factory.post('/api/tags/')
+        pin_to_primary(request)
+        self.assertFalse(is_pinned_to_primary(request))
+
+
+@with_replica
+class ReplicaRoutingMiddlewareTests(TestCase):
+    databases = {'default', TEST_REPLICA_ALIAS}
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(email='reader@example.com', name='Reader')
+        self.auth = f'Bearer {RefreshToken.for_user(self.user).access_token}'
+        copy_to_replica(self.user)
+
+    def test_safe_request_to_marked_view_reads_replica(self):
+        Tag.objects.create(name='Primary only', slug='primary-only')
+        response = self.client.get('/api/tags/')
+        self.assertEqual(response.json()['count'], 0)
+
+        Tag.objects.using(TEST_REPLICA_ALIAS).create(name='Replicated', slug='replicated')
+        response = self.client.get('/api/tags/')
+        self.assertEqual([tag['slug'] for tag in response.json()['results']], ['replicated'])
+
+    def test_client_reads_primary_after_write(self):
+        response = self.client.post('/api/tags/', {'name': 'Fresh tag'},
+                                    content_type='application/json', HTTP_AUTHORIZATION=self.auth)
+        self.assertEqual(response.status_code, 201)
+
+        response = self.client.get('/api/tags/', HTTP_AUTHORIZATION=self.auth)
+        self.assertEqual([tag['name'] for tag in response.json()['results']], ['Fresh tag'])
+        # Other clients are not pinned and still see the (lagging) replica.
+        self.assertEqual(self.client.get('/api/tags/').json()['count'], 0)
+
+    def test_view_count_written_to_primary_from_replica_read(self):
+        article = Article.objects.create(
+            title='Replicated article', content='x' * 200, author=self.user, status='published')
+        copy_to_replica(Article.objects.get(pk=article.pk))
+        # The primary is ahead of the replica.
+        Article.objects.filter(pk=article.pk).update(views=5)
+
+        response = self.client.get(f'/api/articles/{article.slug}/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Article.objects.get(pk=article.pk).views, 6)
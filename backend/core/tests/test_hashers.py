@@ -0,0 +1,50 @@
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher, make_password
+from django.test import TestCase, override_settings
+
+from core.hashers import TunedScryptPasswordHasher
+from users.models import User
+
+TUNED_HASHERS = [
+    'core.hashers.TunedScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+]
+
+
+class LegacyPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = 1000
+
+
+class CheaperScryptPasswordHasher(ScryptPasswordHasher):
+    work_factor = 2 ** 10
+
+
+@override_settings(PASSWORD_HASHERS=TUNED_HASHERS)
+class PasswordUpgradeTests(TestCase):
+    def login(self, user, password='correct horse'):
+        return self.client.post('/api/users/login/', {'email': user.email, 'password': password})
+
+    def create_user(self, encoded):
+        user = User.objects.create(email='reader@example.com', name='Reader')
+        User.objects.filter(pk=user.pk).update(password=encoded)
+        return user
+
+    def test_login_upgrades_a_legacy_hash(self):
+        user = self.create_user(make_password('correct horse', hasher=LegacyPBKDF2PasswordHasher()))
+
+        self.assertEqual(self.login(user, 'wrong').status_code, 401)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+        self.assertEqual(self.login(user).status_code, 200)
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('scrypt$'))
+        self.assertTrue(user.check_password('correct horse'))
+
+    def test_login_retunes_a_hash_with_old_parameters(self):
+        user = self.create_user(make_password('correct horse', hasher=CheaperScryptPasswordHasher()))
+
+        self.assertEqual(self.login(user).status_code, 200)
+
+        user.refresh_from_db()
+        hasher = TunedScryptPasswordHasher()
+        self.assertEqual(hasher.decode(user.password)['work_factor'], hasher.work_factor)
@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase
+from django.utils import timezone
+
+from core.mail import claim_batch, deliver, purge_outbox, queue_mail, retry_delay
+from core.models import OutboundEmail
+
+
+class UnreachableBackend(EmailBackend):
+    def open(self):
+        raise ConnectionRefusedError('Connection refused')
+
+
+class FailingBackend(EmailBackend):
+    """Fails messages sent to the given addresses."""
+
+    def __init__(self, fail_to=(), **kwargs):
+        super().__init__(**kwargs)
+        self.fail_to = set(fail_to)
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.fail_to & set(message.to):
+                raise OSError('Recipient refused')
+        return super().send_messages(messages)
+
+
+class OutboxTests(TestCase):
+    def queue(self, to='reader@example.com', **kwargs):
+        return queue_mail('Hello', [to], body='Secret link', **kwargs)
+
+    def test_queue_mail_does_not_send(self):
+        email = self.queue()
+
+        self.assertEqual(email.status, 'pending')
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_deliver_sends_and_clears_content(self):
+        email = self.queue()
+
+        self.assertEqual(deliver(claim_batch(10)), (1, 0))
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['reader@example.com'])
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'sent')
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual((email.body, email.context), ('', {}))
+        self.assertEqual(claim_batch(10), [])
+
+    def test_failed_send_is_retried_with_backoff(self):
+        failing = self.queue('bounce@example.com')
+        sent = self.queue()
+
+        before = timezone.now()
+        result = deliver(claim_batch(10), connection=FailingBackend(fail_to=['bounce@example.com']))
+
+        self.assertEqual(result, (1, 1))
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, 'pending')
+        self.assertEqual(failing.attempts, 1)
+        self.assertEqual(failing.last_error, 'Recipient refused')
+        self.assertGreaterEqual(failing.next_attempt_at, before + retry_delay(1))
+        sent.refresh_from_db()
+        self.assertEqual(sent.status, 'sent')
+        # Not due again until the backoff has passed.
+        self.assertEqual(claim_batch(10), [])
+
+    def test_gives_up_after_max_attempts(self):
+        email = self.queue('bounce@example.com')
+        OutboundEmail.objects.filter(pk=email.pk).update(attempts=4)
+
+        result = deliver(claim_batch(10), max_attempts=5,
+                         connection=FailingBackend(fail_to=['bounce@example.com']))
+
+        self.assertEqual(result, (0, 1))
+        email.refresh_from_db()
+        self.assertEqual(email.status, 'failed')
+        self.assertEqual(email.attempts, 5)
+        self.assertEqual(email.body, '')
+
+    def test_unreachable_backend_releases_batch(self):
+        emails = [self.queue(), self.queue('other@example.com')]
+
+        before = timezone.now()
+        result = deliver(claim_batch(10), connection=UnreachableBackend())
+
+        self.assertEqual(result, (0, 2))
+        for email in emails:
+            email.refresh_from_db()
+            self.assertEqual(email.status, 'pending')
+            self.assertEqual(email.attempts, 1)
+            self.assertEqual(email.last_error, 'Connection refused')
+            self.assertGreaterEqual(email.next_attempt_at, before + retry_delay(1))
+
+    def test_purge_outbox_removes_old_finished_emails(self):
+        old_sent, old_pending, recent_sent = self.queue(), self.queue(), self.queue()
+        OutboundEmail.objects.filter(pk__in=[old_sent.pk, recent_sent.pk]).update(status='sent')
+        OutboundEmail.objects.filter(pk__in=[old_sent.pk, old_pending.pk]).update(
+            created_at=timezone.now() - timedelta(days=8))
+
+        self.assertEqual(purge_outbox(keep_days=7), 1)
+
+        self.assertEqual(
+            set(OutboundEmail.objects.values_list('pk', flat=True)),
+            {old_pending.pk, recent_sent.pk})
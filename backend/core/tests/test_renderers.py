@@ -0,0 +1,35 @@
+import json
+from decimal import Decimal
+from unittest import skipIf
+
+from django.test import SimpleTestCase
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer, dumps, orjson
+
+
+@skipIf(orjson is None, 'orjson is not installed')
+class FastJSONRendererTests(SimpleTestCase):
+    def test_same_bytes_for_typical_payloads(self):
+        data = {'title': 'Café  ', 'views': 2 ** 70, 'score': 0.1, 'tags': [1, 2]}
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_float_notation_differs_but_values_match(self):
+        for value, stdlib, fast in ((0.00001, b'1e-05', b'0.00001'), (1e16, b'1e+16', b'1e16')):
+            self.assertEqual(JSONRenderer().render(value), stdlib)
+            self.assertEqual(dumps(value), fast)
+            self.assertEqual(json.loads(fast), value)
+
+    def test_non_finite_numbers_raise_like_drf(self):
+        for data in (float('nan'), [1, {'score': float('inf')}], {'ratio': Decimal('-Infinity')}):
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    JSONRenderer().render(data)
+                with self.assertRaises(ValueError):
+                    FastJSONRenderer().render(data)
+
+    def test_null_values_still_render(self):
+        data = {'image': None, 'score': 1.5, 'tags': [None]}
+
+        self.assertEqual(dumps(data), b'{"image":null,"score":1.5,"tags":[null]}')
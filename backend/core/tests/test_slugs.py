@@ -0,0 +1,85 @@
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from core.utils import SLUG_SAVE_ATTEMPTS, generate_unique_slug, save_with_unique_slug
+from tags.models import Tag
+
+
+class GenerateUniqueSlugTests(TestCase):
+    def test_picks_the_next_free_suffix(self):
+        for slug in ('python', 'python-2', 'python-7', 'python-tips', 'python-3-x'):
+            Tag.objects.create(name=slug, slug=slug)
+
+        self.assertEqual(generate_unique_slug(Tag(name='Python'), 'name'), 'python-8')
+        self.assertEqual(generate_unique_slug(Tag(name='Django'), 'name'), 'django')
+
+    def test_transliterates_and_falls_back(self):
+        self.assertEqual(generate_unique_slug(Tag(name='Привет, мир'), 'name'), 'privet-mir')
+        self.assertRegex(generate_unique_slug(Tag(name='☕ !'), 'name'), r'^item-[a-z0-9]{8}$')
+
+    def test_truncates_to_leave_room_for_a_suffix(self):
+        name = 'word-' * 10
+        first = Tag.objects.create(name=name)
+
+        second = Tag.objects.create(name=name)
+
+        self.assertEqual(first.slug, ('word-' * 9)[:-1])
+        self.assertEqual(second.slug, f'{first.slug}-1')
+        self.assertLessEqual(len(second.slug), Tag._meta.get_field('slug').max_length)
+
+
+class SaveWithUniqueSlugTests(TestCase):
+    def race(self, times):
+        """
+        Patch slug generation so another writer inserts each of the first
+        ``times`` generated slugs between the check and our insert.
+        """
+        calls = []
+
+        def generate(model_instance, slugify_field_name, slug=None):
+            slug = generate_unique_slug(model_instance, slugify_field_name, slug)
+            calls.append(slug)
+            if len(calls) <= times:
+                Tag.objects.create(name='Concurrent', slug=slug)
+            return slug
+
+        return mock.patch('core.utils.generate_unique_slug', generate), calls
+
+    def test_retries_when_a_concurrent_insert_takes_the_slug(self):
+        tag = Tag(name='Python')
+        race, calls = self.race(times=1)
+
+        with race:
+            tag.save()
+
+        self.assertEqual(calls, ['python', 'python-1'])
+        self.assertEqual(Tag.objects.get(pk=tag.pk).slug, 'python-1')
+
+    def test_other_integrity_errors_are_not_retried(self):
+        attempts = []
+
+        def save(*args, **kwargs):
+            attempts.append(1)
+            raise IntegrityError('NOT NULL constraint failed')
+
+        with self.assertRaises(IntegrityError):
+            save_with_unique_slug(Tag(name='Python'), 'name', save)
+        self.assertEqual(len(attempts), 1)
+
+    def test_gives_up_after_repeated_collisions(self):
+        race, calls = self.race(times=SLUG_SAVE_ATTEMPTS)
+
+        with race, self.assertRaises(IntegrityError):
+            Tag(name='Python').save()
+        self.assertEqual(len(calls), SLUG_SAVE_ATTEMPTS)
+        self.assertFalse(Tag.objects.filter(name='Python').exists())
+
+    def test_existing_slug_is_kept(self):
+        tag = Tag.objects.create(name='Python', slug='custom')
+
+        tag.name = 'Python 3'
+        tag.save()
+
+        self.assertEqual(Tag.objects.get(pk=tag.pk).slug, 'custom')
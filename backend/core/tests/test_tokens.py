@@ -0,0 +1,72 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from core.tokens import CachedBlacklistRefreshToken
+from users.models import User
+
+
+class CachedBlacklistRefreshTokenTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(email='reader@example.com', name='Reader')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_issuing_records_the_outstanding_token(self):
+        token = CachedBlacklistRefreshToken.for_user(self.user)
+
+        outstanding = OutstandingToken.objects.get(jti=token['jti'])
+        self.assertEqual((outstanding.user_id, outstanding.token), (self.user.pk, str(token)))
+
+    def test_blacklisted_token_is_refused(self):
+        token = CachedBlacklistRefreshToken.for_user(self.user)
+        token.blacklist()
+
+        for cached in (False, True):
+            with self.subTest(cached=cached), override_settings(JWT_BLACKLIST_CACHE=cached), \
+                    self.assertRaises(TokenError):
+                CachedBlacklistRefreshToken(str(token))
+        self.assertTrue(BlacklistedToken.objects.filter(token__jti=token['jti']).exists())
+
+    @override_settings(JWT_BLACKLIST_CACHE=True)
+    def test_cached_check_needs_no_query(self):
+        token = CachedBlacklistRefreshToken.for_user(self.user)
+
+        with self.assertNumQueries(0):
+            CachedBlacklistRefreshToken(str(token))
+
+    def test_rotation_blacklists_the_used_token(self):
+        refresh = str(CachedBlacklistRefreshToken.for_user(self.user))
+
+        first = self.client.post('/api/users/refresh/', {'refresh': refresh})
+        reused = self.client.post('/api/users/refresh/', {'refresh': refresh})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('refresh', first.json())
+        self.assertEqual(reused.status_code, 401)
+
+
+class PruneTokensTests(TestCase):
+    def test_deletes_only_expired_tokens(self):
+        user = User.objects.create(email='reader@example.com', name='Reader')
+        now = timezone.now()
+        for n, expires_at in enumerate([now - timedelta(days=2), now - timedelta(minutes=1),
+                                        now + timedelta(hours=1)]):
+            token = OutstandingToken.objects.create(
+                user=user, jti=f'jti-{n}', token=f'token-{n}', expires_at=expires_at)
+            BlacklistedToken.objects.create(token=token)
+
+        out = StringIO()
+        call_command('prune_tokens', batch_size=1, pause=0, stdout=out)
+
+        self.assertIn('Deleted 2 expired tokens', out.getvalue())
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), ['jti-2'])
+        self.assertEqual(BlacklistedToken.objects.count(), 1)
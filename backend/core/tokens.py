@@ -0,0 +1,59 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+def blacklist_cache_key(jti):
+    return f'jwt_blacklisted_{jti}'
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    """
+    Refresh token for the rotation hot path.
+
+    Blacklisted jtis are also written to the cache until the token would have
+    expired anyway. With JWT_BLACKLIST_CACHE enabled the blacklist check reads
+    only the cache, which is only safe when every worker shares it (e.g. Redis)
+    and tokens are blacklisted through this class. The outstanding-token rows
+    are written with the user id from the payload instead of fetching the user.
+    """
+
+    def _outstanding_defaults(self):
+        return {
+            'user_id': self.payload.get(api_settings.USER_ID_CLAIM),
+            'created_at': self.current_time,
+            'token': str(self),
+            'expires_at': datetime_from_epoch(self.payload['exp']),
+        }
+
+    def check_blacklist(self):
+        if not getattr(settings, 'JWT_BLACKLIST_CACHE', False):
+            return super().check_blacklist()
+        if cache.get(blacklist_cache_key(self.payload[api_settings.JTI_CLAIM])):
+            raise TokenError(_('Token is blacklisted'))
+
+    def blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        token, _created = OutstandingToken.objects.get_or_create(
+            jti=jti, defaults=self._outstanding_defaults())
+        blacklisted, _created = BlacklistedToken.objects.get_or_create(token=token)
+
+        remaining = int(self.payload['exp'] - self.current_time.timestamp())
+        if remaining > 0:
+            cache.set(blacklist_cache_key(jti), True, timeout=remaining)
+        return blacklisted
+
+    def outstand(self):
+        # Called right after set_jti(), so the jti is new and needs no lookup.
+        return OutstandingToken.objects.create(
+            jti=self.payload[api_settings.JTI_CLAIM], **self._outstanding_defaults())
+
+
+class CachedBlacklistTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = CachedBlacklistRefreshToken
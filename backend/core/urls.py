@@ -3,4 +3,5 @@ from . import views
 
 urlpatterns = [
     path('health/', views.health_check, name='health-check'),
+    path('batch/', views.batch, name='batch'),
 ]
@@ -1,4 +1,6 @@
+from django.db import IntegrityError, transaction
 from django.db.models import Q
+import re
 from functools import reduce
 import operator
 from rest_framework.pagination import PageNumberPagination
@@ -19,6 +21,8 @@ from django.core.files import File
 
 logger = logging.getLogger(__name__)
 
+SLUG_SAVE_ATTEMPTS = 5
+
 
 def get_search_filter(search_fields, search_term):
     if not search_term:
@@ -67,12 +71,16 @@ class StandardResultsSetPagination(PageNumberPagination):
 def generate_unique_slug(model_instance, slugify_field_name, slug=None):
     """
     Generate a unique slug for a model instance, supporting non-Latin scripts.
-    
+
+    All existing ``slug`` / ``slug-N`` values are fetched in one query and the
+    next free suffix is picked, so the cost doesn't grow with the number of
+    collisions. Pair with save_with_unique_slug() to survive concurrent inserts.
+
     Args:
         model_instance: The model instance
         slugify_field_name: The field name to generate slug from
         slug: Optional custom slug to use instead of generating from field
-    
+
     Returns:
         str: A unique slug for the model instance
     """
@@ -81,20 +89,49 @@ def generate_unique_slug(model_instance, slugify_field_name, slug=None):
         # Transliterate non-Latin scripts to Latin characters
         transliterated_text = unidecode(original_text)
         slug = slugify(transliterated_text)
-        
+
         # If slug is still empty after transliteration, use a fallback
         if not slug:
             slug = f"item-{get_random_string(8).lower()}"
-    
-    unique_slug = slug
-    extension = 1
 
     ModelClass = model_instance.__class__
-    while ModelClass._default_manager.filter(slug=unique_slug).exists():
-        unique_slug = f"{slug}-{extension}"
-        extension += 1
+    # Leave room for a "-NNNNN" suffix within the column length.
+    max_length = ModelClass._meta.get_field('slug').max_length
+    slug = slug[:max_length - 6].rstrip('-')
 
-    return unique_slug
+    existing = set(
+        ModelClass._default_manager.filter(
+            Q(slug=slug) | Q(slug__startswith=f"{slug}-")
+        ).values_list('slug', flat=True)
+    )
+    if slug not in existing:
+        return slug
+
+    suffix = re.compile(rf"^{re.escape(slug)}-(\d+)$")
+    taken = [int(match.group(1)) for match in map(suffix.match, existing) if match]
+    return f"{slug}-{max(taken, default=0) + 1}"
+
+
+def save_with_unique_slug(model_instance, slugify_field_name, save, *args, **kwargs):
+    """
+    Call ``save`` (usually ``super().save``), first assigning a unique slug if
+    the instance has none. If a concurrent insert claims the same slug first,
+    the unique constraint fails and a fresh slug is tried.
+    """
+    if model_instance.slug:
+        return save(*args, **kwargs)
+
+    for attempt in range(SLUG_SAVE_ATTEMPTS):
+        model_instance.slug = generate_unique_slug(model_instance, slugify_field_name)
+        try:
+            with transaction.atomic():
+                return save(*args, **kwargs)
+        except IntegrityError:
+            taken = model_instance.__class__._default_manager.filter(
+                slug=model_instance.slug).exists()
+            if not taken or attempt == SLUG_SAVE_ATTEMPTS - 1:
+                raise
+            model_instance.slug = ''
 
 
 def validate_image_url(url):
@@ -1,11 +1,17 @@
+from asgiref.sync import sync_to_async
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+
+from .authentication import CachedUserJWTAuthentication
+from .batch import parse_batch, run_batch
 
 
 @csrf_exempt
 @require_http_methods(["GET"])
-def health_check(request):
+async def health_check(request):
     """
     Health check endpoint for Render
     """
@@ -13,4 +19,32 @@ def health_check(request):
         'status': 'healthy',
         'service': 'blog-backend',
         'timestamp': 'now'
-    })
\ No newline at end of file
+    })
+
+
+def _authenticate(request):
+    """The (user, token) of the request's JWT, decoded once for the whole batch."""
+    drf_request = Request(request, authenticators=[CachedUserJWTAuthentication()])
+    return drf_request.user, drf_request.auth
+
+
+@csrf_exempt
+@require_http_methods(["POST"])
+async def batch(request):
+    """
+    Run several read requests in one round trip:
+    ``{"requests": [{"id": "tags", "method": "GET", "path": "/api/tags/"}, ...]}``
+    returns ``{"responses": [{"id": "tags", "status": 200, "body": ...}, ...]}``
+    in request order. Sub-requests are authenticated as the batch's user.
+    """
+    try:
+        items = parse_batch(request.body)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+    try:
+        user, auth = await sync_to_async(_authenticate)(request)
+    except AuthenticationFailed as e:
+        return JsonResponse({'error': 'Authentication failed', 'details': e.detail},
+                            status=401)
+    responses = await run_batch(request, user, auth, items)
+    return JsonResponse({'responses': responses})
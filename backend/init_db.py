@@ -24,12 +24,21 @@ if __name__ == '__main__':
 
     # Remove existing database
     import pathlib
-    from blog_backend.settings import BASE_DIR
-
-    db_path = BASE_DIR / 'db.sqlite3'
-    if db_path.exists():
-        db_path.unlink()
-        print("Removed existing database")
+    from django.db import connection
+
+    if connection.vendor == 'sqlite':
+        db_path = pathlib.Path(connection.settings_dict['NAME'])
+        connection.close()
+        if db_path.exists():
+            db_path.unlink()
+            print("Removed existing database")
+        # Also drop the WAL-mode sidecar files, or a stale log would be
+        # replayed into the new database.
+        for suffix in ('-wal', '-shm'):
+            db_path.with_name(db_path.name + suffix).unlink(missing_ok=True)
+    elif connection.introspection.table_names():
+        execute_from_command_line(['manage.py', 'flush', '--no-input'])
+        print("Flushed existing database")
 
     # Run migrations
     print("Running migrations...")
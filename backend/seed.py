@@ -9,6 +9,7 @@ import django
 from datetime import datetime, timedelta
 from django.utils import timezone
 from django.core.management import call_command
+from django.db import connection
 import random
 
 # Django setup
@@ -68,11 +69,25 @@ class DatabaseSeeder:
     
     def reset_database(self):
         """Delete and recreate the database"""
+        if connection.vendor != 'sqlite':
+            # Server databases can't be deleted like a file; empty the tables instead.
+            print("\n[RESET] Flushing existing database...")
+            if connection.introspection.table_names():
+                call_command('flush', interactive=False)
+                print("✓ Database flushed")
+            return
+
         print("\n[RESET] Deleting existing database...")
-        db_path = os.path.join(os.path.dirname(__file__), 'db.sqlite3')
+        db_path = str(connection.settings_dict['NAME'])
+        connection.close()
         if os.path.exists(db_path):
             os.remove(db_path)
             print("✓ Database deleted")
+        # WAL mode keeps a write-ahead log and shared-memory index next to the
+        # file; a stale log left behind would be replayed into the new database.
+        for suffix in ('-wal', '-shm'):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
     
     def run_migrations(self):
         """Run Django migrations"""
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Subscriber
+from .models import Campaign, Subscriber
 
 
 @admin.register(Subscriber)
@@ -11,3 +11,14 @@ class SubscriberAdmin(admin.ModelAdmin):
     date_hierarchy = 'subscription_date'
     ordering = ('-subscription_date',)
     readonly_fields = ('confirmation_token',)
+
+
+@admin.register(Campaign)
+class CampaignAdmin(admin.ModelAdmin):
+    list_display = ('subject', 'status', 'sent_count', 'failed_count',
+                    'created_at', 'finished_at')
+    list_filter = ('status',)
+    search_fields = ('subject',)
+    ordering = ('-created_at',)
+    readonly_fields = ('last_subscriber_id', 'sent_count', 'failed_count',
+                       'created_at', 'finished_at')
@@ -0,0 +1,177 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from articles.models import Article
+from core.utils import log_action, log_exception
+from .models import Campaign, Subscriber
+
+# Rendered into the digest once and replaced with each subscriber's link at send time.
+UNSUBSCRIBE_PLACEHOLDER = '__UNSUBSCRIBE_URL__'
+
+
+def unsubscribe_url(token):
+    return f'{settings.SITE_URL}/api/subscribers/unsubscribe/{token}/'
+
+
+def create_digest_campaign(days=7, subject=None):
+    """
+    Render a digest of articles published since the last campaign (or the
+    last ``days`` days) and store it as a new campaign. Returns None when
+    there is nothing new to send.
+    """
+    since = timezone.now() - timedelta(days=days)
+    previous = Campaign.objects.filter(status='sent').order_by('-created_at').first()
+    if previous and previous.created_at > since:
+        since = previous.created_at
+
+    articles = list(
+        Article.objects.filter(status='published', publish_date__gt=since)
+        .select_related('author').order_by('-publish_date')[:20]
+    )
+    return create_articles_campaign(articles, subject)
+
+
+def create_articles_campaign(articles, subject=None):
+    """
+    Render a campaign announcing ``articles`` (newest first) and store it for
+    send_newsletter to deliver. Returns None for an empty list.
+    """
+    if not articles:
+        return None
+
+    context = {
+        'subject': subject or f'New on the blog: {articles[0].title}',
+        'articles': articles,
+        'site_url': settings.FRONTEND_URL,
+        'unsubscribe_url': UNSUBSCRIBE_PLACEHOLDER,
+    }
+    return Campaign.objects.create(
+        subject=context['subject'],
+        html_body=render_to_string('newsletter_digest.html', context),
+        text_body=render_to_string('newsletter_digest.txt', context),
+    )
+
+
+class RateLimiter:
+    """Space sends evenly so all connections together stay under ``rate`` per second."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0
+        self.next_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_at, now)
+            self.next_at = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _send_slice(campaign, subscribers, limiter):
+    """
+    Send to ``subscribers`` over one connection; returns the ids that
+    succeeded. A recipient the server refuses is skipped, but if the
+    backend can't be reached (or reconnected to) the error propagates, so
+    the chunk isn't checkpointed and a rerun retries it.
+    """
+    connection = get_connection(fail_silently=False)
+    sent_ids = []
+    connection.open()
+    try:
+        for subscriber_id, email, token in subscribers:
+            limiter.wait()
+            link = unsubscribe_url(token)
+            message = EmailMultiAlternatives(
+                campaign.subject,
+                campaign.text_body.replace(UNSUBSCRIBE_PLACEHOLDER, link),
+                settings.DEFAULT_FROM_EMAIL,
+                [email],
+                connection=connection,
+                headers={'List-Unsubscribe': f'<{link}>'},
+            )
+            message.attach_alternative(
+                campaign.html_body.replace(UNSUBSCRIBE_PLACEHOLDER, link), 'text/html')
+            try:
+                connection.send_messages([message])
+                sent_ids.append(subscriber_id)
+            except Exception as e:
+                log_exception(e, f'Error sending campaign {campaign.id} to subscriber {subscriber_id}')
+                # A failed SMTP exchange can leave the session unusable.
+                connection.close()
+                connection.open()
+    finally:
+        connection.close()
+    return sent_ids
+
+
+def send_campaign(campaign, chunk_size=500, connections=2, rate=0, progress=None):
+    """
+    Send ``campaign`` to every active subscriber after its checkpoint.
+
+    Subscribers are read in id-ordered chunks (keyset pagination, so each
+    query is an index range scan however far the run has got). Each chunk is
+    split across ``connections`` reused backend connections. When a chunk
+    finishes, its subscribers' ``last_email_sent`` and the campaign checkpoint
+    are written in one transaction, so a crashed run resumes after the last
+    completed chunk and re-sends at most one chunk. Recipients the server
+    refuses are counted as failed; if the backend itself can't be reached
+    the error is raised without checkpointing the chunk, leaving the
+    campaign in 'sending' for a rerun.
+    """
+    limiter = RateLimiter(rate)
+    subscribers = Subscriber.objects.filter(status='active').order_by('id')
+
+    with ThreadPoolExecutor(max_workers=connections) as pool:
+        while True:
+            chunk = list(
+                subscribers.filter(id__gt=campaign.last_subscriber_id)
+                .values_list('id', 'email', 'confirmation_token')[:chunk_size]
+            )
+            if not chunk:
+                break
+
+            slices = [part for part in (chunk[i::connections] for i in range(connections)) if part]
+            try:
+                sent_ids = [
+                    subscriber_id
+                    for ids in pool.map(lambda part: _send_slice(campaign, part, limiter), slices)
+                    for subscriber_id in ids
+                ]
+            except Exception as e:
+                log_exception(e, f'Campaign {campaign.id} stopped after subscriber '
+                                 f'{campaign.last_subscriber_id}')
+                raise
+            failed = len(chunk) - len(sent_ids)
+
+            with transaction.atomic():
+                Subscriber.objects.filter(id__in=sent_ids).update(
+                    last_email_sent=timezone.now())
+                Campaign.objects.filter(pk=campaign.pk).update(
+                    last_subscriber_id=chunk[-1][0],
+                    sent_count=F('sent_count') + len(sent_ids),
+                    failed_count=F('failed_count') + failed,
+                )
+            campaign.refresh_from_db(
+                fields=['last_subscriber_id', 'sent_count', 'failed_count'])
+            if progress:
+                progress(campaign)
+
+    campaign.status = 'sent'
+    campaign.finished_at = timezone.now()
+    campaign.save(update_fields=['status', 'finished_at'])
+    log_action('newsletter_sent', None,
+               f'Campaign ID: {campaign.id}, sent: {campaign.sent_count}, failed: {campaign.failed_count}')
+    return campaign
@@ -22,3 +22,31 @@ class Subscriber(models.Model):
 
     def __str__(self):
         return f'{self.email} - {self.status}'
+
+
+class Campaign(models.Model):
+    STATUS_CHOICES = [
+        ('sending', 'Sending'),
+        ('sent', 'Sent'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    # Rendered once; the unsubscribe link is substituted per subscriber.
+    html_body = models.TextField()
+    text_body = models.TextField()
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default='sending')
+    # Checkpoint: subscribers are sent in id order, so a resumed run
+    # continues after the last completed chunk.
+    last_subscriber_id = models.PositiveBigIntegerField(default=0)
+    sent_count = models.PositiveIntegerField(default=0)
+    failed_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'newsletter_campaigns'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f'{self.subject} - {self.status}'
@@ -0,0 +1,104 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.test import TestCase
+
+from subscribers import campaigns
+from subscribers.campaigns import UNSUBSCRIBE_PLACEHOLDER, send_campaign
+from subscribers.models import Campaign, Subscriber
+
+
+class RefusingBackend(EmailBackend):
+    """Refuses the given recipients, like an SMTP server rejecting RCPT TO."""
+    refused = set()
+
+    def send_messages(self, messages):
+        for message in messages:
+            if self.refused & set(message.to):
+                raise OSError('Recipient refused')
+        return super().send_messages(messages)
+
+
+class OutageBackend(EmailBackend):
+    """Connects ``opens_left`` times, then the server is unreachable."""
+    opens_left = 0
+
+    def open(self):
+        if OutageBackend.opens_left <= 0:
+            raise ConnectionRefusedError('Connection refused')
+        OutageBackend.opens_left -= 1
+
+
+class SendCampaignTests(TestCase):
+    def setUp(self):
+        RefusingBackend.refused = set()
+        OutageBackend.opens_left = 0
+        self.subscribers = [
+            Subscriber.objects.create(email=f'reader{i}@example.com') for i in range(5)]
+        Subscriber.objects.create(email='gone@example.com', status='unsubscribed')
+        self.campaign = Campaign.objects.create(
+            subject='Digest', html_body=f'<a href="{UNSUBSCRIBE_PLACEHOLDER}">Unsubscribe</a>',
+            text_body=f'Unsubscribe: {UNSUBSCRIBE_PLACEHOLDER}')
+
+    def send(self, backend, **kwargs):
+        with mock.patch.object(campaigns, 'get_connection', lambda **_kwargs: backend()):
+            return send_campaign(self.campaign, chunk_size=2, connections=1, **kwargs)
+
+    def recipients(self):
+        return sorted(address for message in mail.outbox for address in message.to)
+
+    def test_sends_to_active_subscribers(self):
+        campaign = self.send(EmailBackend)
+
+        self.assertEqual(self.recipients(), [f'reader{i}@example.com' for i in range(5)])
+        self.assertEqual(mail.outbox[0].extra_headers['List-Unsubscribe'],
+                         f'<{campaigns.unsubscribe_url(self.subscribers[0].confirmation_token)}>')
+        self.assertNotIn(UNSUBSCRIBE_PLACEHOLDER, mail.outbox[0].body)
+        self.assertEqual((campaign.status, campaign.sent_count, campaign.failed_count),
+                         ('sent', 5, 0))
+        self.assertEqual(campaign.last_subscriber_id, self.subscribers[-1].id)
+        self.assertFalse(Subscriber.objects.filter(status='active', last_email_sent=None).exists())
+
+    def test_refused_recipient_is_counted_and_skipped(self):
+        RefusingBackend.refused = {'reader1@example.com'}
+
+        campaign = self.send(RefusingBackend)
+
+        self.assertEqual(len(self.recipients()), 4)
+        self.assertEqual((campaign.status, campaign.sent_count, campaign.failed_count),
+                         ('sent', 4, 1))
+        self.assertIsNone(Subscriber.objects.get(email='reader1@example.com').last_email_sent)
+
+    def test_outage_stops_without_checkpointing_and_resumes(self):
+        # The first chunk goes out; the server is gone for the second.
+        OutageBackend.opens_left = 1
+
+        with self.assertRaises(ConnectionRefusedError):
+            self.send(OutageBackend)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual(self.campaign.status, 'sending')
+        self.assertEqual(self.campaign.last_subscriber_id, self.subscribers[1].id)
+        self.assertEqual(self.campaign.sent_count, 2)
+
+        mail.outbox.clear()
+        campaign = self.send(EmailBackend)
+
+        self.assertEqual(self.recipients(), [f'reader{i}@example.com' for i in range(2, 5)])
+        self.assertEqual((campaign.status, campaign.sent_count, campaign.failed_count),
+                         ('sent', 5, 0))
+
+    def test_failed_reconnect_stops_without_checkpointing(self):
+        class DropsAfterRefusal(RefusingBackend, OutageBackend):
+            pass
+
+        RefusingBackend.refused = {'reader0@example.com'}
+        OutageBackend.opens_left = 1
+
+        with self.assertRaises(ConnectionRefusedError):
+            self.send(DropsAfterRefusal)
+
+        self.campaign.refresh_from_db()
+        self.assertEqual((self.campaign.status, self.campaign.last_subscriber_id), ('sending', 0))
+        self.assertEqual(self.campaign.failed_count, 0)
@@ -4,7 +4,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 from .models import Subscriber
-from django.core.mail import send_mail
+from core.mail import queue_mail
 from django.conf import settings
 from django.http import HttpResponse
 import csv
@@ -29,16 +29,13 @@ class SubscribeView(APIView):
             name=name
         )
 
-        # Send confirmation email
-        if hasattr(settings, 'DEFAULT_FROM_EMAIL'):
-            confirmation_url = f"{settings.SITE_URL}/confirm/{subscriber.confirmation_token}"
-            send_mail(
-                'Confirm your subscription',
-                f'Click the following link to confirm your subscription: {confirmation_url}',
-                settings.DEFAULT_FROM_EMAIL,
-                [email],
-                fail_silently=True,
-            )
+        # Queue confirmation email, delivered by the send_queued_mail worker
+        confirmation_url = f"{settings.SITE_URL}/confirm/{subscriber.confirmation_token}"
+        queue_mail(
+            'Confirm your subscription',
+            [email],
+            body=f'Click the following link to confirm your subscription: {confirmation_url}',
+        )
 
         return Response({'status': 'success'}, status=status.HTTP_201_CREATED)
 
@@ -1,5 +1,5 @@
 from django.db import models
-from core.utils import generate_unique_slug
+from core.utils import save_with_unique_slug
 
 
 class Tag(models.Model):
@@ -8,9 +8,7 @@ class Tag(models.Model):
     description = models.TextField(blank=True)
 
     def save(self, *args, **kwargs):
-        if not self.slug:
-            self.slug = generate_unique_slug(self, 'name')
-        super().save(*args, **kwargs)
+        save_with_unique_slug(self, 'name', super().save, *args, **kwargs)
 
     class Meta:
         db_table = 'tags'
@@ -15,6 +15,7 @@ class StandardResultsSetPagination(PageNumberPagination):
 
 
 class TagListView(generics.ListCreateAPIView):
+    read_from_replica = True
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -37,6 +38,7 @@ class TagListView(generics.ListCreateAPIView):
 
 
 class TagDetailView(generics.RetrieveUpdateDestroyAPIView):
+    read_from_replica = True
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
@@ -74,6 +76,7 @@ class TagDetailView(generics.RetrieveUpdateDestroyAPIView):
 
 
 class TagBySlugView(generics.RetrieveAPIView):
+    read_from_replica = True
     queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [permissions.AllowAny]
@@ -93,6 +96,7 @@ class TagBySlugView(generics.RetrieveAPIView):
 
 
 class TagArticlesView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = ArticleSerializer
     permission_classes = [permissions.AllowAny]
     pagination_class = StandardResultsSetPagination
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User
+from .models import AuthorStats, User
 
 
 @admin.register(User)
@@ -17,3 +17,12 @@ class CustomUserAdmin(UserAdmin):
          'is_superuser', 'groups', 'user_permissions')}),
         ('Important dates', {'fields': ('last_login', 'date_joined')}),
     )
+
+
+@admin.register(AuthorStats)
+class AuthorStatsAdmin(admin.ModelAdmin):
+    list_display = ('user', 'published_count', 'article_count', 'total_views',
+                    'total_likes', 'last_published_at')
+    search_fields = ('user__email', 'user__name')
+    ordering = ('-published_count',)
+    readonly_fields = ('updated_at',)
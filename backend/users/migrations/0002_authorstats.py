@@ -0,0 +1,64 @@
+# Generated by Django 5.2 on 2026-10-19 01:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Q, Sum
+from django.db.models.functions import Coalesce
+
+
+def backfill_author_stats(apps, schema_editor):
+    Article = apps.get_model('articles', 'Article')
+    ArticleLike = apps.get_model('articles', 'ArticleLike')
+    AuthorStats = apps.get_model('users', 'AuthorStats')
+
+    likes = dict(
+        ArticleLike.objects.filter(is_like=True).order_by()
+        .values_list('article__author_id').annotate(total=Count('id'))
+    )
+    rows = [
+        AuthorStats(
+            user_id=row['author_id'],
+            article_count=row['article_count'],
+            published_count=row['published_count'],
+            total_views=row['total_views'],
+            total_likes=likes.get(row['author_id'], 0),
+            last_published_at=row['last_published_at'],
+        )
+        for row in Article.objects.order_by().values('author_id').annotate(
+            article_count=Count('id'),
+            published_count=Count('id', filter=Q(status='published')),
+            total_views=Coalesce(Sum('views'), 0),
+            last_published_at=Max('publish_date', filter=Q(status='published')),
+        )
+    ]
+    AuthorStats.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('articles', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthorStats',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('article_count', models.PositiveIntegerField(default=0)),
+                ('published_count', models.PositiveIntegerField(default=0)),
+                ('total_views', models.PositiveBigIntegerField(default=0)),
+                ('total_likes', models.PositiveIntegerField(default=0)),
+                ('last_published_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'db_table': 'author_stats',
+                'ordering': ['-published_count'],
+                'indexes': [models.Index(fields=['-published_count'], name='author_stats_published_idx'), models.Index(fields=['-total_views'], name='author_stats_views_idx'), models.Index(fields=['-last_published_at'], name='author_stats_last_pub_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_author_stats, migrations.RunPython.noop),
+    ]
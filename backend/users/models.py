@@ -1,5 +1,9 @@
+from django.apps import apps
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.core.cache import cache
 from django.db import models
+from django.db.models import Count, F, Max, Q, Sum
+from django.db.models.functions import Coalesce, Greatest
 from django.utils import timezone
 from django.core.validators import validate_email
 from core.utils import compress_image
@@ -10,6 +14,11 @@ def user_avatar_path(instance, filename):
     return f'users/{instance.id}/{filename}'
 
 
+def auth_cache_key(user_id):
+    """Cache key of the user row cached by core.authentication."""
+    return f'auth_user_{user_id}'
+
+
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
         if not email:
@@ -57,7 +66,11 @@ class User(AbstractUser):
         return self.email
 
     def save(self, *args, **kwargs):
-        if self.pk and self.avatar:
+        update_fields = kwargs.get('update_fields')
+        # Narrow saves such as last_login on login or a password hash upgrade
+        # skip the avatar lookup and recompression.
+        avatar_changed = update_fields is None or 'avatar' in update_fields
+        if self.pk and self.avatar and avatar_changed:
             try:
                 old_avatar = User.objects.get(pk=self.pk).avatar
                 if old_avatar and old_avatar != self.avatar:
@@ -72,6 +85,9 @@ class User(AbstractUser):
                 pass
 
         super().save(*args, **kwargs)
+        # Any change, e.g. a ban or role change from the admin API, must be
+        # visible to the next authenticated request.
+        cache.delete(auth_cache_key(self.pk))
 
     def delete(self, *args, **kwargs):
         if self.avatar:
@@ -80,12 +96,116 @@ class User(AbstractUser):
                     os.remove(self.avatar.path)
             except (ValueError, FileNotFoundError):
                 pass
+        cache.delete(auth_cache_key(self.pk))
         super().delete(*args, **kwargs)
 
     @property
     def published_articles_count(self):
+        stats = getattr(self, 'stats', None)
+        if stats is not None:
+            return stats.published_count
         return self.articles.filter(status='published').count()
 
     @property
     def total_article_views(self):
-        return sum(article.views for article in self.articles.all())
+        stats = getattr(self, 'stats', None)
+        if stats is not None:
+            return stats.total_views
+        return self.articles.aggregate(total=Coalesce(Sum('views'), 0))['total']
+
+
+class AuthorStats(models.Model):
+    """
+    Denormalized per-author totals so author listings don't aggregate over
+    every article on each request. Kept current by Article and ArticleLike,
+    and for views by event compaction (articles.analytics); bulk writes that
+    bypass them are reconciled by rebuild_author_stats.
+    """
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    article_count = models.PositiveIntegerField(default=0)
+    published_count = models.PositiveIntegerField(default=0)
+    total_views = models.PositiveBigIntegerField(default=0)
+    total_likes = models.PositiveIntegerField(default=0)
+    last_published_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'author_stats'
+        ordering = ['-published_count']
+        indexes = [
+            models.Index(fields=['-published_count'], name='author_stats_published_idx'),
+            models.Index(fields=['-total_views'], name='author_stats_views_idx'),
+            models.Index(fields=['-last_published_at'], name='author_stats_last_pub_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.user} - {self.published_count} published'
+
+    @staticmethod
+    def compute(user_ids=None):
+        """
+        Aggregate totals from articles and likes, keyed by author id.
+        Views still in the event buffer are left out of total_views:
+        compaction adds them when it consumes the events.
+        """
+        Article = apps.get_model('articles', 'Article')
+        ArticleEvent = apps.get_model('articles', 'ArticleEvent')
+        ArticleLike = apps.get_model('articles', 'ArticleLike')
+        articles = Article.objects.all()
+        likes = ArticleLike.objects.filter(is_like=True)
+        pending_views = ArticleEvent.objects.filter(kind='view')
+        if user_ids is not None:
+            articles = articles.filter(author_id__in=user_ids)
+            likes = likes.filter(article__author_id__in=user_ids)
+            pending_views = pending_views.filter(article__author_id__in=user_ids)
+
+        totals = {
+            row.pop('author_id'): row
+            for row in articles.order_by().values('author_id').annotate(
+                article_count=Count('id'),
+                published_count=Count('id', filter=Q(status='published')),
+                total_views=Coalesce(Sum('views'), 0),
+                last_published_at=Max('publish_date', filter=Q(status='published')),
+            )
+        }
+        for row in likes.order_by().values('article__author_id').annotate(total=Count('id')):
+            if row['article__author_id'] in totals:
+                totals[row['article__author_id']]['total_likes'] = row['total']
+        for row in pending_views.order_by().values('article__author_id').annotate(
+                total=Count('id')):
+            if row['article__author_id'] in totals:
+                row_totals = totals[row['article__author_id']]
+                row_totals['total_views'] = max(row_totals['total_views'] - row['total'], 0)
+        return totals
+
+    @classmethod
+    def refresh(cls, *user_ids):
+        """Recompute the given authors' rows; used when articles change status or owner."""
+        if not user_ids:
+            return
+        totals = cls.compute(user_ids)
+        empty = {'article_count': 0, 'published_count': 0, 'total_views': 0,
+                 'total_likes': 0, 'last_published_at': None}
+        # One upsert for any number of authors (bulk moderation touches many).
+        cls.objects.bulk_create(
+            [cls(user_id=user_id, **{**empty, **totals.get(user_id, {})})
+             for user_id in set(user_ids)],
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=[*empty, 'updated_at'],
+        )
+
+    @classmethod
+    def add(cls, user_id, **deltas):
+        """
+        Apply counter deltas, e.g. ``add(author_id, total_views=1)``.
+        Decrements stop at zero, since a row that drifted from bulk writes
+        would otherwise violate the unsigned column.
+        """
+        updated = cls.objects.filter(user_id=user_id).update(
+            **{field: F(field) + delta if delta >= 0 else Greatest(F(field) + delta, 0)
+               for field, delta in deltas.items()})
+        if not updated:
+            cls.refresh(user_id)
@@ -90,25 +90,34 @@ class BasicUserSerializer(serializers.ModelSerializer):
 
 class AuthorListSerializer(serializers.ModelSerializer):
     article_count = serializers.IntegerField(read_only=True)
+    total_views = serializers.IntegerField(read_only=True)
+    total_likes = serializers.IntegerField(read_only=True)
+    last_published_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
         model = User
-        fields = ['id', 'name', 'email', 'avatar',
-                  'bio', 'role', 'article_count']
+        fields = ['id', 'name', 'email', 'avatar', 'bio', 'role', 'article_count',
+                  'total_views', 'total_likes', 'last_published_at']
 
 
 class AuthorDetailSerializer(serializers.ModelSerializer):
     articles = serializers.SerializerMethodField()
     article_count = serializers.IntegerField(read_only=True)
+    total_views = serializers.IntegerField(read_only=True)
+    total_likes = serializers.IntegerField(read_only=True)
+    last_published_at = serializers.DateTimeField(read_only=True)
 
     class Meta:
         model = User
-        fields = ['id', 'name', 'email', 'avatar', 'bio',
-                  'role', 'join_date', 'article_count', 'articles']
+        fields = ['id', 'name', 'email', 'avatar', 'bio', 'role', 'join_date',
+                  'article_count', 'total_views', 'total_likes', 'last_published_at',
+                  'articles']
 
     def get_articles(self, obj):
-        # Only include published articles and use basic fields to avoid circular imports
-        articles = obj.articles.filter(status='published')
+        # The view passes one page of published articles; use basic fields to avoid circular imports
+        articles = self.context.get('articles')
+        if articles is None:
+            articles = obj.articles.filter(status='published')[:10]
         return [{
             'id': article.id,
             'title': article.title,
@@ -0,0 +1,21 @@
+from django.test import TestCase
+
+from users.models import AuthorStats, User
+
+
+class AuthorStatsAddTests(TestCase):
+    def setUp(self):
+        self.author = User.objects.create(email='author@example.com', name='Author')
+        AuthorStats.refresh(self.author.pk)
+
+    def test_add_applies_deltas(self):
+        AuthorStats.add(self.author.pk, total_views=3, total_likes=2)
+
+        stats = AuthorStats.objects.get(pk=self.author.pk)
+        self.assertEqual((stats.total_views, stats.total_likes), (3, 2))
+
+    def test_decrement_stops_at_zero(self):
+        # e.g. an unlike on a row that was rebuilt without the like.
+        AuthorStats.add(self.author.pk, total_likes=-1)
+
+        self.assertEqual(AuthorStats.objects.get(pk=self.author.pk).total_likes, 0)
@@ -1,5 +1,3 @@
-from django.utils.html import strip_tags
-from django.template.loader import render_to_string
 from django.shortcuts import render
 from rest_framework import generics, permissions, status, serializers
 from rest_framework.response import Response
@@ -9,12 +7,13 @@ from django.utils import timezone
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from .serializers import UserSerializer, ChangePasswordSerializer, BasicUserSerializer, AuthorListSerializer, AuthorDetailSerializer
-from django.core.mail import send_mail
+from core.mail import queue_mail
 from django.conf import settings
 import uuid
 from django.core.cache import cache
 from core.utils import log_action, log_exception, rate_limit_decorator
-from django.db.models import Count, Q
+from django.db.models import F
+from django.db.models.functions import Coalesce
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.exceptions import AuthenticationFailed
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -43,39 +42,31 @@ class CustomTokenObtainPairView(TokenObtainPairView):
     serializer_class = CustomTokenObtainPairSerializer
 
     def post(self, request, *args, **kwargs):
+        # The serializer authenticates once and, with UPDATE_LAST_LOGIN, writes
+        # last_login once; its user object is reused rather than fetched again.
+        # Outdated password hashes are re-encoded by check_password() in the
+        # same authentication step.
+        serializer = self.get_serializer(data=request.data)
         try:
-            response = super().post(request, *args, **kwargs)
-
-            if response.status_code == 200:
-                user = User.objects.get(email=request.data['email'])
-                user.last_login = timezone.now()
-                user.save(update_fields=['last_login'])
-
-                serializer = UserSerializer(user)
-                response.data['user'] = serializer.data
-                response.data['user'][
-                    'avatar'] = f"http://localhost:8000{user.avatar.url}" if user.avatar else None
-
-                log_action('user_login', user, f'User ID: {user.id}')
+            serializer.is_valid(raise_exception=True)
+        except AuthenticationFailed:
+            return Response(
+                {"detail": "Invalid email or password. Please check your credentials."},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+        except Exception:
+            return Response(
+                {"detail": "Authentication failed. Please try again."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            return response
+        user = serializer.user
+        data = dict(serializer.validated_data)
+        data['user'] = UserSerializer(user).data
+        data['user']['avatar'] = f"http://localhost:8000{user.avatar.url}" if user.avatar else None
 
-        except Exception as e:
-            if isinstance(e, AuthenticationFailed):
-                return Response(
-                    {"detail": "Invalid email or password. Please check your credentials."},
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            elif isinstance(e, User.DoesNotExist):
-                return Response(
-                    {"detail": "No account found with this email address."},
-                    status=status.HTTP_401_UNAUTHORIZED
-                )
-            else:
-                return Response(
-                    {"detail": "Authentication failed. Please try again."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+        log_action('user_login', user, f'User ID: {user.id}')
+        return Response(data, status=status.HTTP_200_OK)
 
 
 class RegisterView(generics.CreateAPIView):
@@ -217,23 +208,15 @@ class RequestPasswordResetView(APIView):
 
                 reset_url = f"http://localhost:8080/reset-password?token={token}&email={email}"
 
-                context = {
-                    'reset_url': reset_url,
-                    'user': user,
-                    'expires_in': '1 hour'
-                }
-
-                html_message = render_to_string(
-                    'password_reset_template.html', context)
-                plain_message = strip_tags(html_message)
-
-                send_mail(
+                # Rendered and sent by the send_queued_mail worker
+                queue_mail(
                     'Reset Your Password',
-                    plain_message,
-                    settings.DEFAULT_FROM_EMAIL,
                     [email],
-                    html_message=html_message,
-                    fail_silently=True,
+                    template_name='password_reset_template.html',
+                    context={
+                        'reset_url': reset_url,
+                        'expires_in': '1 hour'
+                    },
                 )
 
                 user_tokens = cache.get(f'user_reset_tokens_{user.id}', [])
@@ -329,17 +312,50 @@ class UserListAPIView(generics.ListAPIView):
         return User.objects.filter(is_active=True).only('id', 'username', 'email')
 
 
+def with_author_stats(queryset):
+    """Attach the denormalized AuthorStats totals (one LEFT JOIN on its primary key)."""
+    return queryset.annotate(
+        article_count=Coalesce('stats__published_count', 0),
+        total_views=Coalesce('stats__total_views', 0),
+        total_likes=Coalesce('stats__total_likes', 0),
+        last_published_at=F('stats__last_published_at'),
+    )
+
+
 class AuthorListView(generics.ListAPIView):
+    read_from_replica = True
     serializer_class = AuthorListSerializer
-    queryset = User.objects.annotate(
-        article_count=Count('articles', filter=Q(articles__status='published'))
-    ).filter(articles__isnull=False).distinct()
+    queryset = with_author_stats(User.objects.filter(stats__article_count__gt=0))
     pagination_class = PageNumberPagination
 
 
+class AuthorArticlesPagination(PageNumberPagination):
+    page_size = 10
+    page_query_param = 'articles_page'
+
+
 class AuthorDetailView(generics.RetrieveAPIView):
+    read_from_replica = True
     serializer_class = AuthorDetailSerializer
     lookup_field = 'id'
-    queryset = User.objects.annotate(
-        article_count=Count('articles', filter=Q(articles__status='published'))
-    ).prefetch_related('articles')
+    queryset = with_author_stats(User.objects.all())
+
+    def retrieve(self, request, *args, **kwargs):
+        author = self.get_object()
+        paginator = AuthorArticlesPagination()
+        articles = paginator.paginate_queryset(
+            author.articles.filter(status='published').only(
+                'id', 'author', 'title', 'slug', 'excerpt', 'featured_image',
+                'publish_date', 'views', 'reading_time'
+            ).order_by('-publish_date', '-created_at'),
+            request, view=self)
+
+        context = self.get_serializer_context()
+        context['articles'] = articles
+        data = self.get_serializer(author, context=context).data
+        data['articles_pagination'] = {
+            'count': paginator.page.paginator.count,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
+        }
+        return Response(data)